@@ -0,0 +1,87 @@
+import argparse
+import json
+import sys
+
+from benchmarks.generators import sizes
+from benchmarks.runner import get_cases, run_benchmarks
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Times the turf functions on seeded synthetic datasets.",
+    )
+    parser.add_argument(
+        "cases", nargs="*", help="cases to run (default: all), see --list"
+    )
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    parser.add_argument(
+        "--fixtures",
+        action="store_true",
+        help="also run the cases over the test fixtures of the modules",
+    )
+    parser.add_argument(
+        "--size",
+        choices=sorted(sizes),
+        default="medium",
+        help="dataset size preset (default: medium)",
+    )
+    parser.add_argument("--vertices", type=int, help="vertices of lines and polygons")
+    parser.add_argument("--features", type=int, help="features of the collections")
+    parser.add_argument("--holes", type=int, help="holes of the polygons")
+    parser.add_argument("--seed", type=int, default=0, help="dataset seed (default: 0)")
+    parser.add_argument(
+        "--repeats", type=int, default=5, help="timed repeats per case (default: 5)"
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.1,
+        help="minimum duration of a repeat, in seconds (default: 0.1)",
+    )
+    parser.add_argument(
+        "-o", "--output", help="file the JSON report is written to (default: stdout)"
+    )
+
+    args = parser.parse_args(argv)
+
+    cases = get_cases(args.fixtures)
+
+    if args.list:
+        print("\n".join(sorted(cases)))
+        return 0
+
+    unknown = [name for name in args.cases if name not in cases]
+
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(unknown)}")
+
+    size = dict(sizes[args.size])
+
+    for key in size:
+        if getattr(args, key) is not None:
+            size[key] = getattr(args, key)
+
+    report = run_benchmarks(
+        names=args.cases,
+        seed=args.seed,
+        repeats=args.repeats,
+        min_time=args.min_time,
+        fixtures=args.fixtures,
+        log=lambda message: print(message, file=sys.stderr),
+        **size,
+    )
+    report["params"]["size"] = args.size
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
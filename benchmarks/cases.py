@@ -0,0 +1,323 @@
+import io
+import subprocess
+import sys
+from typing import Callable, Dict
+
+import turf
+from turf.circle import circle
+from turf.io import write_geojson_seq
+from turf.parallel import map_features
+
+# benchmark cases: name -> setup, the setup taking the dataset of `make_dataset` and
+# returning the function to time, called without arguments
+cases = {}
+
+
+def case(name: str) -> Callable:
+    """
+    Registers a benchmark case.
+
+    :param name: case name, usually the name of the benchmarked function
+    :return: decorator of the setup function
+    """
+
+    def register(setup: Callable) -> Callable:
+        cases[name] = setup
+        return setup
+
+    return register
+
+
+def first_point(data: Dict) -> Dict:
+    return data["points"]["features"][0]
+
+
+def last_point(data: Dict) -> Dict:
+    return data["points"]["features"][-1]
+
+
+# measurement
+
+
+@case("along")
+def along_case(data):
+    return lambda: turf.along(data["line"], 50)
+
+
+@case("area")
+def area_case(data):
+    return lambda: turf.area(data["polygons"])
+
+
+@case("bbox")
+def bbox_case(data):
+    return lambda: turf.bbox(data["polygons"], {"recompute": True})
+
+
+@case("bbox_polygon")
+def bbox_polygon_case(data):
+    return lambda: turf.bbox_polygon(data["bbox"])
+
+
+@case("bearing")
+def bearing_case(data):
+    return lambda: turf.bearing(first_point(data), last_point(data))
+
+
+@case("center")
+def center_case(data):
+    return lambda: turf.center(data["points"])
+
+
+@case("centroid")
+def centroid_case(data):
+    return lambda: turf.centroid(data["polygon"])
+
+
+@case("circle")
+def circle_case(data):
+    return lambda: circle(data["center"], 100, {"steps": 64})
+
+
+@case("destination")
+def destination_case(data):
+    return lambda: turf.destination(first_point(data), 100, 45)
+
+
+@case("distance")
+def distance_case(data):
+    return lambda: turf.distance(first_point(data), last_point(data))
+
+
+@case("distance_many")
+def distance_many_case(data):
+    starts = [pt["geometry"]["coordinates"] for pt in data["points"]["features"]]
+    ends = starts[::-1]
+
+    return lambda: turf.distance_many(starts, ends)
+
+
+@case("distance_matrix")
+def distance_matrix_case(data):
+    points = turf.feature_collection(data["points"]["features"][:200])
+
+    return lambda: turf.distance_matrix(points, points)
+
+
+@case("envelope")
+def envelope_case(data):
+    return lambda: turf.envelope(data["points"])
+
+
+@case("great_circle")
+def great_circle_case(data):
+    return lambda: turf.great_circle(first_point(data), last_point(data))
+
+
+@case("length")
+def length_case(data):
+    return lambda: turf.length(data["lines"])
+
+
+@case("midpoint")
+def midpoint_case(data):
+    return lambda: turf.midpoint(first_point(data), last_point(data))
+
+
+@case("point_on_feature")
+def point_on_feature_case(data):
+    return lambda: turf.point_on_feature(data["polygon"])
+
+
+@case("point_to_line_distance")
+def point_to_line_distance_case(data):
+    return lambda: turf.point_to_line_distance(first_point(data), data["line"])
+
+
+@case("polygon_tangents")
+def polygon_tangents_case(data):
+    return lambda: turf.polygon_tangents(
+        data["center"], data["polygons"]["features"][0]
+    )
+
+
+@case("rhumb_bearing")
+def rhumb_bearing_case(data):
+    return lambda: turf.rhumb_bearing(first_point(data), last_point(data))
+
+
+@case("rhumb_destination")
+def rhumb_destination_case(data):
+    options = {"distance": 100, "bearing": 45}
+
+    return lambda: turf.rhumb_destination(first_point(data), options)
+
+
+@case("rhumb_distance")
+def rhumb_distance_case(data):
+    return lambda: turf.rhumb_distance(first_point(data), last_point(data))
+
+
+@case("square")
+def square_case(data):
+    return lambda: turf.square(data["bbox"])
+
+
+# booleans
+
+
+@case("boolean_disjoint")
+def boolean_disjoint_case(data):
+    return lambda: turf.boolean_disjoint(data["line"], data["polygon"])
+
+
+@case("boolean_intersects")
+def boolean_intersects_case(data):
+    return lambda: turf.boolean_intersects(data["line"], data["polygon"])
+
+
+@case("boolean_point_in_polygon")
+def boolean_point_in_polygon_case(data):
+    polygon = data["polygon"]
+    points = data["points"]["features"]
+
+    return lambda: [turf.boolean_point_in_polygon(pt, polygon) for pt in points]
+
+
+@case("boolean_point_on_line")
+def boolean_point_on_line_case(data):
+    line = data["line"]
+    vertex = turf.point(line["geometry"]["coordinates"][-2])
+
+    return lambda: turf.boolean_point_on_line(vertex, line)
+
+
+@case("boolean_within")
+def boolean_within_case(data):
+    return lambda: turf.boolean_within(data["polygons"]["features"][0], data["polygon"])
+
+
+@case("points_in_polygon")
+def points_in_polygon_case(data):
+    return lambda: turf.points_in_polygon(data["points"], data["polygon"])
+
+
+# misc and joins
+
+
+@case("explode")
+def explode_case(data):
+    return lambda: turf.explode(data["polygons"])
+
+
+@case("kinks")
+def kinks_case(data):
+    return lambda: turf.kinks(data["line"])
+
+
+@case("line_intersect")
+def line_intersect_case(data):
+    first, second = data["lines"]["features"]
+
+    return lambda: turf.line_intersect(first, second)
+
+
+@case("nearest_point")
+def nearest_point_case(data):
+    return lambda: turf.nearest_point(data["center"], data["points"])
+
+
+@case("points_within_polygons")
+def points_within_polygons_case(data):
+    return lambda: turf.points_within_polygons(data["points"], data["polygons"])
+
+
+@case("polygon_to_line")
+def polygon_to_line_case(data):
+    return lambda: turf.polygon_to_line(data["polygon"])
+
+
+# grids and aggregation
+
+
+@case("hex_grid")
+def hex_grid_case(data):
+    return lambda: turf.hex_grid(data["bbox"], 50, {"units": "kilometers"})
+
+
+@case("hex_grid_mask")
+def hex_grid_mask_case(data):
+    # outer ring only, boolean_intersects does not handle masks with holes
+    mask = turf.polygon(data["polygon"]["geometry"]["coordinates"][:1])
+    options = {"units": "kilometers", "mask": mask}
+
+    return lambda: turf.hex_grid(data["bbox"], 50, options)
+
+
+@case("point_grid")
+def point_grid_case(data):
+    return lambda: turf.point_grid(data["bbox"], 50, {"units": "kilometers"})
+
+
+@case("rectangle_grid")
+def rectangle_grid_case(data):
+    return lambda: turf.rectangle_grid(data["bbox"], 50, 25, {"units": "kilometers"})
+
+
+@case("square_grid")
+def square_grid_case(data):
+    return lambda: turf.square_grid(data["bbox"], 50, {"units": "kilometers"})
+
+
+@case("triangle_grid")
+def triangle_grid_case(data):
+    return lambda: turf.triangle_grid(data["bbox"], 50, {"units": "kilometers"})
+
+
+@case("bin_points")
+def bin_points_case(data):
+    spec = turf.HexGridSpec(data["bbox"], 50, {"units": "kilometers"})
+    options = {"aggregations": ["count", "mean:value"]}
+
+    return lambda: turf.bin_points(data["points"], spec, options)
+
+
+# helpers and io
+
+
+@case("feature_collection")
+def feature_collection_case(data):
+    features = data["points"]["features"]
+
+    return lambda: turf.feature_collection(features, as_geojson=False)
+
+
+@case("write_geojson_seq")
+def write_geojson_seq_case(data):
+    return lambda: write_geojson_seq(data["points"]["features"], io.StringIO())
+
+
+@case("map_features")
+def map_features_case(data):
+    options = {"workers": 1, "args": (data["polygon"],)}
+
+    return lambda: map_features(turf.boolean_point_in_polygon, data["points"], options)
+
+
+# import time, in a fresh interpreter
+
+
+def import_case(statement: str) -> Callable:
+    def setup(data):
+        command = [sys.executable, "-c", statement]
+
+        return lambda: subprocess.run(command, check=True)
+
+    return setup
+
+
+case("import_python")(import_case("pass"))
+case("import_turf")(import_case("import turf"))
+case("import_distance")(import_case("from turf import distance"))
+case("import_line_intersect")(import_case("from turf import line_intersect"))
+case("import_all")(import_case("from turf import *"))
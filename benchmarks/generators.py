@@ -0,0 +1,161 @@
+import math
+import random
+from typing import Dict, List, Sequence
+
+from turf.helpers import feature_collection, line_string, point, polygon
+
+# size presets: number of vertices of the lines and polygons, number of features of the
+# collections, and number of holes of the polygons
+sizes = {
+    "small": {"vertices": 16, "features": 100, "holes": 0},
+    "medium": {"vertices": 256, "features": 1000, "holes": 2},
+    "large": {"vertices": 4096, "features": 10000, "holes": 8},
+}
+
+
+def random_position(rng: random.Random, bbox: Sequence) -> List[float]:
+    """
+    :param rng: seeded random generator
+    :param bbox: extent in [minX, minY, maxX, maxY] order
+    :return: random [lng, lat] position inside the extent
+    """
+    return [rng.uniform(bbox[0], bbox[2]), rng.uniform(bbox[1], bbox[3])]
+
+
+def random_ring(
+    rng: random.Random,
+    center: Sequence,
+    radius: float,
+    vertices: int,
+    clockwise: bool = False,
+) -> List[List[float]]:
+    """
+    Star shaped ring, whose vertices are at a random distance between half the radius and
+    the radius from the center, so that it never self-intersects.
+
+    :param rng: seeded random generator
+    :param center: [lng, lat] center of the ring
+    :param radius: maximum distance of the vertices from the center, in degrees
+    :param vertices: number of vertices, at least 3
+    :param clockwise: True for a clockwise ring (e.g. a hole)
+    :return: closed ring coordinates
+    """
+    vertices = max(vertices, 3)
+    ring = []
+
+    for i in range(vertices):
+        angle = 2 * math.pi * (i + rng.random() * 0.5) / vertices
+        distance = radius * rng.uniform(0.5, 1)
+
+        ring.append(
+            [
+                center[0] + distance * math.cos(angle),
+                center[1] + distance * math.sin(angle),
+            ]
+        )
+
+    if clockwise:
+        ring.reverse()
+
+    ring.append(list(ring[0]))
+
+    return ring
+
+
+def random_polygon(
+    rng: random.Random, center: Sequence, radius: float, vertices: int, holes: int
+) -> Dict:
+    """
+    :param rng: seeded random generator
+    :param center: [lng, lat] center of the polygon
+    :param radius: maximum distance of the vertices from the center, in degrees
+    :param vertices: number of vertices of the outer ring
+    :param holes: number of holes, laid out around the center inside the outer ring
+    :return: Polygon Feature
+    """
+    rings = [random_ring(rng, center, radius, vertices)]
+
+    for i in range(holes):
+        angle = 2 * math.pi * i / holes
+        hole_center = [
+            center[0] + radius * 0.25 * math.cos(angle),
+            center[1] + radius * 0.25 * math.sin(angle),
+        ]
+        hole_radius = radius * min(0.2, 0.7 * math.sin(math.pi / max(holes, 2)) / 4)
+
+        rings.append(
+            random_ring(
+                rng, hole_center, hole_radius, max(vertices // 8, 3), clockwise=True
+            )
+        )
+
+    return polygon(rings)
+
+
+def random_line(
+    rng: random.Random, start: Sequence, step: float, vertices: int
+) -> Dict:
+    """
+    :param rng: seeded random generator
+    :param start: [lng, lat] first position of the line
+    :param step: maximum length of each segment along each axis, in degrees
+    :param vertices: number of vertices, at least 2
+    :return: random walk LineString Feature
+    """
+    coords = [list(start)]
+
+    for _ in range(max(vertices, 2) - 1):
+        last = coords[-1]
+        coords.append(
+            [last[0] + rng.uniform(-step, step), last[1] + rng.uniform(-step, step)]
+        )
+
+    return line_string(coords)
+
+
+def make_dataset(
+    seed: int = 0, vertices: int = 256, features: int = 1000, holes: int = 2
+) -> Dict:
+    """
+    Builds the synthetic inputs of the benchmark cases. The same seed and sizes always
+    give the same dataset.
+
+    :param seed: seed of the random generator
+    :param vertices: number of vertices of the lines and polygons
+    :param features: number of features of the collections
+    :param holes: number of holes of the polygons
+    :return: dictionary of inputs
+    """
+    rng = random.Random(seed)
+    bbox = [-10.0, 40.0, 10.0, 55.0]
+    center = [(bbox[0] + bbox[2]) / 2, (bbox[1] + bbox[3]) / 2]
+
+    points = feature_collection(
+        [
+            point(random_position(rng, bbox), {"value": rng.random()})
+            for _ in range(features)
+        ]
+    )
+
+    polygons = feature_collection(
+        [
+            random_polygon(rng, random_position(rng, bbox), 1.0, vertices, holes)
+            for _ in range(max(features // 100, 1))
+        ]
+    )
+
+    return {
+        "seed": seed,
+        "bbox": bbox,
+        "center": point(center),
+        "points": points,
+        "polygon": random_polygon(rng, center, 6.0, vertices, holes),
+        "polygons": polygons,
+        "line": random_line(rng, center, 0.5, vertices),
+        "lines": feature_collection(
+            [
+                random_line(rng, random_position(rng, bbox), 0.5, vertices)
+                for _ in range(2)
+            ]
+        ),
+    }
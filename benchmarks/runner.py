@@ -0,0 +1,156 @@
+import gc
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from benchmarks.cases import cases
+from benchmarks.generators import make_dataset
+from turf.bench import fixture_cases
+from turf.version import __version__
+
+
+def get_cases(fixtures: bool = False) -> Dict[str, Callable]:
+    """
+    :param fixtures: True to include the cases over the test fixtures of the modules
+    :return: case name -> setup
+    """
+    if not fixtures:
+        return dict(cases)
+
+    return {**cases, **fixture_cases()}
+
+
+def calibrate(func: Callable, min_time: float) -> int:
+    """
+    :param func: function to time
+    :param min_time: minimum duration of a repeat, in seconds
+    :return: number of calls per repeat, so that a repeat lasts at least min_time
+    """
+    number = 1
+
+    while True:
+        start = time.perf_counter()
+
+        for _ in range(number):
+            func()
+
+        elapsed = time.perf_counter() - start
+
+        if elapsed >= min_time:
+            return number
+
+        # aim slightly above min_time, growing at most 10 times per step
+        number = int(number * min(10, max(2, 1.2 * min_time / max(elapsed, 1e-9))))
+
+
+def time_function(func: Callable, repeats: int, min_time: float) -> Dict:
+    """
+    :param func: function to time, called without arguments
+    :param repeats: number of timed repeats
+    :param min_time: minimum duration of each repeat, in seconds
+    :return: number of calls per repeat, and the ops/sec of each repeat
+    """
+    number = calibrate(func, min_time)
+    samples = []
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter()
+
+            for _ in range(number):
+                func()
+
+            samples.append(number / (time.perf_counter() - start))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return {"number": number, "samples": samples}
+
+
+def peak_memory(func: Callable) -> int:
+    """
+    :param func: function called without arguments
+    :return: peak of the memory allocated during a single call, in bytes
+    """
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmarks(
+    names: List[str] = None,
+    seed: int = 0,
+    vertices: int = 256,
+    features: int = 1000,
+    holes: int = 2,
+    repeats: int = 5,
+    min_time: float = 0.1,
+    fixtures: bool = False,
+    log: Callable = None,
+) -> Dict:
+    """
+    Runs the benchmark cases on a synthetic dataset.
+
+    :param names: names of the cases to run, all of them by default
+    :param seed: seed of the dataset generator
+    :param vertices: number of vertices of the lines and polygons
+    :param features: number of features of the collections
+    :param holes: number of holes of the polygons
+    :param repeats: number of timed repeats of each case
+    :param min_time: minimum duration of each repeat, in seconds
+    :param fixtures: True to also run the cases over the test fixtures of the modules
+        (see `turf.bench.fixture_cases`)
+    :param log: optional function called with a progress message after each case
+    :return: JSON serializable report, with the environment, the dataset parameters and
+        for each case its ops/sec (mean, standard deviation, and every repeat) and the
+        peak memory of a single call
+    """
+    registry = get_cases(fixtures)
+    dataset = make_dataset(seed, vertices, features, holes)
+    results = {}
+
+    for name in names or sorted(registry):
+        func = registry[name](dataset)
+        timing = time_function(func, repeats, min_time)
+        samples = timing["samples"]
+
+        results[name] = {
+            "ops_per_sec": statistics.mean(samples),
+            "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+            "repeats": repeats,
+            "number": timing["number"],
+            "samples": samples,
+            "peak_memory": peak_memory(func),
+        }
+
+        if log:
+            log(f"{name}: {results[name]['ops_per_sec']:.2f} ops/sec")
+
+    return {
+        "turf_version": __version__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "implementation": sys.implementation.name,
+        "timestamp": time.time(),
+        "params": {
+            "seed": seed,
+            "vertices": vertices,
+            "features": features,
+            "holes": holes,
+            "min_time": min_time,
+            "fixtures": fixtures,
+        },
+        "results": results,
+    }
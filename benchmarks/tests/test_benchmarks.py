@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from benchmarks.__main__ import main
+from benchmarks.cases import cases
+from benchmarks.generators import make_dataset
+from benchmarks.runner import run_benchmarks
+from turf.boolean_point_in_polygon import boolean_point_in_polygon
+from turf.helpers import point
+from turf.kinks import kinks
+
+
+class TestGenerators:
+    def test_seeded(self):
+        assert make_dataset(1, 32, 50, 3) == make_dataset(1, 32, 50, 3)
+        assert make_dataset(1, 32, 50, 3) != make_dataset(2, 32, 50, 3)
+
+    @pytest.mark.parametrize("holes", [0, 1, 5])
+    def test_sizes(self, holes):
+        data = make_dataset(0, 32, 50, holes)
+
+        assert len(data["points"]["features"]) == 50
+        assert len(data["line"]["geometry"]["coordinates"]) == 32
+
+        rings = data["polygon"]["geometry"]["coordinates"]
+
+        assert len(rings) == holes + 1
+        assert len(rings[0]) == 33
+        assert not kinks(data["polygon"])["features"]
+
+        for hole in rings[1:]:
+            assert all(
+                boolean_point_in_polygon(
+                    point(coord), {"type": "Polygon", "coordinates": rings[:1]}
+                )
+                for coord in hole
+            )
+
+
+class TestRunner:
+    def test_run_benchmarks(self):
+        report = run_benchmarks(
+            ["distance", "hex_grid"],
+            vertices=8,
+            features=10,
+            holes=1,
+            repeats=3,
+            min_time=0.001,
+        )
+
+        assert report["params"]["vertices"] == 8
+        assert list(report["results"]) == ["distance", "hex_grid"]
+
+        for result in report["results"].values():
+            assert len(result["samples"]) == result["repeats"] == 3
+            assert result["ops_per_sec"] > 0
+            assert result["peak_memory"] > 0
+
+        json.dumps(report)
+
+    def test_all_cases(self):
+        data = make_dataset(0, 8, 10, 1)
+
+        for name, setup in cases.items():
+            setup(data)()
+
+    def test_main(self, tmp_path, capsys):
+        output = tmp_path / "report.json"
+
+        assert (
+            main(
+                [
+                    "distance",
+                    "--size",
+                    "small",
+                    "--features",
+                    "5",
+                    "--repeats",
+                    "2",
+                    "--min-time",
+                    "0.001",
+                    "-o",
+                    str(output),
+                ]
+            )
+            == 0
+        )
+
+        report = json.loads(output.read_text())
+
+        assert report["params"]["features"] == 5
+        assert report["params"]["size"] == "small"
+        assert list(report["results"]) == ["distance"]
@@ -24,7 +24,7 @@ setup(
     url="https://github.com/pyturf/pyturf",
     author="Diogo Matos Chaves, Steffen Häußler",
     author_email="di.matoschaves@gmail.com",
-    packages=[*find_packages(), "turf.utils"],
+    packages=[*find_packages(exclude=["benchmarks", "benchmarks.*"]), "turf.utils"],
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
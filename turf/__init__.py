@@ -1,36 +1,119 @@
-from turf.along import along
-from turf.area import area
-from turf.bbox import bbox
-from turf.bbox_polygon import bbox_polygon
-from turf.bearing import bearing
-from turf.boolean_disjoint import boolean_disjoint
-from turf.boolean_intersects import boolean_intersects
-from turf.boolean_point_in_polygon import boolean_point_in_polygon
-from turf.boolean_point_on_line import boolean_point_on_line
-from turf.boolean_within import boolean_within
-from turf.center import center
-from turf.centroid import centroid
-from turf.destination import destination
-from turf.distance import distance
-from turf.envelope import envelope
-from turf.explode import explode
-from turf.great_circle import great_circle
+import importlib
+import os
+import sys
+import types
+
+from turf import helpers
 from turf.helpers import *
-from turf.hex_grid import hex_grid
-from turf.length import length
-from turf.line_intersect import line_intersect
-from turf.midpoint import midpoint
-from turf.nearest_point import nearest_point
-from turf.point_grid import point_grid
-from turf.point_on_feature import point_on_feature
-from turf.point_to_line_distance import point_to_line_distance
-from turf.polygon_tangents import polygon_tangents
-from turf.polygon_to_line import polygon_to_line
-from turf.rectangle_grid import rectangle_grid
-from turf.rhumb_bearing import rhumb_bearing
-from turf.rhumb_destination import rhumb_destination
-from turf.rhumb_distance import rhumb_distance
-from turf.square import square
-from turf.square_grid import square_grid
-from turf.triangle_grid import triangle_grid
 from turf.version import __version__
+
+# The helpers are loaded eagerly, as every module depends on them. The other public
+# names are only loaded on first access, from the module defining them, so that e.g.
+# `from turf import distance` does not load the R-tree library of `line_intersect`.
+_lazy_attributes = {
+    "along": "turf.along",
+    "area": "turf.area",
+    "bbox": "turf.bbox",
+    "bbox_cache": "turf.bbox",
+    "bbox_polygon": "turf.bbox_polygon",
+    "bearing": "turf.bearing",
+    "bin_points": "turf.bin_points",
+    "boolean_disjoint": "turf.boolean_disjoint",
+    "boolean_intersects": "turf.boolean_intersects",
+    "boolean_point_in_polygon": "turf.boolean_point_in_polygon",
+    "points_in_polygon": "turf.boolean_point_in_polygon",
+    "PreparedPolygon": "turf.boolean_point_in_polygon",
+    "boolean_point_on_line": "turf.boolean_point_on_line",
+    "boolean_within": "turf.boolean_within",
+    "center": "turf.center",
+    "centroid": "turf.centroid",
+    "destination": "turf.destination",
+    "distance": "turf.distance",
+    "distance_many": "turf.distance",
+    "distance_matrix": "turf.distance_matrix",
+    "envelope": "turf.envelope",
+    "explode": "turf.explode",
+    "great_circle": "turf.great_circle",
+    "hex_grid": "turf.hex_grid",
+    "iter_hex_grid": "turf.hex_grid",
+    "HexGridSpec": "turf.hex_grid",
+    "kinks": "turf.kinks",
+    "length": "turf.length",
+    "line_intersect": "turf.line_intersect",
+    "SegmentIndex": "turf.line_intersect",
+    "midpoint": "turf.midpoint",
+    "nearest_point": "turf.nearest_point",
+    "PointIndex": "turf.nearest_point",
+    "point_grid": "turf.point_grid",
+    "iter_point_grid": "turf.point_grid",
+    "point_on_feature": "turf.point_on_feature",
+    "point_to_line_distance": "turf.point_to_line_distance",
+    "points_within_polygons": "turf.points_within_polygons",
+    "polygon_tangents": "turf.polygon_tangents",
+    "polygon_to_line": "turf.polygon_to_line",
+    "profile": "turf.profile",
+    "ProfileReport": "turf.profile",
+    "rectangle_grid": "turf.rectangle_grid",
+    "iter_rectangle_grid": "turf.rectangle_grid",
+    "RectangleGridSpec": "turf.rectangle_grid",
+    "rhumb_bearing": "turf.rhumb_bearing",
+    "rhumb_destination": "turf.rhumb_destination",
+    "rhumb_distance": "turf.rhumb_distance",
+    "square": "turf.square",
+    "square_grid": "turf.square_grid",
+    "iter_square_grid": "turf.square_grid",
+    "SquareGridSpec": "turf.square_grid",
+    "triangle_grid": "turf.triangle_grid",
+    "iter_triangle_grid": "turf.triangle_grid",
+    "TriangleGridSpec": "turf.triangle_grid",
+}
+
+__all__ = [
+    *(name for name in vars(helpers) if not name.startswith("_")),
+    *_lazy_attributes,
+    "__version__",
+]
+
+
+def __getattr__(name: str):
+    """
+    Loads a public name, or a submodule (e.g. `turf.invariant`), on first access.
+    """
+    if name in _lazy_attributes:
+        value = getattr(importlib.import_module(_lazy_attributes[name]), name)
+    else:
+        try:
+            value = importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as error:
+            if error.name != f"{__name__}.{name}":
+                raise
+
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_lazy_attributes})
+
+
+class _LazyModule(types.ModuleType):
+    def __setattr__(self, name: str, value) -> None:
+        # importing a submodule binds it as an attribute of the package, which would
+        # shadow the function of the same name (e.g. turf.along)
+        if name in _lazy_attributes and isinstance(value, types.ModuleType):
+            return
+
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyModule
+
+if os.environ.get("TURF_PROFILE", "0") not in ("", "0"):
+    from turf.profile._profile import profile_from_environment
+
+    profile_from_environment()
@@ -1,8 +1,6 @@
-from turf.helpers import point
-from turf.bearing import bearing
-from turf.destination import destination
-from turf.distance import distance
-from turf.invariant import get_coords_from_geometry, get_coords_from_features
+from turf.helpers import length_to_radians, point, radians_to_length
+from turf.invariant import get_coords_from_features
+from turf.kernels import bearing, check_degrees, destination, haversine
 from turf.utils.exceptions import InvalidInput
 from turf.utils.error_codes import error_code_messages
 from turf.utils.helpers import truncate
@@ -25,8 +23,15 @@ def along(line, dist, options=None):
     if not isinstance(dist, (float, int)) or dist < 0:
         raise InvalidInput(error_code_messages["InvalidDistance"])
 
+    kwargs = {}
+    if "units" in options:
+        kwargs["units"] = options["units"]
+
     coords = get_coords_from_features(line, ["LineString"])
 
+    # the travelled distance is measured in kilometers
+    factor = radians_to_length(1)
+
     travelled = 0
     for i in range(len(coords)):
         if dist >= travelled and i == len(coords) - 1:
@@ -36,10 +41,19 @@ def along(line, dist, options=None):
             if not overshot:
                 return point([truncate(coord, 6) for coord in coords[i]])
             else:
-                direction = bearing(coords[i], coords[i - 1]) - 180
-                interpolated = destination(coords[i], overshot, direction, options)
-                return interpolated
+                (lng, lat, *_), (prev_lng, prev_lat, *_) = coords[i], coords[i - 1]
+                check_degrees(lng, lat, prev_lng, prev_lat)
+
+                direction = bearing(lng, lat, prev_lng, prev_lat) - 180
+                radians = length_to_radians(overshot, **kwargs)
+
+                lng, lat = destination(lng, lat, radians, direction)
+
+                return point(
+                    [truncate(lng, 6), truncate(lat, 6)], options.get("properties")
+                )
         else:
-            travelled += distance(coords[i], coords[i + 1])
+            (lng, lat, *_), (next_lng, next_lat, *_) = coords[i], coords[i + 1]
+            travelled += haversine(lng, lat, next_lng, next_lat) * factor
 
     return point([truncate(coord, 6) for coord in coords[-1]])
@@ -3,6 +3,8 @@ from math import sin
 
 from turf.invariant import get_geometry_from_features, get_coords_from_geometry
 from turf.helpers import (
+    ColumnarFeatureCollection,
+    all_geometry_types,
     earth_radius,
     degrees_to_radians as rad,
     get_input_dimensions,
@@ -14,10 +16,13 @@ def area(features):
     """
     Takes one or more features and returns their area in square meters.
 
-    :param features: geojson input GeoJSON feature(s)
+    :param features: geojson input GeoJSON feature(s), or a ColumnarFeatureCollection
     :return: area in square meters
     """
 
+    if isinstance(features, ColumnarFeatureCollection):
+        return columnar_area(features)
+
     geometries = get_geometry_from_features(features)
 
     if not isinstance(geometries, list) or geometries == features:
@@ -62,8 +67,8 @@ def polygon_area(coords):
     if len(coords) > 0:
         total += abs(ring_area(coords[0]))
 
-    for i in coords[1:]:
-        total -= abs(ring_area(coords[i]))
+    for hole in coords[1:]:
+        total -= abs(ring_area(hole))
 
     return total
 
@@ -112,3 +117,86 @@ def ring_area(coords):
         total = total * earth_radius**2 / 2
 
     return total
+
+
+def columnar_area(collection):
+    """
+    Area of a ColumnarFeatureCollection, summed in the same order as for the
+    equivalent FeatureCollection.
+
+    :param collection: ColumnarFeatureCollection
+    :return: area in square meters
+    """
+
+    coords = collection.coords
+    ring_offsets = collection.ring_offsets
+    part_offsets = collection.part_offsets
+    geometry_offsets = collection.geometry_offsets
+
+    def part_area(part):
+        rings = range(part_offsets[part], part_offsets[part + 1])
+        total = 0
+
+        for i, ring in enumerate(rings):
+            start = ring_offsets[ring]
+            end = ring_offsets[ring + 1]
+            area_ring = abs(columnar_ring_area(coords, start, end))
+
+            total = total + area_ring if i == 0 else total - area_ring
+
+        return total
+
+    total = 0
+
+    for i, code in enumerate(collection.geometry_types):
+        geometry_type = all_geometry_types[code - 1] if code else None
+        parts = range(geometry_offsets[i], geometry_offsets[i + 1])
+
+        if geometry_type == "Polygon":
+            total += part_area(parts[0])
+        elif geometry_type == "MultiPolygon":
+            total += sum(part_area(part) for part in parts)
+
+    return total
+
+
+def columnar_ring_area(coords, start, end):
+    """
+    Same as `ring_area`, for a ring stored in an array of interleaved lng, lat values.
+
+    :param coords: interleaved coordinates
+    :param start: index of the first coordinate of the ring
+    :param end: index after the last coordinate of the ring
+    :return: The approximate signed geodesic area of the polygon in square meters.
+    """
+
+    total = 0
+
+    coords_length = end - start
+
+    if coords_length > 2:
+        for i in range(coords_length):
+            if i == coords_length - 2:
+                lower_index = coords_length - 2
+                middle_index = coords_length - 1
+                upper_index = 0
+
+            elif i == coords_length - 1:
+                lower_index = coords_length - 1
+                middle_index = 0
+                upper_index = 1
+
+            else:
+                lower_index = i
+                middle_index = i + 1
+                upper_index = i + 2
+
+            x1 = coords[2 * (start + lower_index)]
+            y2 = coords[2 * (start + middle_index) + 1]
+            x3 = coords[2 * (start + upper_index)]
+
+            total += (rad(x3) - rad(x1)) * sin(rad(y2))
+
+        total = total * earth_radius**2 / 2
+
+    return total
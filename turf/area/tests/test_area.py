@@ -2,6 +2,7 @@ import pytest
 import os
 
 from turf.area import area
+from turf.helpers import ColumnarFeatureCollection, all_geometry_types
 
 from turf.utils.error_codes import error_code_messages
 from turf.utils.exceptions import InvalidInput
@@ -12,6 +13,27 @@ current_path = os.path.dirname(os.path.realpath(__file__))
 fixtures = get_fixtures(current_path)
 
 
+def as_feature_collection(geojson):
+    """
+    Wraps a fixture in a FeatureCollection, or returns None if it can't be stored columnar.
+    """
+    if not isinstance(geojson, dict):
+        return None
+
+    if geojson.get("type") in all_geometry_types:
+        geojson = {"type": "Feature", "properties": {}, "geometry": geojson}
+
+    if geojson.get("type") == "Feature":
+        geojson = {"type": "FeatureCollection", "features": [geojson]}
+
+    try:
+        ColumnarFeatureCollection.from_geojson(geojson)
+    except InvalidInput:
+        return None
+
+    return geojson
+
+
 class TestArea:
     allowed_types = ["Polygon", "MultiPolygon"]
 
@@ -25,6 +47,36 @@ class TestArea:
     def test_area(self, fixture):
         assert round(area(fixture["in"])) == fixture["out"]
 
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            pytest.param(fixture, id=fixture_name)
+            for fixture_name, fixture in fixtures.items()
+            if as_feature_collection(fixture["in"])
+        ],
+    )
+    def test_columnar(self, fixture):
+        collection = as_feature_collection(fixture["in"])
+        columnar = ColumnarFeatureCollection.from_geojson(collection)
+
+        assert area(columnar) == area(collection)
+
+    def test_polygon_with_hole(self):
+        shell = [[0, 0], [10, 0], [10, 10], [0, 10], [0, 0]]
+        hole = [[2, 2], [4, 2], [4, 4], [2, 4], [2, 2]]
+
+        with_hole = {"type": "Polygon", "coordinates": [shell, hole]}
+        shell_only = {"type": "Polygon", "coordinates": [shell]}
+        hole_only = {"type": "Polygon", "coordinates": [hole]}
+
+        assert area(with_hole) == area(shell_only) - area(hole_only)
+
+        columnar = ColumnarFeatureCollection.from_geojson(
+            as_feature_collection(with_hole)
+        )
+
+        assert area(columnar) == area(with_hole)
+
     @pytest.mark.parametrize(
         "input_value, exception_value",
         [
@@ -1 +1 @@
-from turf.bbox._bbox import bbox
+from turf.bbox._bbox import bbox, bbox_cache
@@ -1,17 +1,127 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import reduce
+from typing import Dict, Iterator, List, Union
 
+from turf.helpers import ColumnarFeatureCollection, Feature, FeatureCollection, Geometry
 from turf.invariant import get_coords_from_features
-from turf.utils.helpers import get_input_dimensions
+from turf.utils.error_codes import error_code_messages
+from turf.utils.exceptions import InvalidInput
+from turf.utils.helpers import coordinate_columns, get_input_dimensions
 
+# cache of the dict inputs, only set within a bbox_cache context
+active_cache = ContextVar("bbox_cache", default=None)
 
-def bbox(features):
+
+def bbox(features, options=None):
     """
     Takes a set of features and returns a bounding box containing of all input features.
 
-    :param features: any GeoJSON feature or feature collection
+    A "bbox" member of the input is returned as is, and bounding boxes computed for
+    Geometry and Feature objects are stored on their geometry, so that they are only
+    computed once. Within a `bbox_cache` context, the bounding boxes of dict inputs are
+    cached as well.
+
+    :param features: any GeoJSON feature or feature collection, or a ColumnarFeatureCollection
+    :param options: optional parameters
+        [options["recompute"]=False] compute the bounding box from the coordinates, even if
+                                     the input has a "bbox" member or a cached bounding box
     :return: bounding box extent in [minX, minY, maxX, maxY] order
     """
 
+    if isinstance(features, ColumnarFeatureCollection):
+        return columnar_bbox(features)
+
+    if not isinstance(options, dict):
+        options = {}
+
+    if options.get("recompute", False):
+        return compute_bbox(features)
+
+    bbox_member = get_bbox_member(features)
+
+    if bbox_member is not None:
+        return bbox_member
+
+    if isinstance(features, Feature):
+        features = features.geometry
+
+    if isinstance(features, Geometry):
+        if features._bbox is None:
+            features._bbox = compute_bbox(features)
+
+        return list(features._bbox)
+
+    cache = active_cache.get()
+
+    if cache is None or not isinstance(features, dict):
+        return compute_bbox(features)
+
+    bboxes, maxsize = cache
+    key = id(features)
+
+    if key in bboxes:
+        bboxes.move_to_end(key)
+        return list(bboxes[key][1])
+
+    bounding_box = compute_bbox(features)
+
+    # the input is kept referenced, so that its id can't be reused by another object
+    bboxes[key] = (features, bounding_box)
+
+    if len(bboxes) > maxsize:
+        bboxes.popitem(last=False)
+
+    return list(bounding_box)
+
+
+@contextmanager
+def bbox_cache(maxsize: int = 1024) -> Iterator[Dict]:
+    """
+    Context manager caching the bounding boxes of the dict inputs of `bbox`, and thus of
+    the functions using it, by object identity. Repeated calls on the same geometry, for
+    example a polygon tested against many points, then compute its bounding box once.
+
+    The least recently used entries are dropped beyond maxsize. The cached inputs must not
+    be modified within the context.
+
+    :param maxsize: maximum number of cached bounding boxes
+    :return: the cache, mapping the id of the inputs to (input, bounding box) tuples
+    """
+    if not isinstance(maxsize, int) or maxsize < 1:
+        raise InvalidInput(error_code_messages["InvalidOption"]("maxsize", maxsize))
+
+    bboxes = OrderedDict()
+    token = active_cache.set((bboxes, maxsize))
+
+    try:
+        yield bboxes
+    finally:
+        active_cache.reset(token)
+
+
+def get_bbox_member(features) -> Union[List, None]:
+    """
+    :param features: any GeoJSON feature or feature collection
+    :return: copy of the "bbox" member of the input, if it holds a 2D bounding box
+    """
+    if not isinstance(features, (dict, Feature, FeatureCollection)):
+        return None
+
+    bbox_member = features.get("bbox", None)
+
+    if isinstance(bbox_member, (list, tuple)) and len(bbox_member) == 4:
+        return list(bbox_member)
+
+    return None
+
+
+def compute_bbox(features) -> List:
+    """
+    :param features: any GeoJSON feature or feature collection
+    :return: bounding box extent of the coordinates in [minX, minY, maxX, maxY] order
+    """
     bounding_box = [float("inf"), float("inf"), float("-inf"), float("-inf")]
 
     coords = get_coords_from_features(features)
@@ -38,3 +148,19 @@ def reduce_coords(bounding_box, coord):
         bounding_box[3] = coord[1]
 
     return bounding_box
+
+
+def columnar_bbox(collection):
+    """
+    Bounding box of a ColumnarFeatureCollection, computed over its coordinate columns.
+
+    :param collection: ColumnarFeatureCollection
+    :return: bounding box extent in [minX, minY, maxX, maxY] order
+    """
+
+    if not collection.coords:
+        return [float("inf"), float("inf"), float("-inf"), float("-inf")]
+
+    lngs, lats = coordinate_columns(collection.coords)
+
+    return [min(lngs), min(lats), max(lngs), max(lats)]
@@ -1,7 +1,9 @@
 import pytest
 import os
 
-from turf.bbox import bbox
+from turf.bbox import bbox, bbox_cache
+from turf.helpers import ColumnarFeatureCollection, all_geometry_types
+from turf.helpers import line_string, polygon
 
 from turf.utils.error_codes import error_code_messages
 from turf.utils.exceptions import InvalidInput
@@ -12,6 +14,27 @@ current_path = os.path.dirname(os.path.realpath(__file__))
 fixtures = get_fixtures(current_path)
 
 
+def as_feature_collection(geojson):
+    """
+    Wraps a fixture in a FeatureCollection, or returns None if it can't be stored columnar.
+    """
+    if not isinstance(geojson, dict):
+        return None
+
+    if geojson.get("type") in all_geometry_types:
+        geojson = {"type": "Feature", "properties": {}, "geometry": geojson}
+
+    if geojson.get("type") == "Feature":
+        geojson = {"type": "FeatureCollection", "features": [geojson]}
+
+    try:
+        ColumnarFeatureCollection.from_geojson(geojson)
+    except InvalidInput:
+        return None
+
+    return geojson
+
+
 class TestBBox:
     allowed_types = [
         "Point",
@@ -32,6 +55,65 @@ class TestBBox:
     def test_bbox(self, fixture):
         assert bbox(fixture["in"]) == fixture["out"]
 
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            pytest.param(fixture, id=fixture_name)
+            for fixture_name, fixture in fixtures.items()
+            if as_feature_collection(fixture["in"])
+        ],
+    )
+    def test_columnar(self, fixture):
+        collection = as_feature_collection(fixture["in"])
+        columnar = ColumnarFeatureCollection.from_geojson(collection)
+
+        assert bbox(columnar) == bbox(collection)
+
+    def test_bbox_member(self):
+        feature = line_string([[0, 0], [2, 3]], options={"bbox": [-1, -1, 5, 5]})
+
+        assert bbox(feature) == [-1, -1, 5, 5]
+        assert bbox(feature, {"recompute": True}) == [0, 0, 2, 3]
+
+        # 3D bounding boxes are recomputed
+        feature["bbox"] = [-1, -1, 0, 5, 5, 10]
+        assert bbox(feature) == [0, 0, 2, 3]
+
+    def test_object_cache(self):
+        feature = polygon([[[0, 0], [4, 0], [4, 2], [0, 0]]], as_geojson=False)
+
+        assert bbox(feature) == [0, 0, 4, 2]
+        assert feature.geometry._bbox == [0, 0, 4, 2]
+
+        # the returned bounding box is a copy
+        bbox(feature)[0] = 10
+        assert bbox(feature) == [0, 0, 4, 2]
+
+        feature.geometry.coordinates = [[[0, 0], [1, 0], [1, 1], [0, 0]]]
+        assert bbox(feature) == [0, 0, 1, 1]
+
+    def test_bbox_cache(self):
+        line_1 = {"type": "LineString", "coordinates": [[0, 0], [2, 3]]}
+        line_2 = {"type": "LineString", "coordinates": [[1, 1], [2, 2]]}
+
+        with bbox_cache(maxsize=1) as cache:
+            assert bbox(line_1) == [0, 0, 2, 3]
+
+            line_1["coordinates"].append([5, 5])
+            assert bbox(line_1) == [0, 0, 2, 3]
+
+            assert bbox(line_2) == [1, 1, 2, 2]
+            assert list(cache) == [id(line_2)]
+
+        assert bbox(line_1) == [0, 0, 5, 5]
+
+    def test_bbox_cache_exception(self):
+        with pytest.raises(InvalidInput) as excinfo:
+            with bbox_cache(maxsize=0):
+                pass
+
+        assert str(excinfo.value) == error_code_messages["InvalidOption"]("maxsize", 0)
+
     @pytest.mark.parametrize(
         "input_value, exception_value",
         [
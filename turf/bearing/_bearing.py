@@ -1,7 +1,5 @@
-from math import sin, cos, atan2
-
 from turf.invariant import get_coords_from_features
-from turf.helpers import degrees_to_radians, radians_to_degrees
+from turf.kernels import bearing as bearing_kernel, check_degrees
 
 
 def bearing(start, end, options=None):
@@ -25,16 +23,9 @@ def bearing(start, end, options=None):
     start = get_coords_from_features(start, ["Point"])
     end = get_coords_from_features(end, ["Point"])
 
-    lon1 = degrees_to_radians(start[0])
-    lon2 = degrees_to_radians(end[0])
-    lat1 = degrees_to_radians(start[1])
-    lat2 = degrees_to_radians(end[1])
-
-    a = sin(lon2 - lon1) * cos(lat2)
-
-    b = cos(lat1) * sin(lat2) - sin(lat1) * cos(lat2) * cos(lon2 - lon1)
+    check_degrees(start[0], end[0], start[1], end[1])
 
-    return radians_to_degrees(atan2(a, b))
+    return bearing_kernel(start[0], start[1], end[0], end[1])
 
 
 def calculate_final_bearing(start, end):
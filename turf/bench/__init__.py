@@ -0,0 +1,2 @@
+from turf.bench._compare import compare_reports, format_comparison, ratio_interval
+from turf.bench._fixtures import fixture_cases
@@ -0,0 +1,69 @@
+import argparse
+import json
+import sys
+
+from turf.bench._compare import compare_reports, format_comparison
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m turf.bench")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compare = commands.add_parser(
+        "compare",
+        help="compare two benchmark reports",
+        description="Compares two reports written by `python -m benchmarks`, and exits "
+        "with status 1 if a tracked case regressed beyond the threshold.",
+    )
+    compare.add_argument("baseline", help="baseline report (JSON)")
+    compare.add_argument("current", help="current report (JSON)")
+    compare.add_argument(
+        "--threshold",
+        type=float,
+        default=0.05,
+        help="tolerated slowdown, as a fraction of the baseline speed (default: 0.05)",
+    )
+    compare.add_argument(
+        "--confidence",
+        type=float,
+        default=0.95,
+        help="confidence level of the intervals (default: 0.95)",
+    )
+    compare.add_argument(
+        "--cases",
+        nargs="+",
+        help="tracked cases (default: all the cases of both reports); a tracked case "
+        "missing from a report also fails the comparison",
+    )
+    compare.add_argument(
+        "--json", action="store_true", help="print the comparison as JSON"
+    )
+
+    args = parser.parse_args(argv)
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    with open(args.current) as f:
+        current = json.load(f)
+
+    options = {"threshold": args.threshold, "confidence": args.confidence}
+
+    if args.cases:
+        options["cases"] = args.cases
+
+    comparison = compare_reports(baseline, current, options)
+
+    if args.json:
+        print(json.dumps(comparison, indent=2))
+    else:
+        print(format_comparison(comparison))
+
+    if comparison["regressions"] or comparison["missing"]:
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
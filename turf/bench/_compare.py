@@ -0,0 +1,191 @@
+import math
+import statistics
+from typing import Dict, List, Sequence
+
+from turf.utils.error_codes import error_code_messages
+from turf.utils.exceptions import InvalidInput
+
+
+def t_quantile(p: float, df: float) -> float:
+    """
+    Quantile of the Student's t distribution, from the normal one with the Cornish-Fisher
+    expansion (Abramowitz & Stegun 26.7.5). Accurate to about 1e-2 for 3 degrees of
+    freedom or more, too small below (11.3 instead of 12.7 for 1 degree of freedom at
+    p = 0.975).
+
+    :param p: probability, between 0 and 1
+    :param df: degrees of freedom
+    :return: t such that P(T <= t) = p
+    """
+    z = statistics.NormalDist().inv_cdf(p)
+
+    if math.isinf(df):
+        return z
+
+    g1 = (z**3 + z) / 4
+    g2 = (5 * z**5 + 16 * z**3 + 3 * z) / 96
+    g3 = (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / 384
+    g4 = (79 * z**9 + 776 * z**7 + 1482 * z**5 - 1920 * z**3 - 945 * z) / 92160
+
+    return z + g1 / df + g2 / df**2 + g3 / df**3 + g4 / df**4
+
+
+def ratio_interval(
+    baseline: Sequence[float], current: Sequence[float], confidence: float
+) -> Dict:
+    """
+    Speed ratio between two sets of ops/sec samples, with its confidence interval. The
+    interval is Welch's t interval of the difference of the mean log ops/sec, so it does
+    not assume equal variances and is symmetric in relative terms.
+
+    :param baseline: ops/sec of each repeat of the baseline
+    :param current: ops/sec of each repeat of the current run
+    :param confidence: confidence level of the interval, e.g. 0.95
+    :return: ratio (current / baseline, above 1 for a speedup) and its interval bounds
+    """
+    log_baseline = [math.log(sample) for sample in baseline]
+    log_current = [math.log(sample) for sample in current]
+
+    difference = statistics.mean(log_current) - statistics.mean(log_baseline)
+
+    if len(log_baseline) < 2 or len(log_current) < 2:
+        # no spread can be estimated from a single repeat
+        ratio = math.exp(difference)
+        return {"ratio": ratio, "low": ratio, "high": ratio}
+
+    var_baseline = statistics.variance(log_baseline) / len(log_baseline)
+    var_current = statistics.variance(log_current) / len(log_current)
+    std_error = math.sqrt(var_baseline + var_current)
+
+    if std_error == 0:
+        df = math.inf
+    else:
+        # Welch-Satterthwaite degrees of freedom
+        df = (var_baseline + var_current) ** 2 / (
+            var_baseline**2 / (len(log_baseline) - 1)
+            + var_current**2 / (len(log_current) - 1)
+        )
+
+    margin = t_quantile((1 + confidence) / 2, df) * std_error
+
+    return {
+        "ratio": math.exp(difference),
+        "low": math.exp(difference - margin),
+        "high": math.exp(difference + margin),
+    }
+
+
+def compare_reports(baseline: Dict, current: Dict, options: Dict = None) -> Dict:
+    """
+    Compares two benchmark reports, as written by `python -m benchmarks`.
+
+    A case regresses when its speed ratio is below 1 - threshold with the given
+    confidence, i.e. when the upper bound of the confidence interval of the ratio is.
+
+    :param baseline: baseline report
+    :param current: current report
+    :param options: optional parameters
+        [options["threshold"]=0.05]: tolerated slowdown, as a fraction of the baseline speed
+        [options["confidence"]=0.95]: confidence level of the intervals
+        [options["cases"]]: names of the tracked cases, all the common cases by default
+    :return: dictionary with the comparison of each case ("results"), the names of the
+        regressed cases ("regressions"), and the names of the tracked cases missing from
+        either report ("missing")
+    """
+    if not isinstance(options, dict):
+        options = {}
+
+    threshold = options.get("threshold", 0.05)
+    confidence = options.get("confidence", 0.95)
+
+    if not isinstance(threshold, (int, float)) or not 0 <= threshold < 1:
+        raise InvalidInput(error_code_messages["InvalidOption"]("threshold", threshold))
+
+    if not isinstance(confidence, (int, float)) or not 0 < confidence < 1:
+        raise InvalidInput(
+            error_code_messages["InvalidOption"]("confidence", confidence)
+        )
+
+    baseline_results = baseline.get("results", {})
+    current_results = current.get("results", {})
+
+    names = options.get("cases", None)
+
+    if names is None:
+        names = [name for name in baseline_results if name in current_results]
+
+    results = {}
+    regressions = []
+    missing = []
+
+    for name in names:
+        if name not in baseline_results or name not in current_results:
+            missing.append(name)
+            continue
+
+        interval = ratio_interval(
+            get_samples(baseline_results[name]),
+            get_samples(current_results[name]),
+            confidence,
+        )
+
+        regressed = interval["high"] < 1 - threshold
+
+        results[name] = {
+            "baseline": baseline_results[name]["ops_per_sec"],
+            "current": current_results[name]["ops_per_sec"],
+            **interval,
+            "regressed": regressed,
+        }
+
+        if regressed:
+            regressions.append(name)
+
+    return {
+        "threshold": threshold,
+        "confidence": confidence,
+        "results": results,
+        "regressions": regressions,
+        "missing": missing,
+    }
+
+
+def get_samples(result: Dict) -> List[float]:
+    """
+    :param result: result of a case in a benchmark report
+    :return: ops/sec of each repeat, or the mean alone for reports without samples
+    """
+    return result.get("samples") or [result["ops_per_sec"]]
+
+
+def format_comparison(comparison: Dict) -> str:
+    """
+    :param comparison: result of `compare_reports`
+    :return: text table of the comparison, one case per line
+    """
+    confidence = f"{comparison['confidence']:.0%}"
+    header = (
+        f"{'case':<36} {'baseline':>12} {'current':>12} {'change':>8}  {confidence} CI"
+    )
+    lines = [header, "-" * (len(header) + 18)]
+
+    for name, result in comparison["results"].items():
+        change = f"{result['ratio'] - 1:+.1%}"
+        interval = f"[{result['low'] - 1:+.1%}, {result['high'] - 1:+.1%}]"
+        flag = "  REGRESSION" if result["regressed"] else ""
+
+        lines.append(
+            f"{name:<36} {result['baseline']:>12.2f} {result['current']:>12.2f} "
+            f"{change:>8}  {interval}{flag}"
+        )
+
+    for name in comparison["missing"]:
+        lines.append(f"{name:<36} missing from one of the reports")
+
+    lines.append("")
+    lines.append(
+        f"{len(comparison['regressions'])} regression(s) beyond "
+        f"{comparison['threshold']:.0%}"
+    )
+
+    return "\n".join(lines)
@@ -0,0 +1,127 @@
+import os
+from typing import Callable, Dict, List
+
+from turf.utils.test_setup import get_fixtures
+
+turf_path = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+def pair(func: Callable) -> Callable:
+    """
+    :param func: function of two features
+    :return: function called with the two features of a fixture FeatureCollection
+    """
+
+    def call(fixture: Dict):
+        feature_1, feature_2 = fixture["features"][:2]
+        return func(feature_1, feature_2)
+
+    return call
+
+
+def pair_with_options(func: Callable) -> Callable:
+    """
+    :param func: function of two features and options
+    :return: function called with the two features of a fixture FeatureCollection, and its
+        properties as options
+    """
+
+    def call(fixture: Dict):
+        feature_1, feature_2 = fixture["features"][:2]
+        return func(feature_1, feature_2, fixture.get("properties", {}))
+
+    return call
+
+
+def get_fixture_specs() -> Dict:
+    """
+    :return: module name -> (fixture directories, function called with each fixture input)
+    """
+    from turf.area import area
+    from turf.bbox import bbox
+    from turf.boolean_disjoint import boolean_disjoint
+    from turf.boolean_intersects import boolean_intersects
+    from turf.boolean_point_on_line import boolean_point_on_line
+    from turf.boolean_within import boolean_within
+    from turf.centroid import centroid
+    from turf.length import length
+    from turf.line_intersect import line_intersect
+    from turf.point_to_line_distance import point_to_line_distance
+    from turf.polygon_to_line import polygon_to_line
+
+    return {
+        "area": (["in"], area),
+        "bbox": (["in"], lambda fixture: bbox(fixture, {"recompute": True})),
+        "boolean_disjoint": (["true", "false"], pair(boolean_disjoint)),
+        "boolean_intersects": (["true", "false"], pair(boolean_intersects)),
+        "boolean_point_on_line": (
+            ["true", "false"],
+            pair_with_options(boolean_point_on_line),
+        ),
+        "boolean_within": (["true", "false"], pair(boolean_within)),
+        "centroid": (["in"], centroid),
+        "length": (["in"], length),
+        "line_intersect": (["in"], pair(line_intersect)),
+        "point_to_line_distance": (["in"], pair(point_to_line_distance)),
+        "polygon_to_line": (["in"], polygon_to_line),
+    }
+
+
+def load_fixture_inputs(module: str, keys: List[str], func: Callable) -> List:
+    """
+    Loads the test fixtures of a module, keeping the ones the function accepts.
+
+    :param module: turf module name
+    :param keys: fixture directories under the tests directory of the module
+    :param func: function called with each fixture input
+    :return: list of fixture inputs, empty if the tests directory is not available
+    """
+    tests_path = os.path.join(turf_path, module, "tests")
+
+    if not all(os.path.isdir(os.path.join(tests_path, key)) for key in keys):
+        return []
+
+    fixtures = get_fixtures(tests_path, keys=keys)
+    inputs = []
+
+    for name in sorted(fixtures):
+        for key in keys:
+            value = fixtures[name].get(key)
+
+            if value is None:
+                continue
+
+            try:
+                func(value)
+            except Exception:
+                # fixtures of invalid inputs
+                continue
+
+            inputs.append(value)
+
+    return inputs
+
+
+def fixture_cases() -> Dict[str, Callable]:
+    """
+    Benchmark cases running a function over the test fixtures of its module, which are
+    real geometries where the synthetic datasets are random. The fixtures are only shipped
+    with the source tree: modules whose fixtures can't be found have no case.
+
+    :return: case name ("fixtures:<module>") -> setup, the setup taking a (unused) dataset
+        and returning the function to time, called without arguments
+    """
+    cases = {}
+
+    for module, (keys, func) in get_fixture_specs().items():
+        inputs = load_fixture_inputs(module, keys, func)
+
+        if not inputs:
+            continue
+
+        def setup(data, func=func, inputs=inputs):
+            return lambda: [func(value) for value in inputs]
+
+        cases[f"fixtures:{module}"] = setup
+
+    return cases
@@ -0,0 +1,142 @@
+import json
+
+import pytest
+
+from turf.bench import compare_reports, fixture_cases, format_comparison, ratio_interval
+from turf.bench.__main__ import main
+from turf.bench._compare import t_quantile
+
+from turf.utils.error_codes import error_code_messages
+from turf.utils.exceptions import InvalidInput
+
+
+def report(**results):
+    return {
+        "results": {
+            name: {"ops_per_sec": sum(samples) / len(samples), "samples": samples}
+            for name, samples in results.items()
+        }
+    }
+
+
+baseline = report(
+    distance=[1000, 1010, 990, 1005, 995],
+    boolean_within=[200, 202, 198, 201, 199],
+    line_intersect=[50, 51, 49, 50, 50],
+)
+
+current = report(
+    distance=[1500, 1490, 1510, 1505, 1495],
+    boolean_within=[150, 152, 148, 151, 149],
+    line_intersect=[49, 51, 50, 48, 50],
+)
+
+
+class TestCompare:
+    @pytest.mark.parametrize(
+        "p,df,expected",
+        [
+            pytest.param(0.975, 3, 3.182, id="df_3"),
+            pytest.param(0.975, 10, 2.228, id="df_10"),
+            pytest.param(0.95, 30, 1.697, id="df_30"),
+            pytest.param(0.975, float("inf"), 1.960, id="normal"),
+        ],
+    )
+    def test_t_quantile(self, p, df, expected):
+        assert t_quantile(p, df) == pytest.approx(expected, abs=5e-3)
+
+    def test_ratio_interval(self):
+        interval = ratio_interval([100, 101, 99], [200, 202, 198], 0.95)
+
+        assert interval["ratio"] == pytest.approx(2, rel=1e-3)
+        assert interval["low"] < interval["ratio"] < interval["high"]
+
+        wider = ratio_interval([100, 101, 99], [200, 202, 198], 0.99)
+
+        assert wider["low"] < interval["low"] and wider["high"] > interval["high"]
+
+    def test_single_sample(self):
+        interval = ratio_interval([100], [50], 0.95)
+
+        assert interval["ratio"] == pytest.approx(0.5)
+        assert interval["low"] == interval["ratio"] == interval["high"]
+
+    def test_compare_reports(self):
+        comparison = compare_reports(baseline, current)
+
+        assert comparison["regressions"] == ["boolean_within"]
+        assert comparison["missing"] == []
+
+        results = comparison["results"]
+
+        assert results["distance"]["ratio"] == pytest.approx(1.5, rel=1e-2)
+        assert results["boolean_within"]["ratio"] == pytest.approx(0.75, rel=1e-2)
+        assert not results["line_intersect"]["regressed"]
+
+        assert "REGRESSION" in format_comparison(comparison)
+
+    def test_threshold(self):
+        comparison = compare_reports(baseline, current, {"threshold": 0.3})
+
+        assert comparison["regressions"] == []
+
+    def test_tracked_cases(self):
+        comparison = compare_reports(
+            baseline, current, {"cases": ["distance", "missing_case"]}
+        )
+
+        assert list(comparison["results"]) == ["distance"]
+        assert comparison["missing"] == ["missing_case"]
+
+    @pytest.mark.parametrize(
+        "option,value",
+        [
+            pytest.param("threshold", 1, id="threshold"),
+            pytest.param("threshold", -0.1, id="negative_threshold"),
+            pytest.param("confidence", 1, id="confidence"),
+        ],
+    )
+    def test_exception(self, option, value):
+        with pytest.raises(InvalidInput) as excinfo:
+            compare_reports(baseline, current, {option: value})
+
+        assert excinfo.value.args[0] == error_code_messages["InvalidOption"](
+            option, value
+        )
+
+    @pytest.mark.parametrize(
+        "args,status",
+        [
+            pytest.param([], 1, id="regression"),
+            pytest.param(["--threshold", "0.3"], 0, id="threshold"),
+            pytest.param(["--cases", "distance", "line_intersect"], 0, id="cases"),
+            pytest.param(["--cases", "distance", "nope"], 1, id="missing"),
+            pytest.param(["--json", "--threshold", "0.3"], 0, id="json"),
+        ],
+    )
+    def test_main(self, tmp_path, capsys, args, status):
+        baseline_path = tmp_path / "baseline.json"
+        current_path = tmp_path / "current.json"
+
+        baseline_path.write_text(json.dumps(baseline))
+        current_path.write_text(json.dumps(current))
+
+        assert main(["compare", str(baseline_path), str(current_path), *args]) == status
+
+        output = capsys.readouterr().out
+
+        if "--json" in args:
+            assert json.loads(output)["regressions"] == []
+
+
+class TestFixtureCases:
+    def test_fixture_cases(self):
+        cases = fixture_cases()
+
+        assert "fixtures:boolean_within" in cases
+        assert "fixtures:line_intersect" in cases
+
+        for setup in cases.values():
+            results = setup(None)()
+
+            assert results
@@ -0,0 +1 @@
+from turf.bin_points._bin_points import bin_points
@@ -0,0 +1,190 @@
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Union
+
+from turf.helpers import (
+    ColumnarFeatureCollection,
+    FeatureCollection,
+    feature_collection,
+)
+from turf.helpers._columnar import MISSING, geometry_type_codes
+from turf.invariant import get_coords_from_features
+from turf.utils.error_codes import error_code_messages
+from turf.utils.exceptions import InvalidInput
+from turf.utils.grid_spec import GridSpec
+
+aggregation_types = ["sum", "mean"]
+
+
+def bin_points(
+    points: Union[Dict, FeatureCollection, ColumnarFeatureCollection, Iterable],
+    grid_spec: GridSpec,
+    options: Dict = None,
+) -> Dict:
+    """
+    Bins points into the cells of a grid, and aggregates their properties per cell.
+
+    The points are streamed through once: each one is located in its cell by the grid spec
+    (see `HexGridSpec`, `SquareGridSpec`, ...) with plain arithmetic, and only the cells
+    holding at least one point are built. Points outside the cells of the grid are skipped.
+
+    :param points: Point FeatureCollection, ColumnarFeatureCollection, or iterable (e.g.
+                   generator from `turf.io.read_geojson_seq`) of Point Features
+    :param grid_spec: grid spec the points are binned into
+    :param options: optional parameters
+        [options["aggregations"]=["count"]]: aggregations computed for each cell, each one
+            being "count" for the number of points, "sum:<property>" or "mean:<property>"
+            for the sum or the mean of a numeric property of the points. The property of
+            the cells is named "count", "sum_<property>" or "mean_<property>". Points
+            without a numeric value of the property are left out of its sum and mean.
+    :return: FeatureCollection of the non-empty cells, in the order of the grid function
+    """
+    if not isinstance(options, dict):
+        options = {}
+
+    if not isinstance(grid_spec, GridSpec):
+        raise InvalidInput(error_code_messages["InvalidOption"]("grid_spec", grid_spec))
+
+    aggregations = get_aggregations(options.get("aggregations", ["count"]))
+    names = list(dict.fromkeys(name for _, name in aggregations if name is not None))
+
+    # per cell: number of points, then the sum and number of values of each property
+    cells = {}
+    size = 1 + 2 * len(names)
+
+    for x, y, properties in iter_points(points, names):
+        cell = grid_spec.cell_of_coords(x, y)
+
+        if cell is None:
+            continue
+
+        totals = cells.get(cell)
+
+        if totals is None:
+            totals = cells[cell] = [0] * size
+
+        totals[0] += 1
+
+        for i, value in enumerate(properties, 1):
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                totals[2 * i - 1] += value
+                totals[2 * i] += 1
+
+    results = []
+
+    for cell in sorted(cells):
+        totals = cells[cell]
+        properties = {}
+
+        for aggregation_type, name in aggregations:
+            if aggregation_type == "count":
+                properties["count"] = totals[0]
+                continue
+
+            i = names.index(name) + 1
+            total, n_values = totals[2 * i - 1], totals[2 * i]
+
+            if aggregation_type == "sum":
+                properties[f"sum_{name}"] = total
+            else:
+                properties[f"mean_{name}"] = total / n_values if n_values else None
+
+        results.append(grid_spec.cell_polygon(*cell, properties))
+
+    return feature_collection(results)
+
+
+def get_aggregations(aggregations: Any) -> List[Tuple[str, Union[str, None]]]:
+    """
+    :param aggregations: aggregations option
+    :return: validated list of (aggregation type, property name) pairs,
+        the property name being None for "count"
+    """
+    if isinstance(aggregations, str) or not isinstance(
+        aggregations, (list, tuple, set, frozenset)
+    ):
+        raise InvalidInput(
+            error_code_messages["InvalidOption"]("aggregations", aggregations)
+        )
+
+    parsed = []
+
+    for aggregation in aggregations:
+        if aggregation == "count":
+            parsed.append(("count", None))
+            continue
+
+        aggregation_type, _, name = str(aggregation).partition(":")
+
+        if aggregation_type not in aggregation_types or not name:
+            raise InvalidInput(
+                error_code_messages["InvalidOption"]("aggregations", aggregation)
+            )
+
+        parsed.append((aggregation_type, name))
+
+    return parsed
+
+
+def iter_points(
+    points: Union[Dict, FeatureCollection, ColumnarFeatureCollection, Iterable],
+    names: List[str],
+) -> Iterator[Tuple[float, float, List]]:
+    """
+    :param points: points passed to `bin_points`
+    :param names: names of the aggregated properties
+    :return: generator of the coordinates of the points, with the values of the properties
+    """
+    if isinstance(points, ColumnarFeatureCollection):
+        yield from iter_columnar_points(points, names)
+        return
+
+    if hasattr(points, "to_geojson"):
+        points = points.to_geojson()
+
+    if isinstance(points, dict):
+        if points.get("type") != "FeatureCollection":
+            raise InvalidInput(error_code_messages["InvalidFeatureCollection"])
+
+        points = points.get("features", [])
+
+    for point in points:
+        if hasattr(point, "to_geojson"):
+            point = point.to_geojson()
+
+        geometry = point.get("geometry") if isinstance(point, dict) else None
+
+        if type(geometry) is dict and geometry.get("type") == "Point":
+            # most common input, a GeoJSON Point Feature
+            coords = geometry.get("coordinates")
+        else:
+            coords = get_coords_from_features(point, ["Point"])
+
+        properties = (point.get("properties") or {}) if isinstance(point, dict) else {}
+
+        yield coords[0], coords[1], [properties.get(name) for name in names]
+
+
+def iter_columnar_points(
+    points: ColumnarFeatureCollection, names: List[str]
+) -> Iterator[Tuple[float, float, List]]:
+    """
+    Reads the points straight from the columns, without building any feature.
+
+    :param points: ColumnarFeatureCollection of Point Features
+    :param names: names of the aggregated properties
+    :return: generator of the coordinates of the points, with the values of the properties
+    """
+    point_code = geometry_type_codes["Point"]
+    columns = [points.properties.get(name, [MISSING] * len(points)) for name in names]
+
+    coords = points.coords
+    ring_offsets = points.ring_offsets
+    part_offsets = points.part_offsets
+    geometry_offsets = points.geometry_offsets
+
+    for i, code in enumerate(points.geometry_types):
+        if code != point_code:
+            raise InvalidInput(error_code_messages["InvalidGeometry"](["Point"]))
+
+        c = ring_offsets[part_offsets[geometry_offsets[i]]]
+
+        yield coords[2 * c], coords[2 * c + 1], [column[i] for column in columns]
@@ -0,0 +1,137 @@
+import pytest
+
+from turf.bin_points import bin_points
+from turf.boolean_point_in_polygon import boolean_point_in_polygon
+from turf.helpers import ColumnarFeatureCollection, feature_collection, point
+from turf.hex_grid import HexGridSpec
+from turf.square_grid import SquareGridSpec
+from turf.triangle_grid import TriangleGridSpec
+
+from turf.utils.error_codes import error_code_messages
+from turf.utils.exceptions import InvalidInput
+
+bbox = [-96.6357421875, 31.12819929911196, -84.9462890625, 40.58058466412764]
+
+specs = [
+    pytest.param(HexGridSpec(bbox, 50, {"units": "miles"}), id="hex"),
+    pytest.param(SquareGridSpec(bbox, 50, {"units": "miles"}), id="square"),
+    pytest.param(TriangleGridSpec(bbox, 50, {"units": "miles"}), id="triangle"),
+]
+
+
+def make_points(n=20):
+    west, south, east, north = bbox
+    features = []
+
+    for i in range(n):
+        for j in range(n):
+            properties = {"speed": i + j}
+
+            if (i + j) % 3 == 0:
+                properties["weight"] = 2.5
+
+            features.append(
+                point(
+                    [
+                        west + (east - west) * (i + 0.5) / n,
+                        south + (north - south) * (j + 0.5) / n,
+                    ],
+                    properties,
+                )
+            )
+
+    return feature_collection(features)
+
+
+points = make_points()
+
+
+class TestBinPoints:
+    @pytest.mark.parametrize("spec", specs)
+    def test_bin_points(self, spec):
+        result = bin_points(
+            points,
+            spec,
+            {"aggregations": ["count", "sum:speed", "mean:speed", "mean:weight"]},
+        )
+
+        groups = {}
+
+        for pt in points["features"]:
+            cell = spec.cell_of(pt)
+
+            if cell is not None:
+                assert boolean_point_in_polygon(pt, spec.cell_polygon(*cell))
+                groups.setdefault(cell, []).append(pt["properties"])
+
+        expected = []
+
+        for cell, properties in sorted(groups.items()):
+            speeds = [props["speed"] for props in properties]
+            weights = [props["weight"] for props in properties if "weight" in props]
+
+            expected.append(
+                spec.cell_polygon(
+                    *cell,
+                    {
+                        "count": len(properties),
+                        "sum_speed": sum(speeds),
+                        "mean_speed": sum(speeds) / len(speeds),
+                        "mean_weight": sum(weights) / len(weights) if weights else None,
+                    },
+                )
+            )
+
+        assert result == feature_collection(expected)
+
+    @pytest.mark.parametrize("spec", specs)
+    def test_default_aggregations(self, spec):
+        cells = bin_points(points, spec)["features"]
+
+        assert all(list(cell["properties"]) == ["count"] for cell in cells)
+        assert sum(cell["properties"]["count"] for cell in cells) == len(
+            [pt for pt in points["features"] if spec.cell_of(pt) is not None]
+        )
+
+    @pytest.mark.parametrize("spec", specs)
+    def test_inputs(self, spec):
+        options = {"aggregations": ["count", "sum:speed"]}
+        expected = bin_points(points, spec, options)
+
+        assert bin_points(iter(points["features"]), spec, options) == expected
+        assert (
+            bin_points(
+                feature_collection(points["features"], as_geojson=False), spec, options
+            )
+            == expected
+        )
+        assert (
+            bin_points(ColumnarFeatureCollection.from_geojson(points), spec, options)
+            == expected
+        )
+
+    def test_outside_points(self):
+        spec = SquareGridSpec(bbox, 50, {"units": "miles"})
+        outside = feature_collection([point([0, 0]), point([-90, 50])])
+
+        assert bin_points(outside, spec) == feature_collection([])
+
+    @pytest.mark.parametrize(
+        "aggregations",
+        [
+            pytest.param("count", id="string"),
+            pytest.param(["max:speed"], id="unknown_aggregation"),
+            pytest.param(["sum:"], id="missing_property"),
+            pytest.param(["sum"], id="missing_separator"),
+        ],
+    )
+    def test_exception(self, aggregations):
+        spec = SquareGridSpec(bbox, 50, {"units": "miles"})
+
+        with pytest.raises(InvalidInput) as excinfo:
+            bin_points(points, spec, {"aggregations": aggregations})
+
+        assert excinfo.value.args[0] == error_code_messages["InvalidOption"](
+            "aggregations",
+            aggregations if isinstance(aggregations, str) else aggregations[0],
+        )
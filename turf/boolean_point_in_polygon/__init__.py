@@ -1,3 +1,5 @@
 from turf.boolean_point_in_polygon._boolean_point_in_polygon import (
     boolean_point_in_polygon,
 )
+from turf.boolean_point_in_polygon._points_in_polygon import points_in_polygon
+from turf.boolean_point_in_polygon._prepared_polygon import PreparedPolygon
@@ -7,15 +7,17 @@ from turf.invariant import (
     get_geometry_type,
 )
 from turf.bbox import bbox as bounding_box
+from turf.boolean_point_in_polygon._prepared_polygon import PreparedPolygon
 from turf.utils.error_codes import error_code_messages
 from turf.utils.exceptions import InvalidInput
+from turf.utils.robust import orient2d
 
 valid_polygons = ["Polygon", "MultiPolygon"]
 
 
 def boolean_point_in_polygon(
     point: Union[Sequence, Dict, Feature],
-    polygon: Union[Dict, Feature],
+    polygon: Union[Dict, Feature, PreparedPolygon],
     options: Dict = None,
 ):
     """
@@ -29,7 +31,7 @@ def boolean_point_in_polygon(
     which was modified from http://www.ecse.rpi.edu/Homepages/wrf/Research/Short_Notes/pnpoly.html
 
     :param point: input Point Feature
-    :param polygon: input Polygon or MultiPolygon Feature
+    :param polygon: input Polygon or MultiPolygon Feature, or a PreparedPolygon
     :param options: optional parameters
         [options["ignoreBoundary"]] True if polygon boundary should be ignored when determining if
                                     the point is inside the polygon otherwise False.
@@ -40,6 +42,9 @@ def boolean_point_in_polygon(
 
     ignore_boundary = options.get("ignoreBoundary", False)
 
+    if isinstance(polygon, PreparedPolygon):
+        return polygon.contains(point, ignore_boundary)
+
     point_coords = get_coords_from_features(point, ["Point"])
     polygon_coords = get_coords_from_features(polygon, valid_polygons)
 
@@ -93,6 +98,9 @@ def in_ring(point: Sequence, ring: Sequence, ignore_boundary: bool):
     if ring[0][0] == ring[-1][0] and ring[0][1] == ring[-1][1]:
         ring = ring[:-1]
 
+    x = point[0]
+    y = point[1]
+
     i = 0
     j = len(ring) - 1
     while i < len(ring):
@@ -101,24 +109,22 @@ def in_ring(point: Sequence, ring: Sequence, ignore_boundary: bool):
         xj = ring[j][0]
         yj = ring[j][1]
 
-        on_boundary = (
-            point[1] * (xi - xj) + yi * (xj - point[0]) + yj * (point[0] - xi) == 0
-            and ((xi - point[0]) * (xj - point[0]) <= 0)
-            and ((yi - point[1]) * (yj - point[1]) <= 0)
-        )
+        j = i
+        i += 1
 
-        if on_boundary:
-            return not ignore_boundary
+        # edges above or below the point can neither hold it nor cross its ray
+        if (yi > y and yj > y) or (yi < y and yj < y):
+            continue
 
-        intersect = ((yi > point[1]) != (yj > point[1])) and (
-            point[0] < (xj - xi) * (point[1] - yi) / (yj - yi) + xi
-        )
+        side = orient2d(xi, yi, xj, yj, x, y)
 
-        if intersect:
-            is_inside = not is_inside
+        if side == 0 and min(xi, xj) <= x <= max(xi, xj):
+            return not ignore_boundary
 
-        j = i
-        i += 1
+        # the ray crosses the edge if the point is left of it going up (from i to j), or
+        # right of it going down
+        if (yi > y) != (yj > y) and (side > 0) == (yj > yi):
+            is_inside = not is_inside
 
     return is_inside
 
@@ -0,0 +1,130 @@
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Sequence, Union
+
+from turf.helpers import Feature, FeatureType
+from turf.invariant import get_coords_from_features
+from turf.boolean_point_in_polygon._prepared_polygon import PreparedPolygon
+from turf.utils.helpers import coordinate_columns, get_input_dimensions
+from turf.utils.robust import ccw_error_bound, orient2d_exact
+
+
+def points_in_polygon(
+    points: Union[Sequence, Dict, FeatureType],
+    polygon: Union[Dict, Feature, PreparedPolygon],
+    options: Dict = None,
+) -> List[bool]:
+    """
+    Takes a set of points and a Polygon or MultiPolygon and determines which of the points
+    reside inside the polygon, with the same semantics as `boolean_point_in_polygon`.
+
+    The points are sorted by latitude once, and each edge of the polygon is then tested
+    only against the points within its latitude range, instead of testing every edge
+    for every point.
+
+    :param points: Point / MultiPoint Feature or FeatureCollection, sequence of [lng, lat]
+        positions or buffer of interleaved lng, lat doubles
+    :param polygon: input Polygon or MultiPolygon Feature, or a PreparedPolygon
+    :param options: optional parameters
+        [options["ignoreBoundary"]] True if polygon boundary should be ignored when determining if
+                                    the point is inside the polygon otherwise False.
+    :return: list with True for each point inside the polygon and False otherwise
+    """
+    if not isinstance(options, dict):
+        options = {}
+
+    ignore_boundary = options.get("ignoreBoundary", False)
+
+    if not isinstance(polygon, PreparedPolygon):
+        polygon = PreparedPolygon(polygon)
+
+    if isinstance(points, (dict, FeatureType)):
+        points = get_coords_from_features(points, ["Point", "MultiPoint"])
+
+        if get_input_dimensions(points) == 1:
+            points = [points]
+
+    xs, ys = coordinate_columns(points)
+
+    mask = [False] * len(xs)
+
+    west, south, east, north = polygon.bbox
+
+    # scanline order: candidate points sorted by latitude
+    order = sorted(
+        (
+            i
+            for i in range(len(xs))
+            if west <= xs[i] <= east and south <= ys[i] <= north
+        ),
+        key=ys.__getitem__,
+    )
+    sorted_xs = [xs[i] for i in order]
+    sorted_ys = [ys[i] for i in order]
+
+    for rings in polygon.polygons:
+        inside = classify_ring(rings[0], sorted_xs, sorted_ys, ignore_boundary)
+
+        for ring in rings[1:]:
+            in_hole = classify_ring(ring, sorted_xs, sorted_ys, not ignore_boundary)
+            inside = [
+                in_poly and not in_ring for in_poly, in_ring in zip(inside, in_hole)
+            ]
+
+        for i, in_poly in zip(order, inside):
+            if in_poly:
+                mask[i] = True
+
+    return mask
+
+
+def classify_ring(
+    ring, xs: Sequence, ys: Sequence, ignore_boundary: bool
+) -> List[bool]:
+    """
+    Checks which points are inside a ring, with the same semantics as `in_ring`.
+
+    :param ring: PreparedRing
+    :param xs: longitudes of the points, sorted by latitude
+    :param ys: latitudes of the points, in ascending order
+    :param ignore_boundary: True if the ring boundary should be ignored
+    :return: list with True for each point inside the ring, False otherwise
+    """
+    n_points = len(xs)
+    is_inside = bytearray(n_points)
+    on_boundary = bytearray(n_points)
+
+    for xi, yi, xj, yj in ring.edges:
+        if yi < yj:
+            start = bisect_left(ys, yi)
+            end = bisect_right(ys, yj)
+        else:
+            start = bisect_left(ys, yj)
+            end = bisect_right(ys, yi)
+
+        for k in range(start, end):
+            if on_boundary[k]:
+                continue
+
+            x = xs[k]
+            y = ys[k]
+
+            # orient2d, inlined: float determinant, exact one if its sign is uncertain
+            det_left = (xi - x) * (yj - y)
+            det_right = (yi - y) * (xj - x)
+            side = det_left - det_right
+
+            if abs(side) < ccw_error_bound * (abs(det_left) + abs(det_right)):
+                side = orient2d_exact(xi, yi, xj, yj, x, y)
+
+            if side == 0 and min(xi, xj) <= x <= max(xi, xj):
+                on_boundary[k] = 1
+
+            elif (yi > y) != (yj > y) and (side > 0) == (yj > yi):
+                is_inside[k] ^= 1
+
+    boundary_value = not ignore_boundary
+
+    return [
+        boundary_value if on_boundary[k] else bool(is_inside[k])
+        for k in range(n_points)
+    ]
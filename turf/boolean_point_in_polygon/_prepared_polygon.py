@@ -0,0 +1,213 @@
+from typing import Dict, List, Sequence, Tuple, Union
+
+from turf.helpers import Feature
+from turf.invariant import get_coords_from_features, get_geometry_type
+from turf.bbox import bbox as bounding_box
+from turf.utils.robust import ccw_error_bound, orient2d_exact
+
+valid_polygons = ["Polygon", "MultiPolygon"]
+
+
+class PreparedPolygon:
+    """
+    Polygon or MultiPolygon prepared for repeated point in polygon tests.
+
+    The input is validated once, and its bounding box, the bounding box of each ring and
+    an index of the ring edges in horizontal slabs are cached, so that each test only
+    looks at the edges crossing the slab of the point instead of every edge of the polygon.
+    """
+
+    __slots__ = ("bbox", "polygons")
+
+    def __init__(self, polygon: Union[Dict, Feature]) -> None:
+        polygon_coords = get_coords_from_features(polygon, valid_polygons)
+        geometry_type = get_geometry_type(polygon, valid_polygons)
+
+        self.bbox = bounding_box(polygon)
+
+        if isinstance(geometry_type, str):
+            geometry_type = [geometry_type]
+            polygon_coords = [polygon_coords]
+
+        self.polygons = []
+
+        for geo_type, poly_coords in zip(geometry_type, polygon_coords):
+            if geo_type == "Polygon":
+                poly_coords = [poly_coords]
+
+            for poly in poly_coords:
+                self.polygons.append([PreparedRing(ring) for ring in poly])
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.bbox})"
+
+    def contains(
+        self, point: Union[Sequence, Dict, Feature], ignore_boundary: bool = False
+    ) -> bool:
+        """
+        Checks if a point resides inside the polygon, with the same semantics as
+        `boolean_point_in_polygon`.
+
+        :param point: input Point Feature or [lng, lat] coordinates
+        :param ignore_boundary: True if polygon boundary should be ignored when determining if
+            the point is inside the polygon otherwise False.
+        :return: True if the Point is inside the Polygon; False otherwise
+        """
+        point_coords = get_coords_from_features(point, ["Point"])
+
+        return self.contains_coords(point_coords[0], point_coords[1], ignore_boundary)
+
+    def contains_coords(
+        self, x: float, y: float, ignore_boundary: bool = False
+    ) -> bool:
+        """
+        Same as `contains`, for unchecked point coordinates.
+
+        :param x: point longitude
+        :param y: point latitude
+        :param ignore_boundary: True if polygon boundary should be ignored
+        :return: True if the Point is inside the Polygon; False otherwise
+        """
+        bbox = self.bbox
+
+        if not (bbox[0] <= x <= bbox[2] and bbox[1] <= y <= bbox[3]):
+            return False
+
+        for rings in self.polygons:
+            # check if it is in the outer ring first
+            if rings[0].contains(x, y, ignore_boundary):
+                in_hole = False
+
+                for ring in rings[1:]:
+                    if ring.contains(x, y, not ignore_boundary):
+                        in_hole = True
+                        break
+
+                if not in_hole:
+                    return True
+
+        return False
+
+
+class PreparedRing:
+    """
+    Ring of a PreparedPolygon, with its edges indexed in horizontal slabs of equal height.
+    Each slab holds the edges whose latitude range overlaps it.
+    """
+
+    __slots__ = ("bbox", "edges", "bands", "band_height")
+
+    def __init__(self, ring: Sequence) -> None:
+        if ring[0][0] == ring[-1][0] and ring[0][1] == ring[-1][1]:
+            ring = ring[:-1]
+
+        # same edge order as `in_ring`: (ring[i], ring[i - 1])
+        self.edges = [
+            (ring[i][0], ring[i][1], ring[i - 1][0], ring[i - 1][1])
+            for i in range(len(ring))
+        ]
+
+        xs = [coord[0] for coord in ring]
+        ys = [coord[1] for coord in ring]
+
+        self.bbox = [min(xs), min(ys), max(xs), max(ys)]
+
+        self.bands, self.band_height = build_bands(self.edges, self.bbox)
+
+    def contains(self, x: float, y: float, ignore_boundary: bool) -> bool:
+        """
+        Checks if point is inside the ring, with the same semantics as `in_ring`.
+
+        :param x: point longitude
+        :param y: point latitude
+        :param ignore_boundary: True if the ring boundary should be ignored
+        :return: True if point is inside, False otherwise
+        """
+        bbox = self.bbox
+
+        if not (bbox[0] <= x <= bbox[2] and bbox[1] <= y <= bbox[3]):
+            return False
+
+        is_inside = False
+
+        band = band_index(y, bbox[1], self.band_height, len(self.bands))
+
+        for xi, yi, xj, yj in self.bands[band]:
+            if (yi > y and yj > y) or (yi < y and yj < y):
+                continue
+
+            # orient2d, inlined: float determinant, exact one if its sign is uncertain
+            det_left = (xi - x) * (yj - y)
+            det_right = (yi - y) * (xj - x)
+            side = det_left - det_right
+
+            if abs(side) < ccw_error_bound * (abs(det_left) + abs(det_right)):
+                side = orient2d_exact(xi, yi, xj, yj, x, y)
+
+            if side == 0 and min(xi, xj) <= x <= max(xi, xj):
+                return not ignore_boundary
+
+            if (yi > y) != (yj > y) and (side > 0) == (yj > yi):
+                is_inside = not is_inside
+
+        return is_inside
+
+
+def build_bands(edges: List[Tuple], bbox: List) -> Tuple[List[List[Tuple]], float]:
+    """
+    Distributes the edges of a ring over horizontal slabs.
+
+    Starts with as many slabs as edges, and halves that number while the index would
+    hold too many entries (i.e. the ring has many edges spanning several slabs).
+
+    :param edges: list of (xi, yi, xj, yj) edges
+    :param bbox: ring bounding box
+    :return: the slabs, as lists of edges, and the slab height
+    """
+    south = bbox[1]
+    height = bbox[3] - south
+
+    n_bands = max(1, len(edges)) if height > 0 else 1
+
+    while True:
+        band_height = height / n_bands
+
+        spans = [
+            (
+                band_index(min(yi, yj), south, band_height, n_bands),
+                band_index(max(yi, yj), south, band_height, n_bands),
+            )
+            for _, yi, _, yj in edges
+        ]
+
+        n_entries = sum(end - start + 1 for start, end in spans)
+
+        if n_bands == 1 or n_entries <= 4 * len(edges):
+            break
+
+        n_bands //= 2
+
+    bands = [[] for _ in range(n_bands)]
+
+    for edge, (start, end) in zip(edges, spans):
+        for band in range(start, end + 1):
+            bands[band].append(edge)
+
+    return bands, band_height
+
+
+def band_index(y: float, south: float, band_height: float, n_bands: int) -> int:
+    """
+    Slab holding a given latitude. Monotonic in y, so an edge spanning [y1, y2] is
+    always found in the slab of any latitude in that range.
+
+    :param y: latitude
+    :param south: southernmost latitude of the ring
+    :param band_height: slab height
+    :param n_bands: number of slabs
+    :return: slab index
+    """
+    if band_height <= 0:
+        return 0
+
+    return min(n_bands - 1, max(0, int((y - south) / band_height)))
@@ -1,8 +1,13 @@
 import pytest
 import os
+import random
 
-from turf.helpers import polygon, point
-from turf.boolean_point_in_polygon import boolean_point_in_polygon
+from turf.helpers import feature_collection, multi_point, polygon, point
+from turf.boolean_point_in_polygon import (
+    boolean_point_in_polygon,
+    points_in_polygon,
+    PreparedPolygon,
+)
 
 from turf.utils.error_codes import error_code_messages
 from turf.utils.exceptions import InvalidInput
@@ -46,8 +51,11 @@ class TestBooleanPointInPolygon:
     def test_boolean_point_in_polygon(self, fixture, points):
         poly = fixture["in"]
 
+        prepared = PreparedPolygon(poly)
+
         for pt, result in points:
             assert boolean_point_in_polygon(pt, poly) is result
+            assert boolean_point_in_polygon(pt, prepared) is result
 
     @pytest.mark.parametrize(
         "poly,point_in,point_out",
@@ -161,6 +169,18 @@ class TestBooleanPointInPolygon:
                 ],
                 id="poly-5",
             ),
+            pytest.param(
+                polygon([[[0.1, 0.1], [0.3, 0.3], [0.3, 0.1], [0.1, 0.1]]]),
+                [
+                    [
+                        point([0.2, 0.2]),
+                        lambda ignore_boundary: ignore_boundary is False,
+                    ],
+                    [point([0.2, 0.2 + 2**-54]), lambda ignore_boundary: False],
+                    [point([0.2, 0.2 - 2**-54]), lambda ignore_boundary: True],
+                ],
+                id="near-edge",
+            ),
         ],
     )
     @pytest.mark.parametrize(
@@ -173,8 +193,17 @@ class TestBooleanPointInPolygon:
     def test_boolean_point_in_polygon_boundary(self, boundary, poly, points):
         options = {"ignoreBoundary": boundary}
 
+        prepared = PreparedPolygon(poly)
+
         for pt, result in points:
             assert boolean_point_in_polygon(pt, poly, options) is result(boundary)
+            assert prepared.contains(pt, boundary) is result(boundary)
+
+        mask = points_in_polygon(
+            feature_collection([pt for pt, _ in points]), poly, options
+        )
+
+        assert mask == [result(boundary) for _, result in points]
 
     @pytest.mark.parametrize(
         "pt,poly,exception_value",
@@ -205,3 +234,108 @@ class TestBooleanPointInPolygon:
 
         assert excinfo.type == InvalidInput
         assert str(excinfo.value) == exception_value
+
+
+class TestPreparedPolygon:
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            pytest.param(fixture, id=fixture_name)
+            for fixture_name, fixture in fixtures.items()
+        ],
+    )
+    @pytest.mark.parametrize(
+        "boundary",
+        [
+            pytest.param(True, id="include-boundary"),
+            pytest.param(False, id="ignore-boundary"),
+        ],
+    )
+    def test_matches_boolean_point_in_polygon(self, fixture, boundary):
+        poly = fixture["in"]
+        prepared = PreparedPolygon(poly)
+        west, south, east, north = prepared.bbox
+
+        rng = random.Random(0)
+        vertices = [
+            [edge[0], edge[1]]
+            for rings in prepared.polygons
+            for ring in rings
+            for edge in ring.edges
+        ]
+        candidates = [
+            [rng.uniform(west, east), rng.uniform(south, north)] for _ in range(500)
+        ] + vertices
+
+        for pt in candidates:
+            assert prepared.contains(pt, boundary) is boolean_point_in_polygon(
+                pt, poly, {"ignoreBoundary": boundary}
+            )
+
+    def test_exception(self):
+        with pytest.raises(Exception) as excinfo:
+            PreparedPolygon(point([0, 1]))
+
+        assert excinfo.type == InvalidInput
+        assert str(excinfo.value) == error_code_messages["InvalidGeometry"](
+            ["Polygon", "MultiPolygon"]
+        )
+
+
+class TestPointsInPolygon:
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            pytest.param(fixture, id=fixture_name)
+            for fixture_name, fixture in fixtures.items()
+        ],
+    )
+    @pytest.mark.parametrize(
+        "boundary",
+        [
+            pytest.param(True, id="include-boundary"),
+            pytest.param(False, id="ignore-boundary"),
+        ],
+    )
+    def test_matches_boolean_point_in_polygon(self, fixture, boundary):
+        poly = fixture["in"]
+        prepared = PreparedPolygon(poly)
+        west, south, east, north = prepared.bbox
+
+        rng = random.Random(1)
+        candidates = [
+            [rng.uniform(west - 0.01, east + 0.01), rng.uniform(south - 0.01, north)]
+            for _ in range(1000)
+        ] + [
+            [edge[0], edge[1]]
+            for rings in prepared.polygons
+            for ring in rings
+            for edge in ring.edges
+        ]
+
+        options = {"ignoreBoundary": boundary}
+
+        assert points_in_polygon(candidates, poly, options) == [
+            boolean_point_in_polygon(pt, poly, options) for pt in candidates
+        ]
+
+    @pytest.mark.parametrize(
+        "points,expected",
+        [
+            pytest.param(
+                [[50, 50], [140, 150], [0, 0]], [True, False, True], id="positions"
+            ),
+            pytest.param(
+                multi_point([[50, 50], [140, 150], [0, 0]]),
+                [True, False, True],
+                id="multi_point",
+            ),
+            pytest.param(point([140, 150]), [False], id="point"),
+            pytest.param([], [], id="empty"),
+        ],
+    )
+    def test_input_types(self, points, expected):
+        poly = polygon([[[0, 0], [0, 100], [100, 100], [100, 0], [0, 0]]])
+
+        assert points_in_polygon(points, poly) == expected
+        assert points_in_polygon(points, PreparedPolygon(poly)) == expected
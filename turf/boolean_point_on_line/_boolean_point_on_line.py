@@ -1,14 +1,9 @@
 from typing import Dict, List, Sequence, TypeVar, Union
-from decimal import Decimal, getcontext
-from math import sqrt
 
 from turf.helpers import Feature, LineString, Point
 from turf.helpers import feature_collection, line_string, multi_line_string
 from turf.invariant import get_coords_from_features
-
-
-ctx = getcontext()
-ctx.prec = 28
+from turf.utils.robust import on_segment
 
 PointFeature = TypeVar("PointFeature", Dict, Feature, Point)
 LineFeature = TypeVar("LineFeature", Dict, Feature, LineString)
@@ -64,30 +59,21 @@ def point_on_segment(
     point: List, segment_start: List, segment_end: List, epsilon: float = 1.0e-14
 ) -> bool:
     """
-    Checks if a given point is on a line or not.
-
-    Since this is a comparison of floats, I use the Decimal module of python
-
+    Checks if a given point is on a line segment or not, with an exact orientation test
+    (see `turf.utils.robust`).
 
     :param point: Coordinates of a point
     :param segment_start: Coordinates of the start line
     :param segment_end: Coordinates of the line end
+    :param epsilon: ignored, kept for compatibility: the test is exact and no longer
+        compares lengths within a tolerance
     :return: bool
     """
-
-    len_segment = Decimal(
-        sqrt(
-            pow(segment_end[0] - segment_start[0], 2)
-            + pow(segment_end[1] - segment_start[1], 2)
-        )
+    return on_segment(
+        point[0],
+        point[1],
+        segment_start[0],
+        segment_start[1],
+        segment_end[0],
+        segment_end[1],
     )
-
-    len_point_seg_1 = Decimal(
-        sqrt(pow(point[0] - segment_start[0], 2) + pow(point[1] - segment_start[1], 2))
-    )
-
-    len_point_seg_2 = Decimal(
-        sqrt(pow(segment_end[0] - point[0], 2) + pow(segment_end[1] - point[1], 2))
-    )
-
-    return abs(len_segment - len_point_seg_1 - len_point_seg_2) <= epsilon
@@ -1,12 +1,15 @@
 from collections import defaultdict
+from fractions import Fraction
 import pytest
 import os
 
 from turf.boolean_point_on_line import boolean_point_on_line
+from turf.boolean_point_on_line._boolean_point_on_line import point_on_segment
 from turf.helpers import feature, feature_collection, point, line_string
 from turf.helpers._features import all_geometry_types
 from turf.utils.error_codes import error_code_messages
 from turf.utils.exceptions import InvalidInput
+from turf.utils.robust import on_segment, orient2d
 from turf.utils.test_setup import get_fixtures
 
 current_path = os.path.dirname(os.path.realpath(__file__))
@@ -41,3 +44,55 @@ class TestBooleanPointOnLine:
         test_result = boolean_point_on_line(point, line, options)
 
         assert test_result == expected_result
+
+    @pytest.mark.parametrize(
+        "pt,expected",
+        [
+            pytest.param([0.2, 0.2], True, id="on-segment"),
+            pytest.param([0.2, 0.2 + 2**-54], False, id="one-ulp-off"),
+            pytest.param([0.1, 0.1], True, id="vertex"),
+            pytest.param([0.4, 0.4], False, id="collinear-outside"),
+        ],
+    )
+    def test_exact_predicate(self, pt, expected):
+        line = line_string([[0.1, 0.1], [0.3, 0.3], [0.3, 1]])
+
+        assert boolean_point_on_line(point(pt), line) == expected
+
+
+def exact_sign(ax, ay, bx, by, cx, cy):
+    ax, ay, bx, by, cx, cy = map(Fraction, (ax, ay, bx, by, cx, cy))
+    det = (ax - cx) * (by - cy) - (ay - cy) * (bx - cx)
+
+    return (det > 0) - (det < 0)
+
+
+class TestRobustPredicates:
+    def test_orient2d(self):
+        assert orient2d(0, 0, 1, 0, 0, 1) > 0
+        assert orient2d(0, 0, 1, 0, 0, -1) < 0
+        assert orient2d(0, 0, 1, 1, 2, 2) == 0
+
+    def test_orient2d_near_degenerate(self):
+        # points around (0.5, 0.5), close to the line through (12, 12) and (24, 24),
+        # where the float determinant often has the wrong sign
+        for i in range(64):
+            for j in range(64):
+                cx = 0.5 + i * 2**-53
+                cy = 0.5 + j * 2**-53
+
+                side = orient2d(12, 12, 24, 24, cx, cy)
+
+                assert (side > 0) - (side < 0) == exact_sign(12, 12, 24, 24, cx, cy)
+
+    def test_on_segment(self):
+        assert on_segment(0.5, 0.5, 0, 0, 1, 1)
+        assert on_segment(0, 0, 0, 0, 1, 1)
+        assert on_segment(1, 1, 1, 1, 1, 1)
+        assert not on_segment(2, 2, 0, 0, 1, 1)
+        assert not on_segment(0.5, 0.5 + 2**-53, 0, 0, 1, 1)
+
+    def test_point_on_segment_epsilon(self):
+        # the epsilon keyword is still accepted, and ignored
+        assert point_on_segment([0.5, 0.5], [0, 0], [1, 1], epsilon=0.1)
+        assert not point_on_segment([0.5, 0.5 + 2**-53], [0, 0], [1, 1], epsilon=0.1)
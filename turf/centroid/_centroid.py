@@ -1,8 +1,8 @@
 from functools import reduce
 
-from turf.helpers import point
+from turf.helpers import ColumnarFeatureCollection, point
 from turf.invariant import get_coords_from_features
-from turf.utils.helpers import get_input_dimensions
+from turf.utils.helpers import coordinate_columns, get_input_dimensions
 
 
 def centroid(features, options=None):
@@ -10,7 +10,7 @@ def centroid(features, options=None):
     Takes one or more features and calculates the centroid using the mean of all vertices.
     This lessens the effect of small islands and artifacts when calculating the centroid of a set of polygons.
 
-    :param features: GeoJSON features to be centered
+    :param features: GeoJSON features to be centered, or a ColumnarFeatureCollection
     :param options: optional parameters
         [options["properties"]={}] Translate GeoJSON Properties to Point
     :return: a Point feature corresponding to the centroid of the input features
@@ -19,6 +19,9 @@ def centroid(features, options=None):
     if not options:
         options = {}
 
+    if isinstance(features, ColumnarFeatureCollection):
+        return columnar_centroid(features, options)
+
     coords = get_coords_from_features(features)
 
     if get_input_dimensions(coords) == 1:
@@ -40,3 +43,30 @@ def reduce_coords(sum_array, coords):
         return reduce(lambda prev, coord: reduce_coords(prev, coord), coords, sum_array)
 
     return [sum_array[0] + coords[0], sum_array[1] + coords[1], sum_array[2] + 1]
+
+
+def columnar_centroid(collection, options):
+    """
+    Centroid of a ColumnarFeatureCollection, the mean of its coordinate columns.
+
+    :param collection: ColumnarFeatureCollection
+    :param options: optional parameters
+        [options["properties"]={}] Translate GeoJSON Properties to Point
+    :return: a Point feature corresponding to the centroid of the input features
+    """
+
+    lngs, lats = coordinate_columns(collection.coords)
+
+    x_sum = 0
+    y_sum = 0
+
+    # summed one by one, in the same order as `reduce_coords`
+    for x in lngs:
+        x_sum += x
+
+    for y in lats:
+        y_sum += y
+
+    length = len(lngs)
+
+    return point([x_sum / length, y_sum / length], options.get("properties", None))
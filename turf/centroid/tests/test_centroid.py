@@ -2,6 +2,7 @@ import pytest
 import os
 
 from turf.centroid import centroid
+from turf.helpers import ColumnarFeatureCollection, all_geometry_types
 
 from turf.utils.error_codes import error_code_messages
 from turf.utils.exceptions import InvalidInput
@@ -12,6 +13,27 @@ current_path = os.path.dirname(os.path.realpath(__file__))
 fixtures = get_fixtures(current_path)
 
 
+def as_feature_collection(geojson):
+    """
+    Wraps a fixture in a FeatureCollection, or returns None if it can't be stored columnar.
+    """
+    if not isinstance(geojson, dict):
+        return None
+
+    if geojson.get("type") in all_geometry_types:
+        geojson = {"type": "Feature", "properties": {}, "geometry": geojson}
+
+    if geojson.get("type") == "Feature":
+        geojson = {"type": "FeatureCollection", "features": [geojson]}
+
+    try:
+        ColumnarFeatureCollection.from_geojson(geojson)
+    except InvalidInput:
+        return None
+
+    return geojson
+
+
 class TestCentroid:
     allowed_types = [
         "Point",
@@ -34,6 +56,21 @@ class TestCentroid:
 
         assert centroid(fixture["in"], options) == fixture["out"]
 
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            pytest.param(fixture, id=fixture_name)
+            for fixture_name, fixture in fixtures.items()
+            if as_feature_collection(fixture["in"])
+        ],
+    )
+    def test_columnar(self, fixture):
+        collection = as_feature_collection(fixture["in"])
+        columnar = ColumnarFeatureCollection.from_geojson(collection)
+        options = {"properties": {"foo": "bar"}}
+
+        assert centroid(columnar, options) == centroid(collection, options)
+
     @pytest.mark.parametrize(
         "input_value, exception_value",
         [
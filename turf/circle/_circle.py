@@ -1,36 +1,16 @@
-from functools import reduce
 from typing import TypeVar, Dict, List
 
-from turf import destination, polygon, Polygon
+from turf.helpers import length_to_radians, polygon, Polygon
 from turf.invariant import get_coords_from_features
+from turf.kernels import check_degrees, destination
 from turf.utils.error_codes import error_code_messages
 from turf.utils.exceptions import InvalidInput
-
+from turf.utils.helpers import truncate
 
 Center = TypeVar("Center", List, Dict, Polygon)
 Radius = TypeVar("Radius", int, float)
 
 
-def add_coordinates(coords, center, radius, bearing, options):
-    """
-    Helper method for the reducing function. Computes a new coordinate by moving from the
-    center point in a given bearing direction for a specified radius and adds it to the list of coordinates.
-
-    :param coords: List of coordinates forming the polygon.
-    :param center: Coordinates of the center point.
-    :param radius: Radius of the circle.
-    :param bearing: Bearing angle in degrees.
-    :param options: Additional options, such as units of measurement.
-    :return: Updated list of coordinates with the new computed point.
-    """
-    return [
-        *coords,
-        destination(center, radius, bearing, options=options)
-        .get("geometry")
-        .get("coordinates"),
-    ]
-
-
 def circle(center: Center, radius: Radius, options: Dict = None):
     """
     Generates a circular polygon around a given center point with a specified radius.
@@ -65,17 +45,23 @@ def circle(center: Center, radius: Radius, options: Dict = None):
         )
     )
 
+    kwargs = {}
+    if "units" in options:
+        kwargs["units"] = options["units"]
+
     steps = options.get("steps")
 
-    bearings = map(lambda i: i * -360 / steps, range(steps))
+    check_degrees(valid_center[0], valid_center[1])
 
-    coordinates = reduce(
-        lambda coords, bearing: add_coordinates(
-            coords, valid_center, radius, bearing, options
-        ),
-        bearings,
-        [],
-    )
+    radians = length_to_radians(radius, **kwargs)
+
+    coordinates = []
+
+    for i in range(steps):
+        lng, lat = destination(
+            valid_center[0], valid_center[1], radians, i * -360 / steps
+        )
+        coordinates.append([truncate(lng, 6), truncate(lat, 6)])
 
     coordinates.append(coordinates[0])
 
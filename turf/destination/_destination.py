@@ -1,12 +1,6 @@
-from math import asin, atan2, cos, sin
-
-from turf.helpers import (
-    degrees_to_radians,
-    length_to_radians,
-    radians_to_degrees,
-    point,
-)
+from turf.helpers import length_to_radians, point
 from turf.invariant import get_coords_from_features
+from turf.kernels import check_degrees, destination as destination_kernel
 from turf.utils.helpers import truncate
 
 
@@ -34,23 +28,10 @@ def destination(origin, distance, bearing, options=None):
 
     coords = get_coords_from_features(origin, ["Point"])
 
-    longitude1 = degrees_to_radians(coords[0])
-    latitude1 = degrees_to_radians(coords[1])
-    bearing_rads = degrees_to_radians(bearing)
+    check_degrees(coords[0], coords[1], bearing)
 
     radians = length_to_radians(distance, **kwargs)
 
-    latitude2 = asin(
-        sin(latitude1) * cos(radians)
-        + cos(latitude1) * sin(radians) * cos(bearing_rads)
-    )
+    lng, lat = destination_kernel(coords[0], coords[1], radians, bearing)
 
-    longitude2 = longitude1 + atan2(
-        sin(bearing_rads) * sin(radians) * cos(latitude1),
-        cos(radians) - sin(latitude1) * sin(latitude2),
-    )
-
-    lng = truncate(radians_to_degrees(longitude2), 6)
-    lat = truncate(radians_to_degrees(latitude2), 6)
-
-    return point([lng, lat], options.get("properties", None))
+    return point([truncate(lng, 6), truncate(lat, 6)], options.get("properties", None))
@@ -1 +1 @@
-from turf.distance._distance import distance
+from turf.distance._distance import distance, distance_many
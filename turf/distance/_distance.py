@@ -1,7 +1,12 @@
+from array import array
 from math import atan2, cos, sin, sqrt
 
-from turf.helpers import degrees_to_radians, radians_to_length
+from turf.helpers import radians_to_length
 from turf.invariant import get_coords_from_features
+from turf.kernels import haversine
+from turf.utils.error_codes import error_code_messages
+from turf.utils.exceptions import InvalidInput
+from turf.utils.helpers import coordinate_columns
 
 
 def distance(start, end, options=None):
@@ -22,13 +27,9 @@ def distance(start, end, options=None):
     coordinates1 = get_coords_from_features(start, ["Point"])
     coordinates2 = get_coords_from_features(end, ["Point"])
 
-    d_lat = degrees_to_radians(coordinates2[1] - coordinates1[1])
-    d_lon = degrees_to_radians(coordinates2[0] - coordinates1[0])
-
-    lat1 = degrees_to_radians(coordinates1[1])
-    lat2 = degrees_to_radians(coordinates2[1])
-
-    distance_rad = calculate_radians_distance(d_lon, d_lat, lat1, lat2)
+    distance_rad = haversine(
+        coordinates1[0], coordinates1[1], coordinates2[0], coordinates2[1]
+    )
 
     return radians_to_length(distance_rad, **kwargs)
 
@@ -52,3 +53,37 @@ def calculate_radians_distance(dif_lon, dif_lat, lat1, lat2):
     d = 2 * atan2(sqrt(d), sqrt(1 - d))
 
     return d
+
+
+def distance_many(starts, ends, options=None):
+    """
+    Calculates the distance between each pair of points of two equally sized batches,
+    evaluating the Haversine formula over the whole batch at once. Validation of the
+    individual points is skipped, which makes it suitable for millions of pairs.
+
+    :param starts: starting points, as a sequence of [lng, lat] positions or a buffer
+        of interleaved lng, lat doubles (e.g. array("d"))
+    :param ends: ending points, in the same format as starts
+    :param options: dictionary with units as an attribute. Can be degrees, radians, miles, or kilometers
+    :return: array("d") with the distance between starts[i] and ends[i]
+    """
+
+    kwargs = {}
+    if isinstance(options, dict) and "units" in options:
+        kwargs.update({"units": options.get("units")})
+
+    factor = radians_to_length(1, **kwargs)
+
+    lngs1, lats1 = coordinate_columns(starts)
+    lngs2, lats2 = coordinate_columns(ends)
+
+    if len(lngs1) != len(lngs2):
+        raise InvalidInput(error_code_messages["InvalidPairedInput"])
+
+    return array(
+        "d",
+        [
+            haversine(lng1, lat1, lng2, lat2) * factor
+            for lng1, lat1, lng2, lat2 in zip(lngs1, lats1, lngs2, lats2)
+        ],
+    )
@@ -1,10 +1,12 @@
+from array import array
+
 import pytest
 
 from turf import point
 from turf.utils.exceptions import InvalidInput
 from turf.utils.error_codes import error_code_messages
 from turf.distance.tests.fixture import fixture, expected_results
-from turf.distance import distance
+from turf.distance import distance, distance_many
 
 
 class TestDistance:
@@ -37,3 +39,75 @@ class TestDistance:
 
         assert excinfo.type == InvalidInput
         assert str(excinfo.value) == error_code_messages["InvalidUnits"](wrong_units)
+
+
+class TestDistanceMany:
+    starts = [[-75.343, 39.984], [-180, -90], [0, 0], [120.5, -33.2]]
+    ends = [[-75.534, 39.123], [180, -90], [10, 10], [-60.1, 33.9]]
+
+    @pytest.mark.parametrize(
+        "units",
+        [
+            pytest.param("miles", id="miles"),
+            pytest.param("kilometers", id="kilometers"),
+            pytest.param("radians", id="radians"),
+            pytest.param("degrees", id="degrees"),
+        ],
+    )
+    def test_distance_many(self, units):
+        options = {"units": units}
+
+        result = distance_many(self.starts, self.ends, options)
+
+        assert isinstance(result, array)
+        assert list(result) == pytest.approx(
+            [distance(s, e, options) for s, e in zip(self.starts, self.ends)]
+        )
+
+    def test_buffer_input(self):
+        starts = array("d", [c for coord in self.starts for c in coord])
+        ends = array("d", [c for coord in self.ends for c in coord])
+
+        assert list(distance_many(starts, ends.tobytes())) == list(
+            distance_many(self.starts, self.ends)
+        )
+
+    @pytest.mark.parametrize(
+        "starts,ends,options,exception_value",
+        [
+            pytest.param(
+                [[0, 0], [1, 1]],
+                [[0, 0]],
+                None,
+                error_code_messages["InvalidPairedInput"],
+                id="InvalidPairedInput",
+            ),
+            pytest.param(
+                array("d", [0, 0, 1]),
+                array("d", [0, 0, 1]),
+                None,
+                error_code_messages["InvalidCoordinatesBuffer"],
+                id="InvalidCoordinatesBuffer-odd",
+            ),
+            pytest.param(
+                array("i", [0, 0]),
+                array("i", [0, 0]),
+                None,
+                error_code_messages["InvalidCoordinatesBuffer"],
+                id="InvalidCoordinatesBuffer-format",
+            ),
+            pytest.param(
+                [[0, 0]],
+                [[1, 1]],
+                {"units": "foo"},
+                error_code_messages["InvalidUnits"]("foo"),
+                id="InvalidUnits",
+            ),
+        ],
+    )
+    def test_exception(self, starts, ends, options, exception_value):
+        with pytest.raises(Exception) as excinfo:
+            distance_many(starts, ends, options)
+
+        assert excinfo.type == InvalidInput
+        assert str(excinfo.value) == exception_value
@@ -0,0 +1 @@
+from turf.distance_matrix._distance_matrix import distance_matrix
@@ -0,0 +1,238 @@
+from array import array
+from heapq import nsmallest
+import mmap
+from typing import Dict, List, Sequence, Tuple, Union
+
+from turf.helpers import FeatureType, Geometry, get_input_dimensions, radians_to_length
+from turf.invariant import get_coords_from_features
+from turf.kernels import haversine_row, latitude_cosine
+from turf.utils.error_codes import error_code_messages
+from turf.utils.exceptions import InvalidInput
+from turf.utils.helpers import coordinate_columns
+
+output_types = ["dense", "memmap", "top_k"]
+
+
+def distance_matrix(
+    origins: Union[Sequence, Dict, FeatureType],
+    destinations: Union[Sequence, Dict, FeatureType],
+    options: Dict = None,
+) -> Union[memoryview, List[List[Tuple[int, float]]]]:
+    """
+    Calculates the Haversine distance between every origin and every destination.
+    The matrix is computed in tiles of `chunk_size` origins by as many destinations as fit
+    in `max_memory`, so the working set stays bounded regardless of the input sizes.
+
+    :param origins: origin points, as a Point FeatureCollection, a sequence of [lng, lat]
+        positions or a buffer of interleaved lng, lat doubles. A single Point (Feature,
+        geometry or position) gives a matrix with a single row.
+    :param destinations: destination points, in any of the formats accepted for origins
+    :param options: optional parameters
+        [options["units"]="kilometers"] can be degrees, radians, miles, or kilometers
+        [options["chunk_size"]=1024] number of origins per tile
+        [options["max_memory"]=67108864] maximum size in bytes of a tile of distances
+        [options["output"]="dense"] one of:
+            "dense": the whole matrix is kept in memory
+            "memmap": the matrix is written to the file in options["path"]
+            "top_k": only the options["k"] nearest destinations of each origin are kept
+        [options["path"]] file backing the matrix when options["output"] is "memmap"
+        [options["k"]=1] number of destinations kept per origin when options["output"] is "top_k"
+    :return: for "dense" and "memmap" outputs, a 2 dimensional memoryview of doubles
+        where matrix[i, j] is the distance from origin i to destination j.
+        For "top_k", a list with, for every origin, the (destination index, distance)
+        pairs of its k nearest destinations sorted by distance.
+    """
+
+    if not isinstance(options, dict):
+        options = {}
+
+    kwargs = {}
+    if "units" in options:
+        kwargs["units"] = options["units"]
+
+    factor = radians_to_length(1, **kwargs)
+
+    chunk_size = options.get("chunk_size", 1024)
+    max_memory = options.get("max_memory", 64 * 2**20)
+    output = options.get("output", "dense")
+
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise InvalidInput(
+            error_code_messages["InvalidOption"]("chunk_size", chunk_size)
+        )
+
+    if not isinstance(max_memory, int) or max_memory < 8:
+        raise InvalidInput(
+            error_code_messages["InvalidOption"]("max_memory", max_memory)
+        )
+
+    if output not in output_types:
+        raise InvalidInput(error_code_messages["InvalidOption"]("output", output))
+
+    origin_lngs, origin_lats = coordinate_columns(get_positions(origins))
+    dest_lngs, dest_lats = coordinate_columns(get_positions(destinations))
+
+    n_rows = len(origin_lngs)
+    n_cols = len(dest_lngs)
+
+    dest_cosines = array("d", [latitude_cosine(lat) for lat in dest_lats])
+
+    # number of destinations per tile, so that a tile never exceeds max_memory
+    cols_per_tile = max(
+        1, min(n_cols, max_memory // (8 * min(chunk_size, n_rows or 1)))
+    )
+
+    tiles = iter_tiles(
+        origin_lngs,
+        origin_lats,
+        dest_lngs,
+        dest_lats,
+        dest_cosines,
+        factor,
+        chunk_size,
+        cols_per_tile,
+    )
+
+    if output == "top_k":
+        return reduce_top_k(tiles, n_rows, options.get("k", 1))
+
+    if output == "memmap":
+        if "path" not in options:
+            raise InvalidInput(error_code_messages["InvalidOption"]("path", None))
+
+        buffer = create_memmap(options["path"], n_rows * n_cols * 8)
+    else:
+        buffer = bytearray(n_rows * n_cols * 8)
+
+    flat = memoryview(buffer).cast("d")
+
+    for row_start, col_start, rows in tiles:
+        for i, row in enumerate(rows, row_start):
+            offset = i * n_cols + col_start
+            flat[offset : offset + len(row)] = row
+
+    if isinstance(buffer, mmap.mmap):
+        buffer.flush()
+
+    # memoryviews can't have zeros in their shape, empty matrices are returned flat
+    if not len(flat):
+        return flat
+
+    return memoryview(buffer).cast("d", shape=[n_rows, n_cols])
+
+
+def get_positions(points: Union[Sequence, Dict, FeatureType, Geometry]) -> Sequence:
+    """
+    Extracts the positions of Point features or geometries, otherwise returns the input
+    untouched.
+
+    :param points: Point FeatureCollection, Feature or geometry, or a list of them, sequence
+        of [lng, lat] positions, single position or buffer
+    :return: sequence of [lng, lat] positions or buffer
+    """
+    if isinstance(points, (list, tuple)):
+        if not points or type(points[0]) in (list, tuple):
+            return points
+    elif not isinstance(points, (dict, FeatureType, Geometry)):
+        return points
+
+    coords = get_coords_from_features(points, ["Point"])
+
+    if get_input_dimensions(coords) == 1:
+        # a single point
+        return [coords]
+
+    return coords
+
+
+def iter_tiles(
+    origin_lngs: Sequence,
+    origin_lats: Sequence,
+    dest_lngs: Sequence,
+    dest_lats: Sequence,
+    dest_cosines: Sequence,
+    factor: float,
+    chunk_size: int,
+    cols_per_tile: int,
+):
+    """
+    Yields the distance matrix tile by tile, row blocks first.
+
+    :return: generator of (first row index, first column index, list of row arrays)
+    """
+    n_rows = len(origin_lngs)
+    n_cols = len(dest_lngs)
+
+    for row_start in range(0, n_rows, chunk_size):
+        row_end = min(row_start + chunk_size, n_rows)
+
+        for col_start in range(0, n_cols, cols_per_tile):
+            col_end = min(col_start + cols_per_tile, n_cols)
+
+            destinations = list(
+                zip(
+                    dest_lngs[col_start:col_end],
+                    dest_lats[col_start:col_end],
+                    dest_cosines[col_start:col_end],
+                )
+            )
+
+            rows = [
+                distance_row(origin_lngs[i], origin_lats[i], destinations, factor)
+                for i in range(row_start, row_end)
+            ]
+
+            yield row_start, col_start, rows
+
+
+def distance_row(lng1: float, lat1: float, destinations: List, factor: float) -> array:
+    """
+    Haversine distances from one origin to a block of destinations.
+
+    :param lng1: origin longitude
+    :param lat1: origin latitude
+    :param destinations: list of (lng, lat, cos(lat)) destination tuples
+    :param factor: conversion factor from radians to the output units
+    :return: array("d") of distances
+    """
+    return array("d", haversine_row(lng1, lat1, destinations, factor))
+
+
+def reduce_top_k(tiles, n_rows: int, k: int) -> List[List[Tuple[int, float]]]:
+    """
+    Keeps the k nearest destinations of every origin while consuming the tiles.
+
+    :param tiles: generator of tiles as returned by `iter_tiles`
+    :param n_rows: number of origins
+    :param k: number of destinations to keep per origin
+    :return: list of (destination index, distance) pairs per origin
+    """
+    if not isinstance(k, int) or k < 1:
+        raise InvalidInput(error_code_messages["InvalidOption"]("k", k))
+
+    nearest = [[] for _ in range(n_rows)]
+
+    for row_start, col_start, rows in tiles:
+        for i, row in enumerate(rows, row_start):
+            nearest[i] = nsmallest(
+                k, [*nearest[i], *zip(row, range(col_start, col_start + len(row)))]
+            )
+
+    return [[(j, d) for d, j in row] for row in nearest]
+
+
+def create_memmap(path: str, size: int) -> Union[mmap.mmap, bytearray]:
+    """
+    Creates (or truncates) a file of the given size and maps it into memory.
+
+    :param path: file path
+    :param size: size of the file in bytes
+    :return: writable memory map of the file
+    """
+    with open(path, "w+b") as f:
+        f.truncate(size)
+
+        if not size:
+            return bytearray()
+
+        return mmap.mmap(f.fileno(), size)
@@ -0,0 +1,129 @@
+import pytest
+
+from turf.distance import distance
+from turf.distance_matrix import distance_matrix
+from turf.helpers import line_string, point, points
+
+from turf.utils.error_codes import error_code_messages
+from turf.utils.exceptions import InvalidInput
+
+origins = [[-75.343, 39.984], [-75.534, 39.123], [0, 0], [120.5, -33.2]]
+destinations = [[10, 10], [-60.1, 33.9], [-75.343, 39.984]]
+
+
+class TestDistanceMatrix:
+    @pytest.mark.parametrize(
+        "options",
+        [
+            pytest.param({}, id="single-tile"),
+            pytest.param({"chunk_size": 1, "max_memory": 8}, id="one-cell-tiles"),
+            pytest.param({"chunk_size": 3, "max_memory": 48}, id="ragged-tiles"),
+            pytest.param({"units": "miles"}, id="miles"),
+        ],
+    )
+    def test_distance_matrix(self, options):
+        result = distance_matrix(origins, destinations, options)
+
+        assert result.shape == (len(origins), len(destinations))
+        assert result.tolist() == [
+            [distance(origin, destination, options) for destination in destinations]
+            for origin in origins
+        ]
+
+    def test_feature_collection_input(self):
+        result = distance_matrix(points(origins), points(destinations))
+
+        assert result.tolist() == distance_matrix(origins, destinations).tolist()
+
+    @pytest.mark.parametrize(
+        "origin",
+        [
+            pytest.param(point(origins[0]), id="feature"),
+            pytest.param(point(origins[0])["geometry"], id="geometry"),
+            pytest.param(point(origins[0], as_geojson=False), id="object"),
+            pytest.param(origins[0], id="position"),
+            pytest.param([point(origins[0])], id="feature-list"),
+        ],
+    )
+    def test_single_point_input(self, origin):
+        result = distance_matrix(origin, destinations)
+
+        assert result.tolist() == distance_matrix(origins[:1], destinations).tolist()
+
+    def test_invalid_point_input(self):
+        with pytest.raises(InvalidInput):
+            distance_matrix(line_string(origins), destinations)
+
+    def test_memmap(self, tmp_path):
+        path = tmp_path / "matrix.bin"
+
+        result = distance_matrix(
+            origins,
+            destinations,
+            {"output": "memmap", "path": str(path), "max_memory": 16},
+        )
+
+        assert result.tolist() == distance_matrix(origins, destinations).tolist()
+        assert path.stat().st_size == len(origins) * len(destinations) * 8
+
+    @pytest.mark.parametrize(
+        "k",
+        [
+            pytest.param(1, id="k=1"),
+            pytest.param(2, id="k=2"),
+            pytest.param(5, id="k>n"),
+        ],
+    )
+    def test_top_k(self, k):
+        result = distance_matrix(
+            origins,
+            destinations,
+            {"output": "top_k", "k": k, "chunk_size": 2, "max_memory": 16},
+        )
+
+        expected = [
+            sorted(
+                enumerate(distance(origin, dest) for dest in destinations),
+                key=lambda item: item[1],
+            )[:k]
+            for origin in origins
+        ]
+
+        assert result == expected
+
+    @pytest.mark.parametrize(
+        "options,exception_value",
+        [
+            pytest.param(
+                {"output": "sparse"},
+                error_code_messages["InvalidOption"]("output", "sparse"),
+                id="InvalidOutput",
+            ),
+            pytest.param(
+                {"output": "memmap"},
+                error_code_messages["InvalidOption"]("path", None),
+                id="MissingPath",
+            ),
+            pytest.param(
+                {"chunk_size": 0},
+                error_code_messages["InvalidOption"]("chunk_size", 0),
+                id="InvalidChunkSize",
+            ),
+            pytest.param(
+                {"output": "top_k", "k": 0},
+                error_code_messages["InvalidOption"]("k", 0),
+                id="InvalidK",
+            ),
+            pytest.param(
+                {"units": "foo"},
+                error_code_messages["InvalidUnits"]("foo"),
+                id="InvalidUnits",
+            ),
+        ],
+    )
+    def test_exception(self, options, exception_value):
+        with pytest.raises(Exception) as excinfo:
+            distance_matrix(origins, destinations, options)
+
+        assert excinfo.type == InvalidInput
+        assert str(excinfo.value) == exception_value
@@ -1,25 +1,33 @@
-from typing import Dict, List, Sequence, TypeVar
+from array import array
+from typing import Dict, List, Sequence, TypeVar, Union
 
 from turf.invariant import get_coords_from_features, get_coords_from_geometry
 
 from turf.helpers import feature_collection, point
-from turf.helpers import Feature, FeatureCollection, Geometry
+from turf.helpers import ColumnarFeatureCollection, Feature, FeatureCollection, Geometry
 
 from turf.utils.helpers import get_input_dimensions
 from turf.utils.error_codes import error_code_messages
 from turf.utils.exceptions import InvalidInput
 from turf.helpers._features import all_geometry_types
+from turf.helpers._columnar import geometry_type_codes
 
 GeoJson = TypeVar("GeoJson", Dict, Feature, FeatureCollection, Geometry)
 
 
-def explode(features: GeoJson) -> FeatureCollection:
+def explode(
+    features: Union[GeoJson, ColumnarFeatureCollection],
+) -> Union[FeatureCollection, ColumnarFeatureCollection]:
     """
     Takes a feature or set of features and returns all positions as {Point|points}.
 
-    :param features: any GeoJSON feature or feature collection
-    :return: {FeatureCollection} points representing the exploded input features
+    :param features: any GeoJSON feature or feature collection, or a ColumnarFeatureCollection
+    :return: {FeatureCollection} points representing the exploded input features,
+        as a ColumnarFeatureCollection if the input is columnar
     """
+    if isinstance(features, ColumnarFeatureCollection):
+        return columnar_explode(features)
+
     points = []
 
     try:
@@ -66,3 +74,32 @@ def reduce_coordinates_to_points(
     points = [point(coord, properties) for coord in coords]
 
     return points
+
+
+def columnar_explode(
+    collection: ColumnarFeatureCollection,
+) -> ColumnarFeatureCollection:
+    """
+    Explodes a ColumnarFeatureCollection into a columnar collection of Points. The coordinates
+    are copied as is, and each point gets the properties of the feature it comes from.
+
+    :param collection: ColumnarFeatureCollection
+    :return: {ColumnarFeatureCollection} points representing the exploded input features
+    """
+    # index of the source feature of every coordinate
+    rows = [i for i in range(len(collection)) for _ in collection.coord_range(i)]
+    n_points = len(rows)
+
+    offsets = array("q", range(n_points + 1))
+
+    return ColumnarFeatureCollection(
+        coords=array("d", collection.coords),
+        geometry_types=bytearray([geometry_type_codes["Point"]]) * n_points,
+        geometry_offsets=offsets,
+        part_offsets=array("q", offsets),
+        ring_offsets=array("q", offsets),
+        properties={
+            name: [values[row] for row in rows]
+            for name, values in collection.properties.items()
+        },
+    )
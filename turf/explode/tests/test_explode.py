@@ -2,6 +2,7 @@ import pytest
 import os
 
 from turf.explode import explode
+from turf.helpers import ColumnarFeatureCollection, all_geometry_types
 
 from turf.utils.error_codes import error_code_messages
 from turf.utils.exceptions import InvalidInput
@@ -13,6 +14,27 @@ current_path = os.path.dirname(os.path.realpath(__file__))
 fixtures = get_fixtures(current_path)
 
 
+def as_feature_collection(geojson):
+    """
+    Wraps a fixture in a FeatureCollection, or returns None if it can't be stored columnar.
+    """
+    if not isinstance(geojson, dict):
+        return None
+
+    if geojson.get("type") in all_geometry_types:
+        geojson = {"type": "Feature", "properties": {}, "geometry": geojson}
+
+    if geojson.get("type") == "Feature":
+        geojson = {"type": "FeatureCollection", "features": [geojson]}
+
+    try:
+        ColumnarFeatureCollection.from_geojson(geojson)
+    except InvalidInput:
+        return None
+
+    return geojson
+
+
 class TestExplode:
     @pytest.mark.parametrize(
         "fixture",
@@ -39,6 +61,23 @@ class TestExplode:
 
         assert result == fixture["out"]
 
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            pytest.param(fixture, id=fixture_name)
+            for fixture_name, fixture in fixtures.items()
+            if as_feature_collection(fixture["in"])
+        ],
+    )
+    def test_columnar(self, fixture):
+        collection = as_feature_collection(fixture["in"])
+        columnar = ColumnarFeatureCollection.from_geojson(collection)
+
+        result = explode(columnar)
+
+        assert isinstance(result, ColumnarFeatureCollection)
+        assert result.to_feature_collection() == explode(collection)
+
     def test_exception(self):
         with pytest.raises(Exception) as excinfo:
             explode([[1, 2]])
@@ -1,3 +1,4 @@
 from turf.helpers._conversions import *
 from turf.helpers._features import *
 from turf.helpers._units import *
+from turf.helpers._columnar import ColumnarFeatureCollection
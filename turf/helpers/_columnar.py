@@ -0,0 +1,296 @@
+from array import array
+from typing import Any, Dict, Iterator, List, Sequence, Union
+
+from turf.helpers._features import all_geometry_types, feature_collection
+from turf.utils.error_codes import error_code_messages
+from turf.utils.exceptions import InvalidInput
+
+# geometry type codes, as in WKB / GeoArrow. 0 is used for features without geometry.
+geometry_type_codes = {
+    geometry_type: code for code, geometry_type in enumerate(all_geometry_types, 1)
+}
+
+
+class _Missing:
+    """
+    Marks the properties (or ids) a feature does not have in the column store.
+    """
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+MISSING = _Missing()
+
+
+class ColumnarFeatureCollection:
+    """
+    FeatureCollection stored column-wise instead of as one dictionary per feature.
+
+    All coordinates are stored in a single array of interleaved lng, lat doubles, and the
+    nesting of the geometries is described by offset arrays, similar to the GeoArrow layout:
+
+    * `geometry_offsets[i]:geometry_offsets[i + 1]` are the parts of feature i
+      (the polygons of a MultiPolygon, a single part for any other geometry type)
+    * `part_offsets[j]:part_offsets[j + 1]` are the rings of part j
+      (the rings of a polygon, the lines of a MultiLineString, a single ring otherwise)
+    * `ring_offsets[k]:ring_offsets[k + 1]` are the coordinate indices of ring k,
+      coordinate c being stored at `coords[2 * c]`, `coords[2 * c + 1]`
+
+    `geometry_types` holds the geometry type code of each feature (see `geometry_type_codes`),
+    and `properties` maps each property name to the list of its values for every feature.
+    Only the first two dimensions of the coordinates are kept.
+    """
+
+    __slots__ = (
+        "coords",
+        "geometry_types",
+        "geometry_offsets",
+        "part_offsets",
+        "ring_offsets",
+        "properties",
+        "ids",
+    )
+
+    def __init__(
+        self,
+        coords: array = None,
+        geometry_types: bytearray = None,
+        geometry_offsets: array = None,
+        part_offsets: array = None,
+        ring_offsets: array = None,
+        properties: Dict[str, List] = None,
+        ids: List = None,
+    ) -> None:
+        self.coords = array("d") if coords is None else coords
+        self.geometry_types = bytearray() if geometry_types is None else geometry_types
+        self.geometry_offsets = (
+            array("q", [0]) if geometry_offsets is None else geometry_offsets
+        )
+        self.part_offsets = array("q", [0]) if part_offsets is None else part_offsets
+        self.ring_offsets = array("q", [0]) if ring_offsets is None else ring_offsets
+        self.properties = {} if properties is None else properties
+        self.ids = [MISSING] * len(self.geometry_types) if ids is None else ids
+
+    @classmethod
+    def from_geojson(
+        cls, features: Union[Dict, Any, Sequence]
+    ) -> "ColumnarFeatureCollection":
+        """
+        Builds a columnar collection from a FeatureCollection.
+
+        :param features: FeatureCollection dict or object, or sequence of Feature dicts or objects
+        :return: ColumnarFeatureCollection with the same features
+        """
+        if hasattr(features, "to_geojson"):
+            features = features.to_geojson()
+
+        if isinstance(features, dict):
+            if features.get("type") != "FeatureCollection":
+                raise InvalidInput(error_code_messages["InvalidFeatureCollection"])
+
+            features = features.get("features", [])
+
+        collection = cls()
+
+        for feat in features:
+            collection.append(feat)
+
+        return collection
+
+    def append(self, feat: Union[Dict, Any]) -> None:
+        """
+        Adds a feature at the end of the collection.
+
+        :param feat: Feature dict or object
+        """
+        if hasattr(feat, "to_geojson"):
+            feat = feat.to_geojson()
+
+        if not isinstance(feat, dict) or feat.get("type") != "Feature":
+            raise InvalidInput(error_code_messages["InvalidFeatureCollection"])
+
+        geom = feat.get("geometry", None)
+
+        if geom is None:
+            self.geometry_types.append(0)
+            self.geometry_offsets.append(len(self.part_offsets) - 1)
+        else:
+            geometry_type = geom.get("type", None)
+
+            if geometry_type not in geometry_type_codes:
+                raise InvalidInput(
+                    error_code_messages["InvalidGeometry"](all_geometry_types)
+                )
+
+            self.add_geometry(geometry_type, geom["coordinates"])
+
+        row = len(self.ids)
+        properties = feat.get("properties", None) or {}
+
+        for name, value in properties.items():
+            if name not in self.properties:
+                self.properties[name] = [MISSING] * row
+
+            self.properties[name].append(value)
+
+        for values in self.properties.values():
+            if len(values) == row:
+                values.append(MISSING)
+
+        self.ids.append(feat.get("id", MISSING))
+
+    def add_geometry(self, geometry_type: str, coordinates: Sequence) -> None:
+        """
+        Appends the coordinates and offsets of a geometry.
+
+        :param geometry_type: GeoJSON geometry type
+        :param coordinates: GeoJSON coordinates of the geometry
+        """
+        if geometry_type == "Point":
+            parts = [[[coordinates]]]
+        elif geometry_type in ["MultiPoint", "LineString"]:
+            parts = [[coordinates]]
+        elif geometry_type in ["MultiLineString", "Polygon"]:
+            parts = [coordinates]
+        else:
+            parts = coordinates
+
+        # built aside first, so that invalid coordinates leave the collection untouched
+        coords = array("d")
+        ring_offsets = array("q")
+        part_offsets = array("q")
+
+        n_coords = len(self.coords) // 2
+        n_rings = len(self.ring_offsets) - 1
+
+        try:
+            for rings in parts:
+                for ring in rings:
+                    for coord in ring:
+                        coords.append(coord[0])
+                        coords.append(coord[1])
+
+                    ring_offsets.append(n_coords + len(coords) // 2)
+
+                part_offsets.append(n_rings + len(ring_offsets))
+        except (TypeError, IndexError):
+            raise InvalidInput(error_code_messages["InvalidGeometryInput"])
+
+        self.coords.extend(coords)
+        self.ring_offsets.extend(ring_offsets)
+        self.part_offsets.extend(part_offsets)
+
+        self.geometry_types.append(geometry_type_codes[geometry_type])
+        self.geometry_offsets.append(len(self.part_offsets) - 1)
+
+    def __len__(self) -> int:
+        return len(self.geometry_types)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self)} features)"
+
+    def __iter__(self) -> Iterator[Dict]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, i: int) -> Dict:
+        """
+        :param i: feature index
+        :return: the feature as a GeoJSON dict
+        """
+        if i < 0:
+            i += len(self)
+
+        if not 0 <= i < len(self):
+            raise IndexError("feature index out of range")
+
+        feat = {
+            "type": "Feature",
+            "properties": self.feature_properties(i),
+            "geometry": self.geometry(i),
+        }
+
+        if self.ids[i] is not MISSING:
+            feat["id"] = self.ids[i]
+
+        return feat
+
+    def geometry(self, i: int) -> Union[Dict, None]:
+        """
+        :param i: feature index
+        :return: the geometry of the feature as a GeoJSON dict
+        """
+        code = self.geometry_types[i]
+
+        if not code:
+            return None
+
+        geometry_type = all_geometry_types[code - 1]
+        coords = self.coords
+
+        parts = [
+            [
+                [
+                    [coords[2 * c], coords[2 * c + 1]]
+                    for c in range(self.ring_offsets[r], self.ring_offsets[r + 1])
+                ]
+                for r in range(self.part_offsets[p], self.part_offsets[p + 1])
+            ]
+            for p in range(self.geometry_offsets[i], self.geometry_offsets[i + 1])
+        ]
+
+        if geometry_type == "Point":
+            coordinates = parts[0][0][0]
+        elif geometry_type in ["MultiPoint", "LineString"]:
+            coordinates = parts[0][0]
+        elif geometry_type in ["MultiLineString", "Polygon"]:
+            coordinates = parts[0]
+        else:
+            coordinates = parts
+
+        return {"type": geometry_type, "coordinates": coordinates}
+
+    def feature_properties(self, i: int) -> Dict:
+        """
+        :param i: feature index
+        :return: the properties of the feature
+        """
+        return {
+            name: values[i]
+            for name, values in self.properties.items()
+            if values[i] is not MISSING
+        }
+
+    def column(self, name: str) -> List:
+        """
+        :param name: property name
+        :return: the values of the property for every feature, None where it is missing
+        """
+        return [
+            None if value is MISSING else value
+            for value in self.properties.get(name, [MISSING] * len(self))
+        ]
+
+    def coord_range(self, i: int) -> range:
+        """
+        :param i: feature index
+        :return: the indices of the coordinates of the feature
+        """
+        start = self.ring_offsets[self.part_offsets[self.geometry_offsets[i]]]
+        end = self.ring_offsets[self.part_offsets[self.geometry_offsets[i + 1]]]
+
+        return range(start, end)
+
+    def to_feature_collection(self, as_geojson: bool = True) -> Union[Dict, Any]:
+        """
+        Converts the collection back to a FeatureCollection.
+
+        :param as_geojson: whether the return value should be a geojson
+        :return: FeatureCollection dict, or FeatureCollection object
+        """
+        if as_geojson:
+            # built directly, as feature_collection does not accept features without geometry
+            return {"type": "FeatureCollection", "features": list(self)}
+
+        return feature_collection(list(self), as_geojson=False)
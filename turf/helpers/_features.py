@@ -15,17 +15,60 @@ all_geometry_types = [
     "MultiPolygon",
 ]
 
+validation_modes = ["eager", "lazy", "off"]
+
+
+def check_validation_mode(validate: str) -> str:
+    """
+    :param validate: "eager" to check the coordinates when the geometry is created,
+        "lazy" to check them the first time they are accessed, "off" to never check them
+    :return: the validation mode
+    """
+    if validate not in validation_modes:
+        raise InvalidInput(error_code_messages["InvalidOption"]("validate", validate))
+
+    return validate
+
 
 class Geometry(ABC):
     """
     Base class for Point, LineString and Polygon sub-classes.
+
+    Coordinates may be lists or tuples. Their validation can be deferred until they are
+    first accessed (validate="lazy") or skipped for trusted input (validate="off").
     """
 
-    def __init__(self, coordinates: Iterable, geometry_type) -> None:
-        self._check_input(coordinates)
-        self.coordinates = coordinates
+    # _bbox holds the bounding box computed by turf.bbox, reset when coordinates are set
+    __slots__ = ("_coordinates", "_pending_check", "_bbox", "type")
+
+    def __init__(
+        self, coordinates: Iterable, geometry_type, validate: str = "eager"
+    ) -> None:
+        validate = check_validation_mode(validate)
+
+        if validate == "eager":
+            self._check_input(coordinates)
+
+        self._coordinates = coordinates
+        self._pending_check = validate == "lazy"
+        self._bbox = None
         self.type = geometry_type
 
+    @property
+    def coordinates(self) -> Sequence:
+        if self._pending_check:
+            self._check_input(self._coordinates)
+            self._pending_check = False
+
+        return self._coordinates
+
+    @coordinates.setter
+    def coordinates(self, coordinates: Sequence) -> None:
+        self._check_input(coordinates)
+        self._coordinates = coordinates
+        self._pending_check = False
+        self._bbox = None
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.coordinates})"
 
@@ -53,13 +96,13 @@ class Geometry(ABC):
             return default
 
     @classmethod
-    def from_geojson(cls, geojson: Dict) -> Any:
+    def from_geojson(cls, geojson: Dict, validate: str = "eager") -> Any:
         try:
             coords = geojson["coordinates"]
         except KeyError:
             raise InvalidInput(error_code_messages["InvalidCoordinates"])
 
-        return geometry(cls.__name__, coords, as_geojson=False)
+        return geometry(cls.__name__, coords, as_geojson=False, validate=validate)
 
     def to_geojson(self) -> Dict:
         """
@@ -77,8 +120,10 @@ class Point(Geometry):
     Equivalent to a GeoJSON Point.
     """
 
-    def __init__(self, coordinates: Sequence) -> None:
-        Geometry.__init__(self, coordinates, "Point")
+    __slots__ = ()
+
+    def __init__(self, coordinates: Sequence, validate: str = "eager") -> None:
+        Geometry.__init__(self, coordinates, "Point", validate)
 
     @staticmethod
     def _check_input(coordinates: Sequence) -> None:
@@ -99,8 +144,10 @@ class Point(Geometry):
 
 
 class MultiPoint(Point):
-    def __init__(self, coordinates: Sequence) -> None:
-        Point.__init__(self, coordinates)
+    __slots__ = ()
+
+    def __init__(self, coordinates: Sequence, validate: str = "eager") -> None:
+        Point.__init__(self, coordinates, validate)
         self.type = "MultiPoint"
 
     def _check_input(self, coordinates: Sequence) -> None:
@@ -123,8 +170,10 @@ class LineString(Geometry):
     Equivalent to a GeoJSON LineString.
     """
 
-    def __init__(self, coordinates: Sequence) -> None:
-        Geometry.__init__(self, coordinates, geometry_type="LineString")
+    __slots__ = ()
+
+    def __init__(self, coordinates: Sequence, validate: str = "eager") -> None:
+        Geometry.__init__(self, coordinates, "LineString", validate)
 
     def _check_input(self, coordinates: Sequence) -> None:
         """
@@ -145,8 +194,10 @@ class LineString(Geometry):
 
 
 class MultiLineString(LineString):
-    def __init__(self, coordinates: Sequence) -> None:
-        LineString.__init__(self, coordinates)
+    __slots__ = ()
+
+    def __init__(self, coordinates: Sequence, validate: str = "eager") -> None:
+        LineString.__init__(self, coordinates, validate)
         self.type = "MultiLineString"
 
     def _check_input(self, coordinates: Sequence) -> None:
@@ -171,8 +222,10 @@ class Polygon(Geometry):
     Equivalent to a GeoJSON Polygon.
     """
 
-    def __init__(self, coordinates: Sequence) -> None:
-        Geometry.__init__(self, coordinates, geometry_type="Polygon")
+    __slots__ = ()
+
+    def __init__(self, coordinates: Sequence, validate: str = "eager") -> None:
+        Geometry.__init__(self, coordinates, "Polygon", validate)
 
     def _check_input(self, coordinates: Sequence) -> None:
         """
@@ -185,19 +238,21 @@ class Polygon(Geometry):
             raise InvalidInput(error_code_messages["InvalidPolygonInput"])
 
         for ring in coordinates:
-            if not isinstance(ring, list):
+            if not isinstance(ring, (list, tuple)):
                 raise InvalidInput(error_code_messages["InvalidLinearRing"])
 
             if len(ring) < 4:
                 raise InvalidInput(error_code_messages["InvalidLinearRing"])
 
-            if ring[-1] != ring[0]:
+            if list(ring[-1]) != list(ring[0]):
                 raise InvalidInput(error_code_messages["InvalidFirstLastPoints"])
 
 
 class MultiPolygon(Polygon):
-    def __init__(self, coordinates: Sequence) -> None:
-        Polygon.__init__(self, coordinates)
+    __slots__ = ()
+
+    def __init__(self, coordinates: Sequence, validate: str = "eager") -> None:
+        Polygon.__init__(self, coordinates, validate)
         self.type = "MultiPolygon"
 
     def _check_input(self, coordinates: Sequence) -> None:
@@ -214,11 +269,23 @@ class MultiPolygon(Polygon):
             super(MultiPolygon, self)._check_input(coord)
 
 
+geometry_classes = {
+    "Point": Point,
+    "LineString": LineString,
+    "Polygon": Polygon,
+    "MultiPoint": MultiPoint,
+    "MultiLineString": MultiLineString,
+    "MultiPolygon": MultiPolygon,
+}
+
+
 class FeatureType(ABC):
     """
     Parent class for Feature and FeatureCollection.
     """
 
+    __slots__ = ("type", "id", "bbox")
+
     def __init__(self, feature_type: str) -> None:
         self.type = feature_type
 
@@ -252,14 +319,17 @@ class Feature(FeatureType):
     Equivalent to a GeoJSON feature.
     """
 
+    __slots__ = ("geometry", "properties")
+
     def __init__(
         self,
         geom: Union[
             Dict, Point, LineString, Polygon, MultiPoint, MultiLineString, MultiPolygon
         ],
         properties: Union[Dict, None] = None,
+        validate: str = "eager",
     ) -> None:
-        geom = self._check_input(geom)
+        geom = self._check_input(geom, validate)
 
         FeatureType.__init__(self, feature_type="Feature")
 
@@ -291,29 +361,30 @@ class Feature(FeatureType):
         geom: Union[
             Dict, Point, LineString, Polygon, MultiPoint, MultiLineString, MultiPolygon
         ],
+        validate: str = "eager",
     ) -> Union[Point, LineString, Polygon, MultiPoint, MultiLineString, MultiPolygon]:
         """
         Checks input given to Feature class, and converts to object if input is in dict form.
 
         :param geom: input geometry
+        :param validate: validation mode of the geometry created from a dict
         :return: geometry object
         """
 
-        if not any(isinstance(geom, eval(cls)) for cls in all_geometry_types):
-            if isinstance(geom, dict):
-                feat_type = geom.get("type", "nonexistent")
-                try:
-                    return eval(feat_type).from_geojson(geom)
-                except (NameError, AttributeError):
-                    raise InvalidInput(
-                        error_code_messages["InvalidGeometry"](all_geometry_types)
-                    )
-            else:
+        if isinstance(geom, Geometry):
+            return geom
+
+        if isinstance(geom, dict):
+            try:
+                geometry_class = geometry_classes[geom.get("type", "nonexistent")]
+            except (KeyError, TypeError):
                 raise InvalidInput(
                     error_code_messages["InvalidGeometry"](all_geometry_types)
                 )
 
-        return geom
+            return geometry_class.from_geojson(geom, validate)
+
+        raise InvalidInput(error_code_messages["InvalidGeometry"](all_geometry_types))
 
     def to_geojson(self) -> Dict:
         """
@@ -340,8 +411,10 @@ class FeatureCollection(FeatureType):
     Equivalent to a GeoJSON FeatureCollection.
     """
 
-    def __init__(self, features: Sequence = None) -> None:
-        features = self._check_input(features)
+    __slots__ = ("features",)
+
+    def __init__(self, features: Sequence = None, validate: str = "eager") -> None:
+        features = self._check_input(features, validate)
 
         FeatureType.__init__(self, feature_type="FeatureCollection")
 
@@ -351,12 +424,15 @@ class FeatureCollection(FeatureType):
         return f"{self.__class__.__name__}({[feat.get('geometry').get('type') for feat in self.features]})"
 
     @staticmethod
-    def _check_input(features: Sequence) -> List[Union[Dict, Feature]]:
+    def _check_input(
+        features: Sequence, validate: str = "eager"
+    ) -> List[Union[Dict, Feature]]:
         """
         Checks input given to FeatureCollection class, and converts to list of
         Feature objects if input is in dict form.
 
         :param features: input features
+        :param validate: validation mode of the geometries created from dicts
         :return: a list of the feature objects
         """
 
@@ -369,17 +445,16 @@ class FeatureCollection(FeatureType):
                 if isinstance(feat, dict):
                     feat_type = feat.get("geometry", {}).get("type", "nonexistent")
                     try:
-                        geom = eval(feat_type).from_geojson(feat.get("geometry", {}))
-                        properties = feat.get("properties", None)
-                        feat_from_geojson = feature(
-                            geom, properties=properties, as_geojson=False
-                        )
-
-                        eval_feats.append(feat_from_geojson)
-                    except NameError:
+                        geometry_class = geometry_classes[feat_type]
+                    except KeyError:
                         raise InvalidInput(
                             error_code_messages["InvalidGeometry"](all_geometry_types)
                         )
+
+                    geom = geometry_class.from_geojson(feat.get("geometry"), validate)
+                    properties = feat.get("properties", None)
+
+                    eval_feats.append(Feature(geom, properties, validate))
                 else:
                     raise InvalidInput(
                         error_code_messages["InvalidGeometry"](all_geometry_types)
@@ -419,6 +494,7 @@ def feature(
     :param options: an options dictionary:
         [options["bbox"] Bounding Box Array [west, south, east, north] associated with the Feature
         [options["id"] Identifier associated with the Feature
+        [options["validate"]="eager"] validation of a geometry given as a dict, see `geometry`
     :param as_geojson: whether the return value should be a geojson
     :return: a GeoJSON feature
     """
@@ -429,7 +505,7 @@ def feature(
     if not properties:
         properties = {}
 
-    feat = Feature(geom, properties)
+    feat = Feature(geom, properties, options.get("validate", "eager"))
 
     if "id" in options:
         feat.id = options["id"]
@@ -450,6 +526,7 @@ def feature_collection(
     :param options: an options dictionary:
         [options["bbox"] Bounding Box Array [west, south, east, north] associated with the Feature
         [options["id"] Identifier associated with the Feature
+        [options["validate"]="eager"] validation of the features given as dicts, see `geometry`
     :param as_geojson: whether the return value should be a geojson
     :return: a FeatureCollection of Features
     """
@@ -457,7 +534,7 @@ def feature_collection(
     if not options:
         options = {}
 
-    feat_collection = FeatureCollection(features)
+    feat_collection = FeatureCollection(features, options.get("validate", "eager"))
 
     if "id" in options:
         feat_collection.id = options["id"]
@@ -469,7 +546,10 @@ def feature_collection(
 
 
 def geometry(
-    geom_type: str, coordinates: Sequence, as_geojson: bool = True
+    geom_type: str,
+    coordinates: Sequence,
+    as_geojson: bool = True,
+    validate: str = "eager",
 ) -> Union[Dict, Point, LineString, Polygon, MultiPoint, MultiLineString, MultiPolygon]:
     """
     Creates a GeoJSON {@link Geometry} from a Geometry string type & coordinates.
@@ -478,24 +558,18 @@ def geometry(
     :param geom_type: one of "Point" | "LineString" | "Polygon" | "MultiPoint" | "MultiLineString" | "MultiPolygon"
     :param coordinates: array of coordinates [lng, lat]
     :param as_geojson: whether the return value should be a geojson
+    :param validate: "eager" to check the coordinates right away, "lazy" to check them the
+        first time they are accessed, "off" to skip the checks for trusted input
     :return: a GeoJSON geometry
     """
 
-    if geom_type == "Point":
-        geom = Point(coordinates)
-    elif geom_type == "LineString":
-        geom = LineString(coordinates)
-    elif geom_type == "Polygon":
-        geom = Polygon(coordinates)
-    elif geom_type == "MultiPoint":
-        geom = MultiPoint(coordinates)
-    elif geom_type == "MultiLineString":
-        geom = MultiLineString(coordinates)
-    elif geom_type == "MultiPolygon":
-        geom = MultiPolygon(coordinates)
-    else:
+    try:
+        geometry_class = geometry_classes[geom_type]
+    except (KeyError, TypeError):
         raise InvalidInput(error_code_messages["InvalidGeometry"](all_geometry_types))
 
+    geom = geometry_class(coordinates, validate)
+
     return geom.to_geojson() if as_geojson else geom
 
 
@@ -0,0 +1,166 @@
+import pytest
+
+from turf.helpers import (
+    ColumnarFeatureCollection,
+    FeatureCollection,
+    feature_collection,
+    line_string,
+    multi_point,
+    multi_line_string,
+    multi_polygon,
+    point,
+    polygon,
+)
+
+from turf.utils.error_codes import error_code_messages
+from turf.utils.exceptions import InvalidInput
+
+features = [
+    point([1.5, 2.5], {"name": "a", "value": 1}),
+    multi_point([[0, 0], [1, 1]], {"name": None}),
+    line_string([[0, 0], [1, 1], [2, 0]], {"value": 3}),
+    multi_line_string([[[0, 0], [1, 1]], [[2, 2], [3, 3], [4, 4]]]),
+    polygon(
+        [
+            [[0, 0], [10, 0], [10, 10], [0, 10], [0, 0]],
+            [[2, 2], [4, 2], [4, 4], [2, 4], [2, 2]],
+        ],
+        {"tags": ["x", "y"]},
+    ),
+    multi_polygon(
+        [
+            [[[0, 0], [1, 0], [1, 1], [0, 0]]],
+            [
+                [[5, 5], [6, 5], [6, 6], [5, 5]],
+                [[5.2, 5.1], [5.8, 5.1], [5.8, 5.7], [5.2, 5.1]],
+            ],
+        ]
+    ),
+    {"type": "Feature", "properties": {"name": "empty"}, "geometry": None, "id": 7},
+]
+
+
+class TestColumnarFeatureCollection:
+    def test_round_trip(self):
+        collection = {"type": "FeatureCollection", "features": features}
+
+        columnar = ColumnarFeatureCollection.from_geojson(collection)
+
+        assert len(columnar) == len(features)
+        assert columnar.to_feature_collection() == collection
+        assert list(columnar) == collection["features"]
+        assert columnar[-1] == features[-1]
+
+    def test_layout(self):
+        columnar = ColumnarFeatureCollection.from_geojson(features)
+
+        assert list(columnar.geometry_types) == [1, 4, 2, 5, 3, 6, 0]
+        assert list(columnar.geometry_offsets) == [0, 1, 2, 3, 4, 5, 7, 7]
+        assert list(columnar.part_offsets) == [0, 1, 2, 3, 5, 7, 8, 10]
+        assert list(columnar.ring_offsets) == [
+            0,
+            1,
+            3,
+            6,
+            8,
+            11,
+            16,
+            21,
+            25,
+            29,
+            33,
+        ]
+        assert len(columnar.coords) == 2 * 33
+        assert list(columnar.coords[:2]) == [1.5, 2.5]
+
+    def test_properties(self):
+        columnar = ColumnarFeatureCollection.from_geojson(features)
+
+        assert columnar.column("name") == ["a", None, None, None, None, None, "empty"]
+        assert columnar.column("value") == [1, None, 3, None, None, None, None]
+        assert columnar.column("missing") == [None] * len(features)
+
+        # a property set to None is kept, a missing property is not added
+        assert columnar.feature_properties(1) == {"name": None}
+        assert columnar.feature_properties(3) == {}
+
+    def test_feature_objects(self):
+        objects = feature_collection(features[:-1], as_geojson=False)
+
+        columnar = ColumnarFeatureCollection.from_geojson(objects)
+        result = columnar.to_feature_collection(as_geojson=False)
+
+        assert isinstance(result, FeatureCollection)
+        assert result.to_geojson() == objects.to_geojson()
+
+    def test_index_error(self):
+        columnar = ColumnarFeatureCollection.from_geojson(features)
+
+        with pytest.raises(IndexError):
+            columnar[len(features)]
+
+    @pytest.mark.parametrize(
+        "input_value,exception_value",
+        [
+            pytest.param(
+                point([0, 0]),
+                error_code_messages["InvalidFeatureCollection"],
+                id="feature",
+            ),
+            pytest.param(
+                [{"type": "Point", "coordinates": [0, 0]}],
+                error_code_messages["InvalidFeatureCollection"],
+                id="geometry-list",
+            ),
+            pytest.param(
+                [
+                    {
+                        "type": "Feature",
+                        "properties": {},
+                        "geometry": {"type": "GeometryCollection", "geometries": []},
+                    }
+                ],
+                error_code_messages["InvalidGeometry"](
+                    [
+                        "Point",
+                        "LineString",
+                        "Polygon",
+                        "MultiPoint",
+                        "MultiLineString",
+                        "MultiPolygon",
+                    ]
+                ),
+                id="geometry-collection",
+            ),
+            pytest.param(
+                [
+                    {
+                        "type": "Feature",
+                        "properties": {},
+                        "geometry": {"type": "LineString", "coordinates": [0, 0]},
+                    }
+                ],
+                error_code_messages["InvalidGeometryInput"],
+                id="invalid-coordinates",
+            ),
+        ],
+    )
+    def test_exception(self, input_value, exception_value):
+        with pytest.raises(InvalidInput) as excinfo:
+            ColumnarFeatureCollection.from_geojson(input_value)
+
+        assert str(excinfo.value) == exception_value
+
+    def test_invalid_feature_is_not_added(self):
+        columnar = ColumnarFeatureCollection.from_geojson(features[:2])
+
+        with pytest.raises(InvalidInput):
+            columnar.append(
+                {
+                    "type": "Feature",
+                    "properties": {},
+                    "geometry": {"type": "LineString", "coordinates": [[0, 0], 0]},
+                }
+            )
+
+        assert columnar.to_feature_collection() == feature_collection(features[:2])
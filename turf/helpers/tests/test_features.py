@@ -569,3 +569,62 @@ class TestFeatureGeometry:
 
         assert excinfo.type == InvalidInput
         assert str(excinfo.value) == exception_value
+
+
+class TestValidation:
+    def test_slots(self):
+        p = point([5, 10], as_geojson=False)
+
+        assert not hasattr(p, "__dict__")
+        assert not hasattr(p.geometry, "__dict__")
+        assert not hasattr(feature_collection([p], as_geojson=False), "__dict__")
+
+    def test_tuple_coordinates(self):
+        ring = ((0, 0), (1, 0), (1, 1), (0, 0))
+        poly = geometry("Polygon", (ring,), as_geojson=False)
+
+        assert poly.coordinates == (ring,)
+        assert poly.to_geojson() == {"type": "Polygon", "coordinates": (ring,)}
+
+    def test_lazy(self):
+        geom = geometry("LineString", [[0, 0], ["a", 1]], False, validate="lazy")
+
+        with pytest.raises(InvalidInput):
+            geom.coordinates
+
+        valid = geometry("LineString", [[0, 0], [1, 1]], False, validate="lazy")
+        assert valid.coordinates == [[0, 0], [1, 1]]
+
+    def test_off(self):
+        geom = geometry("Point", [0, "a"], as_geojson=False, validate="off")
+
+        assert geom.coordinates == [0, "a"]
+
+        with pytest.raises(InvalidInput):
+            geom.coordinates = [0, "b"]
+
+    def test_feature_options(self):
+        geom = {"type": "Point", "coordinates": [0, "a"]}
+
+        with pytest.raises(InvalidInput):
+            feature(geom)
+
+        feat = feature(geom, options={"validate": "off"}, as_geojson=False)
+        assert feat.geometry.coordinates == [0, "a"]
+
+        fc = feature_collection(
+            [{"type": "Feature", "geometry": geom, "properties": {}}],
+            options={"validate": "lazy"},
+            as_geojson=False,
+        )
+
+        with pytest.raises(InvalidInput):
+            fc.features[0].geometry.coordinates
+
+    def test_invalid_mode(self):
+        with pytest.raises(InvalidInput) as excinfo:
+            Point([0, 0], validate="never")
+
+        assert excinfo.value.args[0] == error_code_messages["InvalidOption"](
+            "validate", "never"
+        )
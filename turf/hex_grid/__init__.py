@@ -1 +1 @@
-from turf.hex_grid._hex_grid import hex_grid
+from turf.hex_grid._hex_grid import hex_grid, iter_hex_grid, HexGridSpec
@@ -1,10 +1,12 @@
-from typing import Dict, List, Union
+from typing import Dict, Iterator, List, Sequence, Tuple, Union
 import math
 
-from turf.distance import distance
 from turf.bbox import bbox
-from turf.boolean_intersects import boolean_intersects
-from turf.helpers import feature_collection, polygon, FeatureCollection
+from turf.helpers import feature_collection, polygon, radians_to_length
+from turf.helpers import FeatureCollection
+from turf.kernels import haversine
+from turf.utils.grid_mask import GridMask
+from turf.utils.grid_spec import GridSpec, bbox_overlaps
 
 
 def hex_grid(
@@ -30,117 +32,294 @@ def hex_grid(
 
     :returns: FeatureCollection of a grid of polygons
     """
+
+    return feature_collection(list(iter_hex_grid(bbox, cell_side, options)))
+
+
+def iter_hex_grid(
+    bbox: List[float],
+    cell_side: Union[int, float],
+    options: Dict = {},
+) -> Iterator[Dict]:
+    """
+    Generates the cells of `hex_grid` lazily, in the same order: column by column from
+    west to east, and from south to north within each column. Only the current cell is
+    held in memory, so the cells can be written out while they are generated, e.g. by
+    `turf.io.write_geojson_seq`.
+
+    :param bbox: Array extent in [minX, minY, maxX, maxY] order
+    :param n_cells: length of the side of the the hexagons or triangles, in units. It will also coincide with the
+                    radius of the circumcircle of the hexagons
+    :param options: Optional parameters
+        [options["units"]]: units ("degrees", "radians", "miles", "kilometers")
+                            of the given cell_width and cell_height
+        [options["mask"]]: if passed a Polygon or MultiPolygon here,
+                           the grid Points will be created only inside it
+        [options["properties"]]: passed to each point of the grid
+        [options["triangles"]]: whether to return as triangles instead of hexagons
+
+    :returns: generator of hexagon (or triangle) Polygon Features
+    """
     if not isinstance(options, dict):
         options = {}
 
-    has_triangles = options.get("triangles", None)
+    mask = GridMask(options["mask"]) if "mask" in options else None
 
-    results = []
-    west = bbox[0]
-    south = bbox[1]
-    east = bbox[2]
-    north = bbox[3]
+    has_triangles = options.get("triangles", None)
 
-    center_y = (south + north) / 2
-    center_x = (west + east) / 2
+    spec = HexGridSpec(bbox, cell_side, options)
+
+    for col, row in spec.cells():
+        center = spec.center(col, row)
+
+        if has_triangles:
+            triangles = hex_triangles(
+                center,
+                spec.radius_x,
+                spec.radius_y,
+                options.get("properties", {}).copy(),
+                spec.cosines,
+                spec.sines,
+            )
+
+            for triangle in triangles:
+                if mask is not None:
+                    if mask.intersects(triangle):
+                        yield triangle
+                else:
+                    yield triangle
 
-    x_fraction = (cell_side * 2) / (
-        distance([west, center_y], [east, center_y], options)
-    )
-    cell_width_deg = x_fraction * (east - west)
-    y_fraction = (
-        cell_side * 2 / (distance([center_x, south], [center_x, north], options))
-    )
-    cell_height_deg = y_fraction * (north - south)
-    radius = cell_width_deg / 2
+        else:
+            hex = spec.cell_polygon(col, row, options.get("properties", {}).copy())
 
-    hex_width = radius * 2
-    hex_height = math.sqrt(3) / 2 * cell_height_deg
+            if mask is not None:
+                if mask.intersects(hex):
+                    yield hex
+            else:
+                yield hex
 
-    # rows & columns
-    bbox_width = east - west
-    bbox_height = north - south
 
-    x_interval = 3 / 4 * hex_width
-    y_interval = hex_height
+class HexGridSpec(GridSpec):
+    """
+    Cell addressing of `hex_grid`, built from the same parameters. Cells are addressed by
+    (col, row), the column counted from the west and the row from the south, odd columns
+    being shifted half a hexagon to the south. Only hexagons are addressed, the
+    triangles option of `hex_grid` is ignored.
 
-    x_span = (bbox_width - hex_width) / (hex_width - radius / 2)
-    x_count = int(x_span)
+    :param bbox: Array extent in [minX, minY, maxX, maxY] order
+    :param cell_side: length of the side of the the hexagons, in units
+    :param options: Optional parameters
+        [options["units"]]: units ("degrees", "radians", "miles", "kilometers")
+                            of the given cell_side
+    """
 
-    x_adjust = (
-        ((x_count * x_interval - radius / 2) - bbox_width) / 2
-        - radius / 2
-        + x_interval / 2
+    __slots__ = (
+        "bbox",
+        "x_count",
+        "y_count",
+        "x_interval",
+        "y_interval",
+        "radius_x",
+        "radius_y",
+        "origin_x",
+        "origin_y",
+        "west",
+        "south",
+        "x_adjust",
+        "y_adjust",
+        "has_offset_y",
+        "cosines",
+        "sines",
     )
 
-    y_count = int((bbox_height - hex_height) / hex_height)
-    y_adjust = (bbox_height - y_count * hex_height) / 2
+    def __init__(
+        self, bbox: List[float], cell_side: Union[int, float], options: Dict = {}
+    ) -> None:
+        if not isinstance(options, dict):
+            options = {}
 
-    has_offset_y = (y_count * hex_height - bbox_height) > (hex_height / 2)
+        self.bbox = bbox
 
-    if has_offset_y:
-        y_adjust -= hex_height / 4
+        west = bbox[0]
+        south = bbox[1]
+        east = bbox[2]
+        north = bbox[3]
 
-    cosines = []
-    sines = []
+        center_y = (south + north) / 2
+        center_x = (west + east) / 2
 
-    for i in range(6):
-        angle = 2 * math.pi / 6 * i
-        cosines.append(math.cos(angle))
-        sines.append(math.sin(angle))
+        kwargs = {}
+        if "units" in options:
+            kwargs["units"] = options["units"]
 
-    results = []
+        factor = radians_to_length(1, **kwargs)
 
-    for x in range(x_count + 1):
-        for y in range(y_count + 1):
-            is_odd = x % 2 == 1
+        x_fraction = (cell_side * 2) / (
+            haversine(west, center_y, east, center_y) * factor
+        )
+        cell_width_deg = x_fraction * (east - west)
+        y_fraction = (
+            cell_side * 2 / (haversine(center_x, south, center_x, north) * factor)
+        )
+        cell_height_deg = y_fraction * (north - south)
+        radius = cell_width_deg / 2
 
-            if (y == 0) and is_odd:
-                continue
+        hex_width = radius * 2
+        hex_height = math.sqrt(3) / 2 * cell_height_deg
 
-            if (y == 0) and has_offset_y:
-                continue
+        # rows & columns
+        bbox_width = east - west
+        bbox_height = north - south
 
-            center_x = x * x_interval + west - x_adjust
-            center_y = y * y_interval + south + y_adjust
+        x_interval = 3 / 4 * hex_width
+        y_interval = hex_height
 
-            if is_odd:
-                center_y -= hex_height / 2
+        x_span = (bbox_width - hex_width) / (hex_width - radius / 2)
+        x_count = int(x_span)
 
-            if has_triangles:
-                triangles = hex_triangles(
-                    [center_x, center_y],
-                    cell_width_deg / 2,
-                    cell_height_deg / 2,
-                    options.get("properties", {}).copy(),
-                    cosines,
-                    sines,
-                )
+        x_adjust = (
+            ((x_count * x_interval - radius / 2) - bbox_width) / 2
+            - radius / 2
+            + x_interval / 2
+        )
 
-                for triangle in triangles:
-                    if "mask" in options:
-                        if boolean_intersects(options["mask"], triangle):
-                            results.append(triangle)
-                    else:
-                        results.append(triangle)
+        y_count = int((bbox_height - hex_height) / hex_height)
+        y_adjust = (bbox_height - y_count * hex_height) / 2
+
+        has_offset_y = (y_count * hex_height - bbox_height) > (hex_height / 2)
+
+        if has_offset_y:
+            y_adjust -= hex_height / 4
+
+        self.x_count = x_count
+        self.y_count = y_count
+        self.x_interval = x_interval
+        self.y_interval = y_interval
+        self.radius_x = cell_width_deg / 2
+        self.radius_y = cell_height_deg / 2
+        # center of the cell (0, 0)
+        self.origin_x = west - x_adjust
+        self.origin_y = south + y_adjust
+        self.west = west
+        self.south = south
+        self.x_adjust = x_adjust
+        self.y_adjust = y_adjust
+        self.has_offset_y = has_offset_y
+
+        self.cosines = []
+        self.sines = []
+
+        for i in range(6):
+            angle = 2 * math.pi / 6 * i
+            self.cosines.append(math.cos(angle))
+            self.sines.append(math.sin(angle))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.bbox})"
+
+    def center(self, col: int, row: int) -> List[float]:
+        """
+        :param col: cell column
+        :param row: cell row
+        :return: coordinates of the center of the hexagon
+        """
+        # same operations as the grid functions always did, for the same coordinates
+        center_x = col * self.x_interval + self.west - self.x_adjust
+        center_y = row * self.y_interval + self.south + self.y_adjust
+
+        if col % 2 == 1:
+            center_y -= self.y_interval / 2
+
+        return [center_x, center_y]
+
+    def cell_of_coords(self, x: float, y: float) -> Union[Tuple[int, int], None]:
+        # in units of the radii, the hexagons are regular with a circumradius of 1:
+        # axial coordinates, rounded in cube coordinates
+        # https://www.redblobgames.com/grids/hexagons/#pixel-to-hex
+        u = (x - self.origin_x) / self.radius_x
+        v = (y - self.origin_y) / self.radius_y
+
+        q = 2 / 3 * u
+        r = -1 / 3 * u + math.sqrt(3) / 3 * v
+        s = -q - r
+
+        col = round(q)
+        axial_r = round(r)
+        axial_s = round(s)
+
+        dq = abs(col - q)
+        dr = abs(axial_r - r)
+        ds = abs(axial_s - s)
+
+        if dq > dr and dq > ds:
+            col = -axial_r - axial_s
+        elif dr > ds:
+            axial_r = -col - axial_s
+
+        # axial to offset coordinates, odd columns being shifted to the south
+        row = axial_r + (col + (col & 1)) // 2
+
+        if not self.has_cell(col, row):
+            return None
+
+        return col, row
+
+    def has_cell(self, col: int, row: int) -> bool:
+        if not (0 <= col <= self.x_count and 0 <= row <= self.y_count):
+            return False
+
+        return row != 0 or (col % 2 == 0 and not self.has_offset_y)
+
+    def cell_polygon(self, col: int, row: int, properties: Dict = None) -> Dict:
+        return hexagon(
+            self.center(col, row),
+            self.radius_x,
+            self.radius_y,
+            properties if properties is not None else {},
+            self.cosines,
+            self.sines,
+        )
 
-            else:
-                hex = hexagon(
-                    [center_x, center_y],
-                    cell_width_deg / 2,
-                    cell_height_deg / 2,
-                    options.get("properties", {}).copy(),
-                    cosines,
-                    sines,
-                )
-
-                if "mask" in options:
-                    if boolean_intersects(options["mask"], hex):
-                        results.append(hex)
-                else:
-                    results.append(hex)
+    def cell_bbox(self, col: int, row: int) -> List[float]:
+        center_x, center_y = self.center(col, row)
+
+        return [
+            center_x + self.radius_x * self.cosines[3],
+            center_y + self.radius_y * self.sines[4],
+            center_x + self.radius_x * self.cosines[0],
+            center_y + self.radius_y * self.sines[1],
+        ]
+
+    def cells_in_bbox(self, bbox: Sequence) -> Iterator[Tuple[int, int]]:
+        # hexagons centered less than a radius (or half a hexagon height) away from the
+        # bounding box, widened by one cell for rounding errors
+        first_col = math.floor(
+            (bbox[0] - self.radius_x - self.origin_x) / self.x_interval
+        )
+        last_col = math.floor(
+            (bbox[2] + self.radius_x - self.origin_x) / self.x_interval
+        )
 
-    return feature_collection(results)
+        for col in range(max(first_col - 1, 0), min(last_col + 1, self.x_count) + 1):
+            # center of the hexagon of the row 0 of the column
+            origin_y = self.center(col, 0)[1]
+
+            first_row = math.floor((bbox[1] - origin_y) / self.y_interval - 1 / 2)
+            last_row = math.floor((bbox[3] - origin_y) / self.y_interval + 1 / 2)
+
+            for row in range(
+                max(first_row - 1, 0), min(last_row + 1, self.y_count) + 1
+            ):
+                if self.has_cell(col, row) and bbox_overlaps(
+                    self.cell_bbox(col, row), bbox
+                ):
+                    yield col, row
+
+    def cells(self) -> Iterator[Tuple[int, int]]:
+        for col in range(self.x_count + 1):
+            for row in range(self.y_count + 1):
+                if self.has_cell(col, row):
+                    yield col, row
 
 
 def hexagon(center, rx, ry, properties, cosines, sines):
@@ -1,8 +1,11 @@
 import pytest
 import os
 
+from turf.bbox import bbox as bounding_box
 from turf.bbox_polygon import bbox_polygon
-from turf.hex_grid import hex_grid
+from turf.boolean_point_in_polygon import boolean_point_in_polygon
+from turf.helpers import point
+from turf.hex_grid import hex_grid, iter_hex_grid, HexGridSpec
 
 from turf.utils.test_setup import get_fixtures
 
@@ -131,6 +134,86 @@ class TestHexGrid:
             assert coord[0] <= expected_value[0]
             assert coord[1] >= expected_value[1]
 
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            pytest.param(fixture, id=fixture_name)
+            for fixture_name, fixture in fixtures.items()
+        ],
+    )
+    def test_iter_hex_grid(self, fixture):
+        bbox = fixture["in"]["bbox"]
+        n_cells = fixture["in"]["cellSide"]
+
+        options = dict(
+            (key, fixture["in"][key])
+            for key in ["units", "mask", "properties", "triangles"]
+            if key in fixture["in"]
+        )
+
+        cells = iter_hex_grid(bbox, n_cells, options)
+
+        assert not isinstance(cells, list)
+        assert list(cells) == hex_grid(bbox, n_cells, options)["features"]
+
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            pytest.param(fixture, id=fixture_name)
+            for fixture_name, fixture in fixtures.items()
+            if "mask" not in fixture["in"]
+        ],
+    )
+    def test_grid_spec(self, fixture):
+        bbox = fixture["in"]["bbox"]
+        n_cells = fixture["in"]["cellSide"]
+
+        options = dict(
+            (key, fixture["in"][key]) for key in ["units"] if key in fixture["in"]
+        )
+
+        spec = HexGridSpec(bbox, n_cells, options)
+        cells = [spec.cell_polygon(col, row) for col, row in spec.cells()]
+
+        assert cells == hex_grid(bbox, n_cells, options)["features"]
+
+        west, south, east, north = bbox
+        steps = 15
+
+        for i in range(steps + 1):
+            for j in range(steps + 1):
+                pt = point(
+                    [
+                        west + (east - west) * i / steps,
+                        south + (north - south) * j / steps,
+                    ]
+                )
+                cell = spec.cell_of(pt)
+
+                if cell is not None:
+                    assert spec.has_cell(*cell)
+                    assert boolean_point_in_polygon(pt, spec.cell_polygon(*cell))
+                else:
+                    assert not any(
+                        boolean_point_in_polygon(pt, polygon, {"ignoreBoundary": True})
+                        for polygon in cells
+                    )
+
+        query = [
+            west + (east - west) / 4,
+            south + (north - south) / 3,
+            west + (east - west) / 2,
+            south + (north - south) / 2,
+        ]
+
+        expected = [
+            (col, row)
+            for (col, row), polygon in zip(spec.cells(), cells)
+            if overlaps(bounding_box(polygon), query)
+        ]
+
+        assert list(spec.cells_in_bbox(query)) == expected
+
 
 def prepare_output(result, bbox, options):
     for i in range(len(result["features"])):
@@ -172,3 +255,12 @@ def round_coordinates(cell_poly):
     cell_poly["geometry"]["coordinates"] = coords
 
     return cell_poly
+
+
+def overlaps(bbox1, bbox2):
+    return (
+        bbox1[0] <= bbox2[2]
+        and bbox2[0] <= bbox1[2]
+        and bbox1[1] <= bbox2[3]
+        and bbox2[1] <= bbox1[3]
+    )
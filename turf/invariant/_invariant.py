@@ -1,7 +1,9 @@
-from typing import Any, Sequence, Callable, Set, List, Tuple, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Sequence, Set, Tuple, Union
 
 from turf.helpers import (
     Feature,
+    Geometry,
     Point,
     LineString,
     MultiPoint,
@@ -9,6 +11,7 @@ from turf.helpers import (
     Polygon,
     MultiPolygon,
     FeatureCollection,
+    geometry_classes,
     get_input_dimensions,
 )
 from turf.utils.exceptions import InvalidInput
@@ -33,6 +36,27 @@ allowed_features_default = (
     MultiPolygon,
 )
 
+input_classes = {**geometry_classes, "Feature": Feature}
+
+
+@lru_cache(maxsize=None)
+def _get_allowed_classes(allowed_types: Tuple[str]) -> Tuple[Tuple, Set]:
+    """
+    Classes and dimensions accepted for a combination of allowed types, computed once
+    per combination.
+
+    :param allowed_types: allowed Feature types
+    :return: tuple with the allowed classes (dict included) and the allowed dimensions
+    """
+    allowed_class_types = (
+        *[input_classes[type_] for type_ in allowed_types if type_ in input_classes],
+        dict,
+    )
+
+    allowed_dimensions = {dimensions.get(type_, None) for type_ in allowed_types}
+
+    return allowed_class_types, allowed_dimensions
+
 
 def _process_list_input(
     allowed_types: Sequence,
@@ -51,12 +75,7 @@ def _process_list_input(
     """
     dim = get_input_dimensions(input_value)
 
-    allowed_dimensions = {dimensions.get(type_, None) for type_ in allowed_types}
-
-    allowed_class_types = (
-        *[eval(allowed_type) for allowed_type in allowed_types],
-        dict,
-    )
+    allowed_class_types, allowed_dimensions = _get_allowed_classes(tuple(allowed_types))
 
     if dim == 1 and all(isinstance(el, allowed_class_types) for el in input_value):
         return list(map(lambda geom: callback(geom, allowed_types), input_value))
@@ -97,7 +116,10 @@ def _check_input_in_allowed_dimensions(
 
 
 def get_coords_from_geometry(
-    geometry: Any, allowed_types: Sequence = None, raise_exception: bool = True
+    geometry: Any,
+    allowed_types: Sequence = None,
+    raise_exception: bool = True,
+    trusted: bool = False,
 ) -> List:
     """
     Retrieves coords from a given Geometry. Geometry must be a GeoJSON,
@@ -106,12 +128,117 @@ def get_coords_from_geometry(
     :param geometry: Any input value(s)
     :param allowed_types: allowed Feature types
     :param raise_exception: if an exception should be raised or if it should be silent
+    :param trusted: if the input is known to be valid, the coords are returned without
+        checking its structure nor its type
     :return: list with extracted coords
     """
 
+    if trusted:
+        return _get_trusted_coords(geometry)
+
     if not allowed_types:
         allowed_types = allowed_types_default
 
+    get_coords = _coords_getters.get(type(geometry), _get_coords_from_any)
+
+    return get_coords(geometry, allowed_types, raise_exception)
+
+
+def _get_coords_from_dict(
+    geometry: Dict, allowed_types: Sequence, raise_exception: bool = True
+) -> List:
+    """
+    Retrieves coords from a GeoJSON geometry or Feature.
+
+    :param geometry: GeoJSON dictionary
+    :param allowed_types: allowed Feature types
+    :param raise_exception: if an exception should be raised or if it should be silent
+    :return: list with extracted coords
+    """
+    geometry_type = geometry.get("type")
+
+    if geometry_type == "Feature":
+        return get_coords_from_geometry(geometry.get("geometry", {}), allowed_types)
+
+    if geometry_type in allowed_types:
+        return geometry.get("coordinates", [])
+
+    if raise_exception:
+        raise InvalidInput(error_code_messages["InvalidGeometry"](allowed_types))
+    else:
+        return []
+
+
+def _get_coords_from_list(
+    geometry: Sequence, allowed_types: Sequence, raise_exception: bool = True
+) -> List:
+    """
+    Retrieves coords from a list of coordinates or of geometries.
+
+    :param geometry: list input
+    :param allowed_types: allowed Feature types
+    :param raise_exception: if an exception should be raised or if it should be silent
+    :return: list with extracted coords
+    """
+    if (
+        len(geometry) > 1
+        and type(geometry[0]) in (float, int)
+        and "Point" in allowed_types
+    ):
+        # most common list input, a position
+        return geometry
+
+    return _process_list_input(
+        allowed_types, geometry, get_coords_from_geometry, raise_exception
+    )
+
+
+def _get_coords_from_feature(
+    geometry: Feature, allowed_types: Sequence, raise_exception: bool = True
+) -> List:
+    """
+    Retrieves coords from a Feature object.
+
+    :param geometry: Feature object
+    :param allowed_types: allowed Feature types
+    :param raise_exception: unused, the geometry of the Feature is always checked
+    :return: list with extracted coords
+    """
+    return get_coords_from_geometry(geometry.get("geometry", {}), allowed_types)
+
+
+def _get_coords_from_geometry_object(
+    geometry: Geometry, allowed_types: Sequence, raise_exception: bool = True
+) -> List:
+    """
+    Retrieves coords from a Point, LineString, Polygon... object.
+
+    :param geometry: Geometry object
+    :param allowed_types: allowed Feature types
+    :param raise_exception: if an exception should be raised or if it should be silent
+    :return: list with extracted coords
+    """
+    if geometry.type in allowed_types:
+        return geometry.get("coordinates", [])
+
+    if raise_exception:
+        raise InvalidInput(error_code_messages["InvalidGeometry"](allowed_types))
+    else:
+        return []
+
+
+def _get_coords_from_any(
+    geometry: Any, allowed_types: Sequence, raise_exception: bool = True
+) -> List:
+    """
+    Retrieves coords from inputs of any other type, e.g. subclasses of the GeoJSON
+    classes, dict or list.
+
+    :param geometry: Any input value(s)
+    :param allowed_types: allowed Feature types
+    :param raise_exception: if an exception should be raised or if it should be silent
+    :return: list with extracted coords
+    """
     if isinstance(geometry, (list, tuple)):
         return _process_list_input(
             allowed_types, geometry, get_coords_from_geometry, raise_exception
@@ -121,15 +248,11 @@ def get_coords_from_geometry(
         if geometry.get("type") == "Feature":
             return get_coords_from_geometry(geometry.get("geometry", {}), allowed_types)
 
-    allowed_class_types = [
-        *[eval(allowed_type) for allowed_type in allowed_types],
-        dict,
-    ]
+    allowed_class_types, _ = _get_allowed_classes(tuple(allowed_types))
 
-    if any(
-        isinstance(geometry, allowed_type_class)
+    if (
+        isinstance(geometry, allowed_class_types)
         and geometry.get("type", "") in allowed_types
-        for allowed_type_class in allowed_class_types
     ):
         return geometry.get("coordinates", [])
 
@@ -139,6 +262,38 @@ def get_coords_from_geometry(
         return []
 
 
+# coords getters by exact input type, other types go through _get_coords_from_any
+_coords_getters = {
+    dict: _get_coords_from_dict,
+    list: _get_coords_from_list,
+    tuple: _get_coords_from_list,
+    Feature: _get_coords_from_feature,
+    **{
+        geometry_class: _get_coords_from_geometry_object
+        for geometry_class in geometry_classes.values()
+    },
+}
+
+
+def _get_trusted_coords(geometry: Any) -> List:
+    """
+    Retrieves coords from a Geometry, Feature or list of them, without any check.
+
+    :param geometry: valid input value(s)
+    :return: list with extracted coords
+    """
+    if isinstance(geometry, (list, tuple)):
+        if geometry and isinstance(geometry[0], (dict, Geometry, Feature)):
+            return [_get_trusted_coords(geom) for geom in geometry]
+
+        return geometry
+
+    if geometry.get("type") == "Feature":
+        geometry = geometry.get("geometry", {})
+
+    return geometry.get("coordinates", [])
+
+
 def get_geometry_from_features(features: Any, allowed_types: Sequence = None) -> List:
     """
     Retrieves Geometries from Features. Features must be a GeoJSON,
@@ -171,9 +326,7 @@ def get_geometry_from_features(features: Any, allowed_types: Sequence = None) ->
             if features.get("geometry", {}).get("type", "") in allowed_types:
                 return features.get("geometry", {})
 
-    if isinstance(
-        features, (*[eval(allowed_type) for allowed_type in allowed_types], dict)
-    ):
+    if isinstance(features, _get_allowed_classes(tuple(allowed_types))[0]):
         if features.get("type", "") in allowed_types:
             return features
 
@@ -195,16 +348,7 @@ def get_geometry_type(
         allowed_features = [allowed_features_default, allowed_types_default]
 
     else:
-        allowed_features = [
-            tuple(
-                [
-                    feature
-                    for feature in allowed_features_default
-                    if feature.__name__ in allowed_types
-                ]
-            ),
-            allowed_types,
-        ]
+        allowed_features = [_get_allowed_features(tuple(allowed_types)), allowed_types]
 
     features = get_geometry_from_features(features, allowed_features[1])
 
@@ -223,6 +367,19 @@ def get_geometry_type(
     return geometry_type
 
 
+@lru_cache(maxsize=None)
+def _get_allowed_features(allowed_types: Tuple[str]) -> Tuple:
+    """
+    :param allowed_types: allowed Feature types
+    :return: tuple with the geometry classes of the allowed types
+    """
+    return tuple(
+        feature
+        for feature in allowed_features_default
+        if feature.__name__ in allowed_types
+    )
+
+
 def _get_geometry_type_from_feature(
     features: Any, allowed_features: List[Union[Tuple, Sequence]]
 ) -> str:
@@ -282,13 +439,17 @@ def _get_geometry_type_from_list(
     return geometry_type
 
 
-def get_coords_from_features(features: Any, allowed_types: Sequence = None) -> List:
+def get_coords_from_features(
+    features: Any, allowed_types: Sequence = None, trusted: bool = False
+) -> List:
     """
     Retrieves coords from Features. Features must be a GeoJSON,
     a Feature object or a list of coordinates, otherwise it raises an exception.
 
     :param features: Any input value(s)
     :param allowed_types: allowed Feature types
+    :param trusted: if the input is known to be valid, the coords are returned without
+        checking its structure nor its type
     :return: list with extracted coords
     """
 
@@ -300,10 +461,10 @@ def get_coords_from_features(features: Any, allowed_types: Sequence = None) -> L
             return list(
                 map(
                     lambda feature: get_coords_from_geometry(
-                        feature.get("geometry", {}), allowed_types
+                        feature.get("geometry", {}), allowed_types, trusted=trusted
                     ),
                     features.get("features", []),
                 )
             )
 
-    return get_coords_from_geometry(features, allowed_types)
+    return get_coords_from_geometry(features, allowed_types, trusted=trusted)
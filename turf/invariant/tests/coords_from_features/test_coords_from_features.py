@@ -17,6 +17,16 @@ current_path = os.path.dirname(os.path.realpath(__file__))
 fixtures = get_fixtures(current_path)
 
 
+def fixture_input(fixture):
+    """
+    :return: the input features of a fixture, and its allowed types
+    """
+    try:
+        return fixture["in"], fixture["in"]["properties"]["allowed_types"]
+    except TypeError:
+        return fixture["in"][1], fixture["in"][0]
+
+
 class TestCoordsFromFeatures:
     @pytest.mark.parametrize(
         "fixture",
@@ -26,13 +36,9 @@ class TestCoordsFromFeatures:
         ],
     )
     def test_get_coords_from_features_geojson(self, fixture):
-        try:
-            allowed_types = fixture["in"]["properties"]["allowed_types"]
-        except TypeError:
-            allowed_types = fixture["in"][0]
-            fixture["in"] = fixture["in"][1]
+        features, allowed_types = fixture_input(fixture)
 
-        assert get_coords_from_features(fixture["in"], allowed_types) == fixture["out"]
+        assert get_coords_from_features(features, allowed_types) == fixture["out"]
 
     @pytest.mark.parametrize(
         "input_value,output_value",
@@ -160,3 +166,33 @@ class TestCoordsFromFeatures:
 
         assert excinfo.type == InvalidInput
         assert str(excinfo.value) == exception_value
+
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            pytest.param(fixture, id=fixture_name)
+            for fixture_name, fixture in fixtures.items()
+        ],
+    )
+    def test_trusted(self, fixture):
+        features, allowed_types = fixture_input(fixture)
+
+        output = get_coords_from_features(features, allowed_types, trusted=True)
+
+        assert output == fixture["out"]
+
+    def test_trusted_skips_checks(self):
+        line = {"type": "LineString", "coordinates": [[4.86, 45.76], [4.85, 45.74]]}
+
+        with pytest.raises(InvalidInput):
+            get_coords_from_features(line, ["Point"])
+
+        assert get_coords_from_features(line, ["Point"], trusted=True) == [
+            [4.86, 45.76],
+            [4.85, 45.74],
+        ]
+
+    def test_dict_feature_in_allowed_types(self):
+        feat = point([4.83, 45.75])
+
+        assert get_coords_from_geometry(feat, ["Point", "Feature"]) == [4.83, 45.75]
@@ -0,0 +1,2 @@
+from turf.io._geojson import iter_features
+from turf.io._geojson_seq import read_geojson_seq, write_geojson_seq
@@ -0,0 +1,233 @@
+import codecs
+import json
+from os import PathLike
+from typing import IO, Dict, Iterator, Sequence, Union
+
+from turf.bbox import bbox as bounding_box
+from turf.utils.error_codes import error_code_messages
+from turf.utils.exceptions import InvalidInput
+
+whitespace = " \t\n\r"
+
+# a decoding error further than this from the end of the buffer can't come from a value
+# cut at the end of the buffer (the longest being literals such as -Infinity), except for
+# unterminated strings
+max_cut_length = 16
+
+
+def iter_features(
+    path_or_file: Union[str, PathLike, IO], options: Dict = None
+) -> Iterator[Dict]:
+    """
+    Reads a GeoJSON FeatureCollection incrementally, yielding its features one at a time.
+    Only the feature being parsed is held in memory, so files much larger than the
+    available memory can be processed.
+
+    :param path_or_file: path of a GeoJSON file, or a file object opened in text or binary mode
+    :param options: optional parameters
+        [options["bbox"]]: only yield the features overlapping this bounding box,
+                           in [minX, minY, maxX, maxY] order. Features without geometry are skipped.
+        [options["chunk_size"]=65536]: number of characters read from the file at a time
+    :return: generator of feature dictionaries
+    """
+    if not isinstance(options, dict):
+        options = {}
+
+    filter_bbox = options.get("bbox", None)
+    chunk_size = options.get("chunk_size", 65536)
+
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise InvalidInput(
+            error_code_messages["InvalidOption"]("chunk_size", chunk_size)
+        )
+
+    if isinstance(path_or_file, (str, PathLike)):
+        with open(path_or_file, "r", encoding="utf-8") as f:
+            yield from iter_stream_features(JsonStream(f, chunk_size), filter_bbox)
+    else:
+        yield from iter_stream_features(
+            JsonStream(path_or_file, chunk_size), filter_bbox
+        )
+
+
+def iter_stream_features(
+    stream: "JsonStream", filter_bbox: Union[Sequence, None]
+) -> Iterator[Dict]:
+    """
+    Walks the members of the top level object until the "features" array is found,
+    and yields its items.
+
+    :param stream: JsonStream positioned at the start of the document
+    :param filter_bbox: optional bounding box filter
+    :return: generator of feature dictionaries
+    """
+    if stream.next_char() != "{":
+        raise InvalidInput(error_code_messages["InvalidFeatureCollection"])
+
+    while stream.next_char(consume=False) != "}":
+        key = stream.decode()
+        stream.expect(":")
+
+        if key != "features":
+            # other members (type, bbox, crs, ...) are parsed and dropped
+            stream.decode()
+        else:
+            stream.expect("[")
+
+            while stream.next_char(consume=False) != "]":
+                feature = stream.decode()
+
+                if filter_bbox is None or overlaps(feature, filter_bbox):
+                    yield feature
+
+                stream.skip_separator("]")
+
+            return
+
+        stream.skip_separator("}")
+
+    raise InvalidInput(error_code_messages["InvalidFeatureCollection"])
+
+
+def overlaps(feature: Dict, filter_bbox: Sequence) -> bool:
+    """
+    :param feature: feature dictionary
+    :param filter_bbox: bounding box in [minX, minY, maxX, maxY] order
+    :return: True if the feature has a geometry overlapping the bounding box
+    """
+    if not isinstance(feature, dict) or not feature.get("geometry"):
+        return False
+
+    west, south, east, north = bounding_box(feature)
+
+    return (
+        west <= filter_bbox[2]
+        and filter_bbox[0] <= east
+        and south <= filter_bbox[3]
+        and filter_bbox[1] <= north
+    )
+
+
+class JsonStream:
+    """
+    Buffered reader decoding the JSON values of a file one by one, so that a value is
+    only parsed once it has been read completely.
+    """
+
+    __slots__ = ("file", "chunk_size", "buffer", "pos", "eof", "decoder", "text")
+
+    def __init__(self, file: IO, chunk_size: int) -> None:
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+        # binary files are decoded incrementally, multi-byte characters may span chunks
+        self.text = codecs.getincrementaldecoder("utf-8")()
+
+    def fill(self, size: int) -> bool:
+        """
+        Reads more data into the buffer, dropping the part that was already consumed.
+
+        :param size: number of characters to read
+        :return: False if the end of the file was reached, True otherwise
+        """
+        if self.eof:
+            return False
+
+        data = self.file.read(size)
+
+        while isinstance(data, bytes):
+            text = self.text.decode(data, final=not data)
+
+            # a chunk may only hold part of a multi-byte character
+            data = text if text or not data else self.file.read(size)
+
+        if not data:
+            self.eof = True
+            return False
+
+        self.buffer = self.buffer[self.pos :] + data
+        self.pos = 0
+
+        return True
+
+    def next_char(self, consume: bool = True) -> str:
+        """
+        Skips whitespace and returns the next character.
+
+        :param consume: True to move past the returned character
+        :return: next non whitespace character
+        """
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in whitespace:
+                self.pos += 1
+
+            if self.pos < len(self.buffer):
+                char = self.buffer[self.pos]
+
+                if consume:
+                    self.pos += 1
+
+                return char
+
+            if not self.fill(self.chunk_size):
+                raise InvalidInput(error_code_messages["InvalidFeatureCollection"])
+
+    def expect(self, char: str) -> None:
+        """
+        Consumes the next character, which must be the given one.
+
+        :param char: expected character
+        """
+        if self.next_char() != char:
+            raise InvalidInput(error_code_messages["InvalidFeatureCollection"])
+
+    def skip_separator(self, closing: str) -> None:
+        """
+        Consumes the comma after an item of an array or object. Without comma, the next
+        character must close the array or object, and is left for the caller.
+
+        :param closing: closing character of the array or object
+        """
+        char = self.next_char(consume=False)
+
+        if char == ",":
+            self.pos += 1
+        elif char != closing:
+            raise InvalidInput(error_code_messages["InvalidFeatureCollection"])
+
+    def decode(self):
+        """
+        Decodes the next JSON value. More data is read until the value is complete; values
+        ending at the end of the buffer (e.g. numbers) are only accepted at the end of the file.
+
+        :return: decoded value
+        """
+        self.next_char(consume=False)
+        size = self.chunk_size
+
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as error:
+                # malformed input is reported right away, truncated input at the end of
+                # the file, rather than reading the rest of the file into the buffer
+                cut = (
+                    error.msg.startswith("Unterminated string")
+                    or len(self.buffer) - error.pos <= max_cut_length
+                )
+
+                if not cut or not self.fill(size):
+                    raise InvalidInput(
+                        error_code_messages["InvalidJSON"](error)
+                    ) from error
+
+            else:
+                if end < len(self.buffer) or not self.fill(size):
+                    self.pos = end
+                    return value
+
+            # large values: read in growing chunks to avoid decoding them too many times
+            size *= 2
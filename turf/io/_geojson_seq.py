@@ -0,0 +1,202 @@
+import codecs
+import io
+import json
+from os import PathLike
+from typing import IO, Dict, Iterable, Iterator, Union
+
+from turf.utils.error_codes import error_code_messages
+from turf.utils.exceptions import InvalidInput
+
+# RFC 8142 / RFC 7464 record separator
+RS = "\x1e"
+
+separators = {"geojsonseq": RS, "ndjson": "\n"}
+
+
+def read_geojson_seq(
+    path_or_file: Union[str, PathLike, IO], options: Dict = None
+) -> Iterator[Dict]:
+    """
+    Reads a GeoJSON Text Sequence (RFC 8142) or a newline delimited GeoJSON file lazily,
+    yielding one GeoJSON object (usually a feature) per record.
+
+    :param path_or_file: path of the file, or a file object opened in text or binary mode
+    :param options: optional parameters
+        [options["format"]="geojsonseq"]: "geojsonseq" for records starting with the RS
+                                          character, "ndjson" for one record per line
+        [options["chunk_size"]=65536]: number of characters read from the file at a time
+    :return: generator of GeoJSON dictionaries
+    """
+    if not isinstance(options, dict):
+        options = {}
+
+    seq_format = get_format(options)
+    chunk_size = options.get("chunk_size", 65536)
+
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise InvalidInput(
+            error_code_messages["InvalidOption"]("chunk_size", chunk_size)
+        )
+
+    if isinstance(path_or_file, (str, PathLike)):
+        with open(path_or_file, "r", encoding="utf-8", newline="") as f:
+            yield from iter_records(f, separators[seq_format], chunk_size)
+    else:
+        yield from iter_records(path_or_file, separators[seq_format], chunk_size)
+
+
+def write_geojson_seq(
+    features: Iterable[Union[Dict, object]],
+    path_or_file: Union[str, PathLike, IO],
+    options: Dict = None,
+) -> int:
+    """
+    Writes features as a GeoJSON Text Sequence (RFC 8142) or as newline delimited GeoJSON.
+    The features are consumed lazily, serialized compactly and written in large batches.
+
+    :param features: iterable (e.g. generator) of GeoJSON dictionaries or Feature objects
+    :param path_or_file: path of the file, or a file object opened in text or binary mode
+    :param options: optional parameters
+        [options["format"]="geojsonseq"]: "geojsonseq" to prefix each record with the RS
+                                          character, "ndjson" for one record per line
+        [options["buffer_size"]=1048576]: number of characters buffered between writes
+    :return: number of features written
+    """
+    if not isinstance(options, dict):
+        options = {}
+
+    seq_format = get_format(options)
+    buffer_size = options.get("buffer_size", 2**20)
+
+    if not isinstance(buffer_size, int) or buffer_size < 1:
+        raise InvalidInput(
+            error_code_messages["InvalidOption"]("buffer_size", buffer_size)
+        )
+
+    if isinstance(path_or_file, (str, PathLike)):
+        with open(path_or_file, "w", encoding="utf-8", newline="") as f:
+            return write_records(features, f, seq_format, buffer_size)
+
+    return write_records(features, path_or_file, seq_format, buffer_size)
+
+
+def get_format(options: Dict) -> str:
+    """
+    :param options: reader or writer options
+    :return: validated sequence format
+    """
+    seq_format = options.get("format", "geojsonseq")
+
+    if seq_format not in separators:
+        raise InvalidInput(error_code_messages["InvalidOption"]("format", seq_format))
+
+    return seq_format
+
+
+def iter_records(file: IO, separator: str, chunk_size: int) -> Iterator[Dict]:
+    """
+    Splits a file into records and decodes them.
+
+    :param file: file object opened in text or binary mode
+    :param separator: record separator
+    :param chunk_size: number of characters read at a time
+    :return: generator of decoded records, empty records are skipped
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    # pieces of the current record, joined once it is complete: only the new data is
+    # searched for separators, however long the record is
+    pending = []
+
+    while True:
+        data = file.read(chunk_size)
+        at_end = not data
+
+        if isinstance(data, bytes):
+            data = decoder.decode(data, final=at_end)
+
+        *records, last = data.split(separator)
+
+        if records:
+            pending.append(records[0])
+            records[0] = "".join(pending)
+            pending = []
+
+        # the last record may be incomplete until the end of the file
+        if last:
+            pending.append(last)
+
+        if at_end and pending:
+            records.append("".join(pending))
+
+        for record in records:
+            record = record.strip(RS + " \t\r\n")
+
+            if record:
+                try:
+                    value = json.loads(record)
+                except json.JSONDecodeError as error:
+                    raise InvalidInput(
+                        error_code_messages["InvalidJSON"](error)
+                    ) from error
+
+                yield value
+
+        if at_end:
+            return
+
+
+def write_records(
+    features: Iterable[Union[Dict, object]], file: IO, seq_format: str, buffer_size: int
+) -> int:
+    """
+    Serializes the features and writes them in batches.
+
+    :param features: iterable of GeoJSON dictionaries or Feature objects
+    :param file: file object opened in text or binary mode
+    :param seq_format: "geojsonseq" or "ndjson"
+    :param buffer_size: number of characters buffered between writes
+    :return: number of features written
+    """
+    prefix = RS if seq_format == "geojsonseq" else ""
+    binary_types = (io.BufferedIOBase, io.RawIOBase)
+    is_binary = isinstance(file, binary_types) or "b" in getattr(file, "mode", "")
+
+    encoder = json.JSONEncoder(separators=(",", ":"), default=to_geojson)
+
+    batch = []
+    batch_size = 0
+    count = 0
+
+    def flush():
+        text = "".join(batch)
+        file.write(text.encode("utf-8") if is_binary else text)
+
+    for feature in features:
+        record = f"{prefix}{encoder.encode(feature)}\n"
+
+        batch.append(record)
+        batch_size += len(record)
+        count += 1
+
+        if batch_size >= buffer_size:
+            flush()
+            batch = []
+            batch_size = 0
+
+    if batch:
+        flush()
+
+    return count
+
+
+def to_geojson(obj: object) -> Dict:
+    """
+    Serializes the turf geometry and feature objects through their GeoJSON representation.
+
+    :param obj: object that json can't serialize by itself
+    :return: GeoJSON dictionary
+    """
+    if hasattr(obj, "to_geojson"):
+        return obj.to_geojson()
+
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
@@ -0,0 +1,183 @@
+import io
+import json
+import pytest
+
+from turf.boolean_point_in_polygon import boolean_point_in_polygon
+from turf.helpers import point, polygon
+from turf.io import read_geojson_seq, write_geojson_seq
+from turf.square_grid import iter_square_grid, square_grid
+
+from turf.utils.error_codes import error_code_messages
+from turf.utils.exceptions import InvalidInput
+
+features = [
+    point([(i * 37) % 20 - 10, (i * 53) % 20 - 10], {"id": i, "name": "ñandú" * i})
+    for i in range(100)
+]
+
+
+class TestGeoJSONSeq:
+    @pytest.mark.parametrize("seq_format", ["geojsonseq", "ndjson"])
+    @pytest.mark.parametrize("buffer_size", [1, 2**20])
+    @pytest.mark.parametrize("chunk_size", [1, 65536])
+    def test_round_trip(self, tmp_path, seq_format, buffer_size, chunk_size):
+        path = tmp_path / f"features.{seq_format}"
+
+        count = write_geojson_seq(
+            iter(features), path, {"format": seq_format, "buffer_size": buffer_size}
+        )
+
+        assert count == len(features)
+
+        result = read_geojson_seq(
+            path, {"format": seq_format, "chunk_size": chunk_size}
+        )
+
+        assert list(result) == features
+
+    @pytest.mark.parametrize(
+        "seq_format,expected",
+        [
+            pytest.param(
+                "geojsonseq", '\x1e{"a":1}\n\x1e{"a":[1,2]}\n', id="geojsonseq"
+            ),
+            pytest.param("ndjson", '{"a":1}\n{"a":[1,2]}\n', id="ndjson"),
+        ],
+    )
+    def test_write_format(self, seq_format, expected):
+        text = io.StringIO()
+        write_geojson_seq([{"a": 1}, {"a": [1, 2]}], text, {"format": seq_format})
+
+        assert text.getvalue() == expected
+
+        binary = io.BytesIO()
+        write_geojson_seq([{"a": 1}, {"a": [1, 2]}], binary, {"format": seq_format})
+
+        assert binary.getvalue() == expected.encode()
+
+    def test_read_binary(self):
+        text = "".join(f"\x1e{json.dumps(f, ensure_ascii=False)}\n" for f in features)
+        stream = io.BytesIO(text.encode())
+
+        assert list(read_geojson_seq(stream, {"chunk_size": 3})) == features
+
+    @pytest.mark.parametrize("seq_format", ["geojsonseq", "ndjson"])
+    def test_read_records_larger_than_chunks(self, seq_format):
+        ring = [[i / 1000, i % 7 / 1000] for i in range(5000)] + [[0, 0]]
+        large = polygon([ring], {"name": "Zürich"})
+        prefix = "\x1e" if seq_format == "geojsonseq" else ""
+        text = "".join(
+            f"{prefix}{json.dumps(f, ensure_ascii=False)}\n"
+            for f in [features[0], large, features[1]]
+        )
+        options = {"format": seq_format, "chunk_size": 64}
+
+        assert list(read_geojson_seq(io.StringIO(text), options)) == [
+            features[0],
+            large,
+            features[1],
+        ]
+        assert list(read_geojson_seq(io.BytesIO(text.encode()), options)) == [
+            features[0],
+            large,
+            features[1],
+        ]
+
+    def test_read_tolerates_blank_records(self):
+        text = '\x1e{"a":1}\r\n\x1e\n\x1e  {"a":2}  \n'
+
+        assert list(read_geojson_seq(io.StringIO(text))) == [
+            {"a": 1},
+            {"a": 2},
+        ]
+        assert list(
+            read_geojson_seq(io.StringIO('{"a":1}\n\n{"a":2}'), {"format": "ndjson"})
+        ) == [{"a": 1}, {"a": 2}]
+
+    @pytest.mark.parametrize("seq_format", ["geojsonseq", "ndjson"])
+    def test_read_malformed_record(self, seq_format):
+        text = io.StringIO()
+        write_geojson_seq(features[:2], text, {"format": seq_format})
+        text = io.StringIO(text.getvalue().replace('"Feature"', "Feature", 1))
+
+        with pytest.raises(InvalidInput) as excinfo:
+            list(read_geojson_seq(text, {"format": seq_format}))
+
+        assert str(excinfo.value).startswith("Input is not valid JSON")
+
+    def test_feature_objects(self):
+        text = io.StringIO()
+        pt = point([1, 2], {"id": 1}, as_geojson=False)
+
+        write_geojson_seq([pt], text, {"format": "ndjson"})
+
+        assert json.loads(text.getvalue()) == pt.to_geojson()
+
+    def test_pipeline(self):
+        area = polygon([[[0, 0], [10, 0], [10, 10], [0, 10], [0, 0]]])
+
+        source = io.StringIO()
+        write_geojson_seq(features, source)
+        source.seek(0)
+
+        target = io.StringIO()
+        count = write_geojson_seq(
+            (f for f in read_geojson_seq(source) if boolean_point_in_polygon(f, area)),
+            target,
+        )
+        target.seek(0)
+
+        expected = [f for f in features if boolean_point_in_polygon(f, area)]
+
+        assert count == len(expected)
+        assert list(read_geojson_seq(target)) == expected
+
+    def test_grid(self):
+        bbox = [0, 0, 1, 1]
+        target = io.StringIO()
+
+        count = write_geojson_seq(iter_square_grid(bbox, 10), target)
+        target.seek(0)
+
+        expected = square_grid(bbox, 10)["features"]
+
+        assert count == len(expected)
+        assert list(read_geojson_seq(target)) == expected
+
+    @pytest.mark.parametrize(
+        "function,options,exception_value",
+        [
+            pytest.param(
+                read_geojson_seq,
+                {"format": "geojson"},
+                error_code_messages["InvalidOption"]("format", "geojson"),
+                id="read-format",
+            ),
+            pytest.param(
+                read_geojson_seq,
+                {"chunk_size": 0},
+                error_code_messages["InvalidOption"]("chunk_size", 0),
+                id="read-chunk-size",
+            ),
+            pytest.param(
+                write_geojson_seq,
+                {"format": "geojson"},
+                error_code_messages["InvalidOption"]("format", "geojson"),
+                id="write-format",
+            ),
+            pytest.param(
+                write_geojson_seq,
+                {"buffer_size": 0},
+                error_code_messages["InvalidOption"]("buffer_size", 0),
+                id="write-buffer-size",
+            ),
+        ],
+    )
+    def test_exception(self, function, options, exception_value):
+        with pytest.raises(InvalidInput) as excinfo:
+            if function is read_geojson_seq:
+                list(function(io.StringIO(), options))
+            else:
+                function([], io.StringIO(), options)
+
+        assert str(excinfo.value) == exception_value
@@ -0,0 +1,129 @@
+import io
+import json
+import pytest
+
+from turf.helpers import feature_collection, line_string, point
+from turf.io import iter_features
+
+from turf.utils.error_codes import error_code_messages
+from turf.utils.exceptions import InvalidInput
+
+features = [
+    point([(i * 37) % 20 - 10, (i * 53) % 20 - 10], {"id": i, "name": "ñandú" * i})
+    for i in range(50)
+] + [
+    line_string([[-20, -20], [-15, -15]], {"id": 50}),
+    line_string([[-20, 0], [20, 0]], {"id": 51}),
+    {"type": "Feature", "properties": {"id": 52}, "geometry": None},
+]
+
+collection = {
+    "type": "FeatureCollection",
+    "bbox": [-20, -20, 20, 20],
+    "features": features,
+    "properties": {"source": "test"},
+}
+
+
+class TestIterFeatures:
+    @pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_file_objects(self, chunk_size, indent):
+        text = json.dumps(collection, indent=indent, ensure_ascii=False)
+        options = {"chunk_size": chunk_size}
+
+        assert list(iter_features(io.StringIO(text), options)) == features
+        assert list(iter_features(io.BytesIO(text.encode()), options)) == features
+
+    def test_path(self, tmp_path):
+        path = tmp_path / "collection.geojson"
+        path.write_text(json.dumps(collection))
+
+        assert list(iter_features(path)) == features
+        assert list(iter_features(str(path))) == features
+
+    def test_lazy(self):
+        text = json.dumps(collection)
+        # the document is truncated after the first feature
+        stream = io.StringIO(text[: text.index(json.dumps(features[1]))])
+
+        features_iter = iter_features(stream)
+
+        assert next(features_iter) == features[0]
+
+        with pytest.raises(InvalidInput):
+            next(features_iter)
+
+    def test_bbox(self):
+        result = list(
+            iter_features(io.StringIO(json.dumps(collection)), {"bbox": [0, 0, 10, 10]})
+        )
+
+        expected = [
+            f
+            for f in features[:50]
+            if f["geometry"]["coordinates"][0] >= 0
+            and f["geometry"]["coordinates"][1] >= 0
+        ]
+
+        assert result == expected + [features[51]]
+
+    def test_empty(self):
+        text = json.dumps(feature_collection([]))
+
+        assert list(iter_features(io.StringIO(text))) == []
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            pytest.param("[]", id="array"),
+            pytest.param('{"type": "FeatureCollection"}', id="no-features"),
+            pytest.param('{"type": "FeatureCollection", "features": {}}', id="object"),
+            pytest.param("", id="empty-file"),
+            pytest.param(
+                json.dumps(collection).replace("}}, {", "}} {", 1), id="missing-comma"
+            ),
+        ],
+    )
+    def test_invalid_collection(self, text):
+        with pytest.raises(InvalidInput) as excinfo:
+            list(iter_features(io.StringIO(text)))
+
+        assert str(excinfo.value) == error_code_messages["InvalidFeatureCollection"]
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            pytest.param(json.dumps(collection)[:-200], id="truncated"),
+            pytest.param(
+                '{"type": "FeatureCollection", "features": [{"type": Feature}]}',
+                id="malformed",
+            ),
+        ],
+    )
+    def test_invalid_json(self, tmp_path, text):
+        path = tmp_path / "invalid.geojson"
+        path.write_text(text)
+
+        with pytest.raises(InvalidInput) as excinfo:
+            list(iter_features(path, {"chunk_size": 64}))
+
+        assert str(excinfo.value).startswith("Input is not valid JSON")
+
+    def test_malformed_json_read_early(self):
+        text = json.dumps(collection).replace('"Feature"', "Feature", 1)
+        f = io.StringIO(text * 100)
+
+        with pytest.raises(InvalidInput):
+            list(iter_features(f, {"chunk_size": 64}))
+
+        # the rest of the file is not read into memory
+        assert f.tell() < 1000
+
+    def test_invalid_chunk_size(self):
+        with pytest.raises(InvalidInput) as excinfo:
+            list(iter_features(io.StringIO("{}"), {"chunk_size": 0}))
+
+        assert str(excinfo.value) == error_code_messages["InvalidOption"](
+            "chunk_size", 0
+        )
@@ -0,0 +1,11 @@
+from turf.kernels._kernels import (
+    bearing,
+    check_degrees,
+    destination,
+    haversine,
+    haversine_row,
+    latitude_cosine,
+    rhumb_bearing,
+    rhumb_destination,
+    rhumb_distance,
+)
@@ -0,0 +1,269 @@
+from math import asin, atan2, cos, fmod, log, pi, sin, sqrt, tan
+from typing import Iterable, List, Tuple
+
+from turf.helpers import earth_radius
+from turf.utils.error_codes import error_code_messages
+from turf.utils.exceptions import InvalidInput
+
+# Plain float kernels, without validation nor GeoJSON wrapping: the public functions
+# validate their input once and call these in their inner loops. The angle conversions
+# are the ones of degrees_to_radians and radians_to_degrees, so results are unchanged.
+
+
+def check_degrees(*angles: float) -> None:
+    """
+    Same check as `degrees_to_radians`, done once at the boundary of a public function.
+
+    :param angles: angles (or coordinates) in degrees
+    """
+    for angle in angles:
+        if not isinstance(angle, (float, int)):
+            raise InvalidInput(error_code_messages["InvalidDegrees"])
+
+
+def to_radians(degrees: float) -> float:
+    """
+    :param degrees: degrees angle
+    :return: angle in radians
+    """
+    return (degrees - int(degrees / 360) * 360) * pi / 180
+
+
+def to_degrees(radians: float) -> float:
+    """
+    :param radians: angle in radians
+    :return: angle in degrees
+    """
+    return (radians - int(radians / (2 * pi)) * (2 * pi)) * 180 / pi
+
+
+def haversine(lng1: float, lat1: float, lng2: float, lat2: float) -> float:
+    """
+    Great-circle distance between two positions, with the Haversine formula.
+
+    :param lng1: longitude of the starting point
+    :param lat1: latitude of the starting point
+    :param lng2: longitude of the ending point
+    :param lat2: latitude of the ending point
+    :return: distance in radians
+    """
+    d_lat = to_radians(lat2 - lat1)
+    d_lon = to_radians(lng2 - lng1)
+
+    lat1 = to_radians(lat1)
+    lat2 = to_radians(lat2)
+
+    d = sin(d_lat / 2) ** 2 + sin(d_lon / 2) ** 2 * cos(lat1) * cos(lat2)
+
+    return 2 * atan2(sqrt(d), sqrt(1 - d))
+
+
+def latitude_cosine(lat: float) -> float:
+    """
+    :param lat: latitude in degrees
+    :return: cosine of the latitude, as used by `haversine_row`
+    """
+    return cos(to_radians(lat))
+
+
+def haversine_row(
+    lng1: float, lat1: float, destinations: Iterable[Tuple], factor: float = 1.0
+) -> List[float]:
+    """
+    Same as `haversine`, from one starting point to many ending points whose latitude
+    cosines are computed once, e.g. for every row of a distance matrix.
+
+    :param lng1: longitude of the starting point
+    :param lat1: latitude of the starting point
+    :param destinations: iterable of (lng, lat, latitude_cosine(lat)) ending points
+    :param factor: conversion factor applied to the distances in radians
+    :return: list of distances, in radians times factor
+    """
+    cos1 = cos(to_radians(lat1))
+    distances = []
+
+    for lng2, lat2, cos2 in destinations:
+        d_lat = lat2 - lat1
+        d_lng = lng2 - lng1
+
+        # modulo of to_radians, a no-op for the usual differences of less than a turn,
+        # only computed when needed as this is the inner loop of distance_matrix
+        if not (-360 < d_lat < 360 and -360 < d_lng < 360):
+            d_lat -= int(d_lat / 360) * 360
+            d_lng -= int(d_lng / 360) * 360
+
+        d = (
+            sin(d_lat * pi / 180 / 2) ** 2
+            + sin(d_lng * pi / 180 / 2) ** 2 * cos1 * cos2
+        )
+
+        distances.append(2 * atan2(sqrt(d), sqrt(1 - d)) * factor)
+
+    return distances
+
+
+def destination(
+    lng: float, lat: float, distance: float, bearing: float
+) -> Tuple[float, float]:
+    """
+    Position reached from a starting point after travelling along a great circle.
+
+    :param lng: longitude of the starting point
+    :param lat: latitude of the starting point
+    :param distance: distance travelled, in radians
+    :param bearing: initial bearing in degrees
+    :return: (lng, lat) of the destination, not truncated
+    """
+    longitude1 = to_radians(lng)
+    latitude1 = to_radians(lat)
+    bearing_rads = to_radians(bearing)
+
+    latitude2 = asin(
+        sin(latitude1) * cos(distance)
+        + cos(latitude1) * sin(distance) * cos(bearing_rads)
+    )
+
+    longitude2 = longitude1 + atan2(
+        sin(bearing_rads) * sin(distance) * cos(latitude1),
+        cos(distance) - sin(latitude1) * sin(latitude2),
+    )
+
+    return to_degrees(longitude2), to_degrees(latitude2)
+
+
+def bearing(lng1: float, lat1: float, lng2: float, lat2: float) -> float:
+    """
+    Initial great-circle bearing from a starting point towards an ending point.
+
+    :param lng1: longitude of the starting point
+    :param lat1: latitude of the starting point
+    :param lng2: longitude of the ending point
+    :param lat2: latitude of the ending point
+    :return: bearing in degrees, between -180 and 180
+    """
+    lon1 = to_radians(lng1)
+    lon2 = to_radians(lng2)
+    lat1 = to_radians(lat1)
+    lat2 = to_radians(lat2)
+
+    a = sin(lon2 - lon1) * cos(lat2)
+
+    b = cos(lat1) * sin(lat2) - sin(lat1) * cos(lat2) * cos(lon2 - lon1)
+
+    return to_degrees(atan2(a, b))
+
+
+def rhumb_bearing(lng1: float, lat1: float, lng2: float, lat2: float) -> float:
+    """
+    Bearing from a starting point towards an ending point along a rhumb line.
+    http://www.edwilliams.org/avform.htm#Rhumb
+
+    :param lng1: longitude of the starting point
+    :param lat1: latitude of the starting point
+    :param lng2: longitude of the ending point
+    :param lat2: latitude of the ending point
+    :return: bearing in degrees, between 0 and 360
+    """
+    phi_1 = to_radians(lat1)
+    phi_2 = to_radians(lat2)
+    delta_lambda = to_radians(lng2 - lng1)
+
+    # if delta_lambda over 180° take shorter rhumb line across the anti-meridian:
+    if abs(delta_lambda) > pi:
+        if delta_lambda > 0:
+            delta_lambda = -(2 * pi - delta_lambda)
+        if delta_lambda < 0:
+            delta_lambda = 2 * pi + delta_lambda
+
+    delta_psi = log(tan(phi_2 / 2 + pi / 4) / tan(phi_1 / 2 + pi / 4))
+    theta = atan2(delta_lambda, delta_psi)
+
+    return fmod(to_degrees(theta) + 360, 360)
+
+
+def rhumb_distance(
+    lng1: float, lat1: float, lng2: float, lat2: float, radius: float = earth_radius
+) -> float:
+    """
+    Distance between two points along a rhumb line.
+
+    :param lng1: longitude of the starting point
+    :param lat1: latitude of the starting point
+    :param lng2: longitude of the ending point
+    :param lat2: latitude of the ending point
+    :param radius: radius of the earth
+    :return: distance in the units of the radius (default: meters)
+    """
+    phi_1 = to_radians(lat1)
+    phi_2 = to_radians(lat2)
+    delta_phi = phi_2 - phi_1
+
+    delta_lambda = to_radians(abs(lng2 - lng1))
+
+    # if dLon over 180° take shorter rhumb line across the anti-meridian:
+    if delta_lambda > pi:
+        delta_lambda -= 2 * pi
+
+    # on Mercator projection, longitude distances shrink by latitude; q is the 'stretch factor'
+    # q becomes ill-conditioned along E-W line (0/0); use empirical tolerance to avoid it
+    delta_psi = log(tan(phi_2 / 2 + pi / 4) / tan(phi_1 / 2 + pi / 4))
+
+    if abs(delta_psi) > 10e-12:
+        q_1 = delta_phi / delta_psi
+    else:
+        q_1 = cos(phi_1)
+
+    # distance is pythagoras on 'stretched' Mercator projection
+    delta = sqrt(delta_phi * delta_phi + q_1 * q_1 * delta_lambda * delta_lambda)
+
+    return delta * radius
+
+
+def rhumb_destination(
+    lng: float,
+    lat: float,
+    distance: float,
+    bearing: float,
+    radius: float = earth_radius,
+) -> Tuple[float, float]:
+    """
+    Position reached from a starting point after travelling along a rhumb line.
+    Adapted from Geodesy: http://www.movable-type.co.uk/scripts/latlong.html#rhumblines
+
+    :param lng: longitude of the starting point
+    :param lat: latitude of the starting point
+    :param distance: distance travelled, in the units of the radius (default: meters)
+    :param bearing: bearing in degrees from north
+    :param radius: radius of the earth
+    :return: (lng, lat) of the destination, with the longitude between -180 and 180
+    """
+    # angular distance in radians
+    delta = distance / radius
+    # to radians, but without normalize to pi
+    lambda_1 = lng * pi / 180
+
+    phi_1 = to_radians(lat)
+    theta = to_radians(bearing)
+
+    delta_phi = delta * cos(theta)
+    phi_2 = phi_1 + delta_phi
+
+    # check for some points going past the pole, normalise latitude if so
+    if abs(phi_2) > (pi / 2) and (phi_2 > 0):
+        phi_2 = pi - phi_2
+    if abs(phi_2) > (pi / 2) and (phi_2 < 0):
+        phi_2 = pi - phi_2
+
+    delta_psi = log(tan(phi_2 / 2 + pi / 4) / tan(phi_1 / 2 + pi / 4))
+
+    # E-W course becomes ill-conditioned with 0/0
+    if abs(delta_psi) > 10e-12:
+        q_1 = delta_phi / delta_psi
+    else:
+        q_1 = cos(phi_1)
+
+    delta_lambda = delta * sin(theta) / q_1
+    lambda_2 = lambda_1 + delta_lambda
+
+    # normalise to −180..+180°
+    return fmod(((lambda_2 * 180 / pi) + 540), 360) - 180, (phi_2 * 180 / pi)
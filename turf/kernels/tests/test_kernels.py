@@ -0,0 +1,87 @@
+import pytest
+
+from turf.bearing import bearing
+from turf.destination import destination
+from turf.distance import distance
+from turf.helpers import convert_length, length_to_radians, radians_to_length
+from turf.kernels import (
+    bearing as bearing_kernel,
+    check_degrees,
+    destination as destination_kernel,
+    haversine,
+    haversine_row,
+    latitude_cosine,
+    rhumb_bearing as rhumb_bearing_kernel,
+    rhumb_destination as rhumb_destination_kernel,
+    rhumb_distance as rhumb_distance_kernel,
+)
+from turf.rhumb_bearing import rhumb_bearing
+from turf.rhumb_destination import rhumb_destination
+from turf.rhumb_distance import rhumb_distance
+from turf.utils.error_codes import error_code_messages
+from turf.utils.exceptions import InvalidInput
+from turf.utils.helpers import truncate
+
+pairs = [
+    ([-75.343, 39.984], [-75.534, 39.123]),
+    ([-75, 45], [20, 60]),
+    ([179.5, -10], [-179.5, 10]),
+    ([0, 0], [0, 0]),
+    ([-540.5, 89.9], [721, -89.9]),
+]
+
+
+class TestKernels:
+    @pytest.mark.parametrize("start, end", pairs)
+    def test_haversine(self, start, end):
+        assert haversine(*start, *end) * radians_to_length(1) == distance(start, end)
+
+    def test_haversine_row(self):
+        starts = [start for start, _ in pairs] + [end for _, end in pairs]
+        destinations = [(lng, lat, latitude_cosine(lat)) for lng, lat in starts]
+
+        for lng, lat in starts:
+            assert haversine_row(lng, lat, destinations, 2.0) == [
+                haversine(lng, lat, lng2, lat2) * 2.0 for lng2, lat2, _ in destinations
+            ]
+
+    @pytest.mark.parametrize("start, end", pairs)
+    def test_bearing(self, start, end):
+        assert bearing_kernel(*start, *end) == bearing(start, end)
+
+    @pytest.mark.parametrize("start, end", pairs)
+    def test_rhumb(self, start, end):
+        assert rhumb_bearing_kernel(*start, *end) == rhumb_bearing(start, end)
+
+        if abs(end[0] - start[0]) <= 180:
+            meters = rhumb_distance_kernel(*start, *end)
+
+            assert convert_length(meters, "meters") == rhumb_distance(start, end)
+
+    @pytest.mark.parametrize("origin", [start for start, _ in pairs])
+    @pytest.mark.parametrize("dist, bearing_value", [(50, 90), (1000, -135.5)])
+    def test_destination(self, origin, dist, bearing_value):
+        lng, lat = destination_kernel(*origin, length_to_radians(dist), bearing_value)
+
+        expected = destination(origin, dist, bearing_value)["geometry"]["coordinates"]
+
+        assert [truncate(lng, 6), truncate(lat, 6)] == expected
+
+    def test_rhumb_destination(self):
+        origin = {
+            "type": "Feature",
+            "properties": {"dist": 100, "bearing": 45},
+            "geometry": {"type": "Point", "coordinates": [-75, 39]},
+        }
+
+        expected = rhumb_destination(origin)["geometry"]["coordinates"]
+
+        assert list(rhumb_destination_kernel(-75, 39, 100000, 45)) == expected
+
+    def test_check_degrees(self):
+        check_degrees(1, 2.5, -720)
+
+        with pytest.raises(InvalidInput) as excinfo:
+            check_degrees(1, "2")
+
+        assert str(excinfo.value) == error_code_messages["InvalidDegrees"]
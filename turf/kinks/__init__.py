@@ -0,0 +1 @@
+from turf.kinks._kinks import kinks
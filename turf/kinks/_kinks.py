@@ -0,0 +1,75 @@
+from typing import Dict, List, Sequence, Union
+
+from turf.helpers import Feature, FeatureCollection
+from turf.invariant import get_coords_from_features, get_geometry_type
+from turf.line_intersect._line_intersect import collect_intersects
+from turf.line_intersect._sweep import sweep_filtering
+
+allowed_types = ["LineString", "MultiLineString", "Polygon", "MultiPolygon"]
+
+
+def kinks(feature: Union[Dict, Feature, FeatureCollection]) -> FeatureCollection:
+    """
+    Takes a LineString or Polygon and returns the points at all self-intersections.
+
+    Every pair of segments is checked once, except consecutive segments of the same line or
+    ring (and the first and last segments of a closed ring), which always share a vertex.
+    Candidate pairs are found with a sweep line over the segments sorted by longitude.
+
+    :param feature: any LineString, MultiLineString, Polygon or MultiPolygon
+    :return: FeatureCollection of Points at the self-intersections
+    """
+    lines = get_lines(feature)
+
+    segments = []
+    # for each segment: line index, segment index in the line, whether the line is closed
+    segment_lines = []
+
+    for line_index, line in enumerate(lines):
+        closed = line[0][0] == line[-1][0] and line[0][1] == line[-1][1]
+        n_segments = len(line) - 1
+
+        for i in range(n_segments):
+            segments.append((line[i], line[i + 1]))
+            segment_lines.append((line_index, i, n_segments, closed))
+
+    def skip(i: int, j: int) -> bool:
+        line_i, index_i, n_segments, closed = segment_lines[i]
+        line_j, index_j, _, _ = segment_lines[j]
+
+        if line_i != line_j:
+            return False
+
+        if index_j - index_i == 1:
+            return True
+
+        return closed and index_i == 0 and index_j == n_segments - 1
+
+    return collect_intersects(sweep_filtering(segments, None, skip))
+
+
+def get_lines(feature: Union[Dict, Feature, FeatureCollection]) -> List[Sequence]:
+    """
+    Gets the coordinates of all lines and rings of a feature
+
+    :param feature: any LineString, MultiLineString, Polygon or MultiPolygon
+    :return: list of line coordinates
+    """
+    geometry_type = get_geometry_type(feature, allowed_types)
+    coords = get_coords_from_features(feature, allowed_types)
+
+    if isinstance(geometry_type, str):
+        geometry_type = [geometry_type]
+        coords = [coords]
+
+    lines = []
+
+    for geo_type, geo_coords in zip(geometry_type, coords):
+        if geo_type == "LineString":
+            lines.append(geo_coords)
+        elif geo_type == "MultiPolygon":
+            lines.extend(ring for poly in geo_coords for ring in poly)
+        else:
+            lines.extend(geo_coords)
+
+    return lines
@@ -0,0 +1,98 @@
+import pytest
+
+from turf.helpers import (
+    feature_collection,
+    line_string,
+    multi_line_string,
+    multi_polygon,
+    point,
+    polygon,
+)
+from turf.kinks import kinks
+
+from turf.utils.error_codes import error_code_messages
+from turf.utils.exceptions import InvalidInput
+
+
+def get_coords(result):
+    return sorted(feature["geometry"]["coordinates"] for feature in result["features"])
+
+
+class TestKinks:
+    @pytest.mark.parametrize(
+        "input_value,expected_value",
+        [
+            pytest.param(
+                line_string([[0, 0], [2, 2], [2, 0], [0, 2]]),
+                [[1, 1]],
+                id="line-string",
+            ),
+            pytest.param(
+                polygon([[[0, 0], [2, 2], [2, 0], [0, 2], [0, 0]]]),
+                [[1, 1]],
+                id="bowtie-polygon",
+            ),
+            pytest.param(
+                polygon([[[0, 0], [4, 0], [4, 4], [0, 4], [0, 0]]]),
+                [],
+                id="simple-polygon",
+            ),
+            pytest.param(
+                polygon(
+                    [
+                        [[0, 0], [4, 0], [4, 4], [0, 4], [0, 0]],
+                        [[3, 1], [5, 1], [5, 3], [3, 3], [3, 1]],
+                    ]
+                ),
+                [[4, 1], [4, 3]],
+                id="hole-crossing-shell",
+            ),
+            pytest.param(
+                multi_line_string(
+                    [[[0, 0], [2, 0], [2, 2]], [[1, -1], [1, 1]], [[5, 5], [6, 6]]]
+                ),
+                [[1, 0]],
+                id="multi-line-string",
+            ),
+            pytest.param(
+                multi_polygon(
+                    [
+                        [[[0, 0], [2, 2], [2, 0], [0, 2], [0, 0]]],
+                        [[[10, 10], [11, 10], [11, 11], [10, 10]]],
+                    ]
+                ),
+                [[1, 1]],
+                id="multi-polygon",
+            ),
+            pytest.param(
+                feature_collection(
+                    [
+                        line_string([[0, 0], [2, 2]]),
+                        line_string([[0, 2], [2, 0]]),
+                    ]
+                ),
+                [[1, 1]],
+                id="feature-collection",
+            ),
+            pytest.param(
+                line_string([[0, 0], [1, 0], [1, 1], [0, 1], [0, 0], [-1, 0]]),
+                [[0, 0]],
+                id="line-crossing-its-start",
+            ),
+        ],
+    )
+    def test_kinks(self, input_value, expected_value):
+        assert get_coords(kinks(input_value)) == expected_value
+
+    def test_geometry_input(self):
+        line = line_string([[0, 0], [2, 2], [2, 0], [0, 2]])
+
+        assert kinks(line["geometry"]) == kinks(line)
+
+    def test_exception(self):
+        with pytest.raises(InvalidInput) as excinfo:
+            kinks(point([0, 0]))
+
+        assert str(excinfo.value) == error_code_messages["InvalidGeometry"](
+            ["LineString", "MultiLineString", "Polygon", "MultiPolygon"]
+        )
@@ -1,37 +1,112 @@
 from functools import reduce
 
-from turf.distance import distance
+from turf.helpers import ColumnarFeatureCollection, radians_to_length
+from turf.helpers import all_geometry_types as all_types
 from turf.invariant import get_coords_from_features
+from turf.kernels import haversine
+from turf.utils.error_codes import error_code_messages
+from turf.utils.exceptions import InvalidInput
+
+allowed_types = ["LineString", "MultiLineString", "Polygon", "MultiPolygon"]
 
 
 def length(features, options=None):
     """
     Calculates the total length of the input Feature / FeatureCollection in the specified units.
 
-    :param features: a Feature / FeatureCollection of types LineString, MultiLineString, Polygon or MultiPolygon
+    :param features: a Feature / FeatureCollection of types LineString, MultiLineString, Polygon or MultiPolygon,
+        or a ColumnarFeatureCollection of those types
     :param options: optional parameters
         [options["units"]=kilometers] can be degrees, radians, miles, or kilometers
     :return: the measured distance
     """
 
-    coords = get_coords_from_features(
-        features,
-        [
-            "LineString",
-            "MultiLineString",
-            "Polygon",
-            "MultiPolygon",
-        ],
-    )
+    if isinstance(features, ColumnarFeatureCollection):
+        return columnar_length(features, options)
+
+    kwargs = {}
+    if isinstance(options, dict) and "units" in options:
+        kwargs["units"] = options["units"]
+
+    coords = get_coords_from_features(features, allowed_types)
+
+    return coords_length(coords, radians_to_length(1, **kwargs))
+
+
+def coords_length(coords, factor):
+    """
+    Sums the length of the segments of the nested coordinates.
+
+    :param coords: coordinates of lines or polygons, or lists of them
+    :param factor: conversion factor from radians to the distance units
+    :return: the measured distance
+    """
 
     if any(isinstance(inner_item, list) for item in coords for inner_item in item):
-        distances = list(map(lambda sub_item: length(sub_item, options), coords))
-        return sum(distances)
+        return sum(coords_length(sub_item, factor) for sub_item in coords)
 
     total_distance = reduce(
-        lambda accum, coord: accum + distance(coord[0], coord[1], options),
+        lambda accum, coord: accum
+        + haversine(coord[0][0], coord[0][1], coord[1][0], coord[1][1]) * factor,
         zip(coords, coords[1:]),
         0,
     )
 
     return total_distance
+
+
+def columnar_length(collection, options=None):
+    """
+    Length of a ColumnarFeatureCollection, summed in the same order as for the
+    equivalent FeatureCollection.
+
+    :param collection: ColumnarFeatureCollection of lines or polygons
+    :param options: optional parameters
+        [options["units"]=kilometers] can be degrees, radians, miles, or kilometers
+    :return: the measured distance
+    """
+
+    kwargs = {}
+    if isinstance(options, dict) and "units" in options:
+        kwargs["units"] = options["units"]
+
+    factor = radians_to_length(1, **kwargs)
+
+    allowed_codes = [all_types.index(geo_type) + 1 for geo_type in allowed_types]
+
+    if any(code not in allowed_codes for code in collection.geometry_types):
+        raise InvalidInput(error_code_messages["InvalidGeometry"](allowed_types))
+
+    coords = collection.coords
+    ring_offsets = collection.ring_offsets
+    part_offsets = collection.part_offsets
+    geometry_offsets = collection.geometry_offsets
+
+    def ring_length(ring):
+        total_distance = 0
+
+        for c in range(ring_offsets[ring], ring_offsets[ring + 1] - 1):
+            x1, y1, x2, y2 = coords[2 * c : 2 * c + 4]
+            total_distance += haversine(x1, y1, x2, y2) * factor
+
+        return total_distance
+
+    def part_length(part):
+        return sum(
+            ring_length(ring)
+            for ring in range(part_offsets[part], part_offsets[part + 1])
+        )
+
+    lengths = []
+
+    for i, code in enumerate(collection.geometry_types):
+        parts = range(geometry_offsets[i], geometry_offsets[i + 1])
+
+        if all_types[code - 1] == "LineString":
+            lengths.append(ring_length(part_offsets[parts[0]]))
+        elif all_types[code - 1] == "MultiPolygon":
+            lengths.append(sum(part_length(part) for part in parts))
+        else:
+            lengths.append(part_length(parts[0]))
+
+    return sum(lengths)
@@ -8,12 +8,34 @@ from turf.utils.exceptions import InvalidInput
 from turf.utils.error_codes import error_code_messages
 from turf.utils.test_setup import get_fixtures
 from turf.length import length
+from turf.helpers import ColumnarFeatureCollection, all_geometry_types
 
 current_path = os.path.dirname(os.path.realpath(__file__))
 
 fixtures = get_fixtures(current_path)
 
 
+def as_feature_collection(geojson):
+    """
+    Wraps a fixture in a FeatureCollection, or returns None if it can't be stored columnar.
+    """
+    if not isinstance(geojson, dict):
+        return None
+
+    if geojson.get("type") in all_geometry_types:
+        geojson = {"type": "Feature", "properties": {}, "geometry": geojson}
+
+    if geojson.get("type") == "Feature":
+        geojson = {"type": "FeatureCollection", "features": [geojson]}
+
+    try:
+        ColumnarFeatureCollection.from_geojson(geojson)
+    except InvalidInput:
+        return None
+
+    return geojson
+
+
 class TestLength:
     allowed_inpuy_types = [
         "LineString",
@@ -54,6 +76,21 @@ class TestLength:
 
         assert round(length(feature, {"units": "feet"})) == 15433
 
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            pytest.param(fixture, id=fixture_name)
+            for fixture_name, fixture in fixtures.items()
+            if as_feature_collection(fixture["in"])
+        ],
+    )
+    def test_columnar(self, fixture):
+        collection = as_feature_collection(fixture["in"])
+        columnar = ColumnarFeatureCollection.from_geojson(collection)
+
+        for options in [None, {"units": "miles"}]:
+            assert length(columnar, options) == length(collection, options)
+
     @pytest.mark.parametrize(
         "input_value, exception_value",
         [
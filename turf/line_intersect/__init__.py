@@ -1 +1 @@
-from turf.line_intersect._line_intersect import line_intersect
+from turf.line_intersect._line_intersect import line_intersect, SegmentIndex
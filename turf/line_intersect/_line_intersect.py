@@ -1,8 +1,6 @@
 from typing import Dict, Sequence, TypeVar, Union
 from collections import deque
 
-from rtree import index
-
 from turf.helpers import (
     Feature,
     FeatureCollection,
@@ -14,13 +12,14 @@ from turf.helpers import (
     get_input_dimensions,
 )
 
-from turf.envelope._envelope import envelope
 from turf.polygon_to_line import polygon_to_line
 from turf.helpers import feature, feature_collection, line_string, point
 from turf.invariant import get_coords_from_features, get_geometry_type
 from turf.utils.error_codes import error_code_messages
 from turf.utils.exceptions import InvalidInput
-
+from turf.utils.robust import orient2d
+from turf.utils.spatial_index import bulk_load
+from turf.line_intersect._sweep import segment_bbox, sweep_filtering
 
 LinePolyFeature = TypeVar(
     "LineFeature",
@@ -33,22 +32,95 @@ LinePolyFeature = TypeVar(
     Polygon,
 )
 
+engines = ["rtree", "sweep"]
+
+
+class SegmentIndex:
+    """
+    Segments of a LineString or Polygon feature, indexed in an R-tree by their bounding box.
+
+    Building the index once and querying it with `intersections` avoids re-indexing the
+    same feature when it is intersected with many others.
+    """
+
+    __slots__ = ("segments", "index")
+
+    def __init__(self, feature: LinePolyFeature) -> None:
+        self.segments = get_line_segments(feature)
+        self.index = bulk_load(segment_bbox(segment) for segment in self.segments)
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.segments)} segments)"
+
+    def intersections(self, other: LinePolyFeature) -> FeatureCollection:
+        """
+        Finds the intersection points of the indexed feature with another one,
+        same as `line_intersect`.
+
+        :param other: {GeoJSON} any LineString or Polygon
+        :returns: {FeatureCollection<Point>} point(s) that intersect both
+        """
+        other_segments = get_line_segments(other)
+
+        possible_intersects = spatial_filtering(
+            self.segments, other_segments, self.index
+        )
+
+        return collect_intersects(possible_intersects)
+
 
-def line_intersect(input_1: LinePolyFeature, input_2: LinePolyFeature) -> Feature:
+def line_intersect(
+    input_1: Union[LinePolyFeature, SegmentIndex],
+    input_2: LinePolyFeature,
+    options: Dict = None,
+) -> FeatureCollection:
     """
     Takes any LineString or Polygon GeoJSON and returns the intersecting point(s).
 
-    :param line_1: {GeoJSON} line1 any LineString or Polygon
+    :param line_1: {GeoJSON} line1 any LineString or Polygon, or its SegmentIndex
     :param line_2:{GeoJSON} line2 any LineString or Polygon
+    :param options: optional parameters
+        [options["engine"]="rtree"] how candidate segment pairs are found, one of:
+            "rtree": the line1 segments are indexed in an R-tree queried with every line2 segment
+            "sweep": a sweep line over the segments of both lines, sorted by longitude,
+                     which scales better for very large inputs
     :returns: {FeatureCollection<Point>} point(s) that intersect both
     """
-    line_1_segments = get_line_segments(input_1)
-    line_2_segments = get_line_segments(input_2)
+    if not isinstance(options, dict):
+        options = {}
 
-    possible_intersects = []
-    intersects = []
+    engine = options.get("engine", "rtree")
+
+    if engine not in engines:
+        raise InvalidInput(error_code_messages["InvalidOption"]("engine", engine))
+
+    if engine == "sweep":
+        if isinstance(input_1, SegmentIndex):
+            line_1_segments = input_1.segments
+        else:
+            line_1_segments = get_line_segments(input_1)
+
+        line_2_segments = get_line_segments(input_2)
+
+        return collect_intersects(sweep_filtering(line_1_segments, line_2_segments))
+
+    if not isinstance(input_1, SegmentIndex):
+        input_1 = SegmentIndex(input_1)
+
+    return input_1.intersections(input_2)
 
-    possible_intersects.extend(spatial_filtering(line_1_segments, line_2_segments))
+
+def collect_intersects(possible_intersects: Sequence) -> FeatureCollection:
+    """
+    Calculates the intersection points of candidate segment pairs
+
+    :param possible_intersects: list of segment pairs, as returned by `spatial_filtering`
+    :returns: {FeatureCollection<Point>} intersection points
+    """
+    intersects = []
 
     for i in possible_intersects:
         pnt = calculate_intersect(*i)
@@ -59,24 +131,22 @@ def line_intersect(input_1: LinePolyFeature, input_2: LinePolyFeature) -> Featur
     return feature_collection(intersects)
 
 
-def spatial_filtering(line_1: Sequence, line_2: Sequence) -> Sequence:
+def spatial_filtering(line_1: Sequence, line_2: Sequence, rtree_index=None) -> Sequence:
     """
     Filters possible intersections of the lines via their bounding box
 
     :param line_1: line_1 coordinates of segments
     :param line_2: line_2 coordinates of segments
+    :param rtree_index: R-tree of the line_1 segments bounding boxes, built if not given
     :returns: list of line segments that possibly intersect with each other
     """
     possible_intersects = []
-    rtree_index = index.Index()
 
-    for i, seg in enumerate(line_1):
-        bbox = envelope(seg)
-        rtree_index.insert(i, bbox["bbox"])
+    if rtree_index is None:
+        rtree_index = bulk_load(segment_bbox(seg) for seg in line_1)
 
     for j, seg in enumerate(line_2):
-        bbox = envelope(seg)
-        seg_intersection_idx = deque(rtree_index.intersection(bbox["bbox"]))
+        seg_intersection_idx = deque(rtree_index.intersection(segment_bbox(seg)))
 
         while seg_intersection_idx:
             seg_idx = seg_intersection_idx.pop()
@@ -110,24 +180,30 @@ def calculate_intersect(
     x4 = seg_2_end[0]
     y4 = seg_2_end[1]
 
-    pnt = None
+    # sides of the ends of each segment relative to the other segment, with exact signs
+    side_3 = orient2d(x1, y1, x2, y2, x3, y3)
+    side_4 = orient2d(x1, y1, x2, y2, x4, y4)
+
+    # collinear segments, or both ends of segment 2 on the same side of segment 1
+    if (side_3 == 0 and side_4 == 0) or (side_3 > 0 and side_4 > 0):
+        return None
+
+    if side_3 < 0 and side_4 < 0:
+        return None
 
-    denom = ((y4 - y3) * (x2 - x1)) - ((x4 - x3) * (y2 - y1))
-    numeA = ((x4 - x3) * (y1 - y3)) - ((y4 - y3) * (x1 - x3))
-    numeB = ((x2 - x1) * (y1 - y3)) - ((y2 - y1) * (x1 - x3))
+    side_1 = orient2d(x3, y3, x4, y4, x1, y1)
+    side_2 = orient2d(x3, y3, x4, y4, x2, y2)
 
-    if denom == 0:
-        return pnt
+    if (side_1 > 0 and side_2 > 0) or (side_1 < 0 and side_2 < 0):
+        return None
 
-    uA = numeA / denom
-    uB = numeB / denom
+    # position of the intersection along segment 1
+    uA = side_1 / (side_1 - side_2)
 
-    if uA >= 0 and uA <= 1 and uB >= 0 and uB <= 1:
-        x = round(x1 + (uA * (x2 - x1)), 6)
-        y = round(y1 + (uA * (y2 - y1)), 6)
-        pnt = point([x, y])
+    x = round(x1 + (uA * (x2 - x1)), 6)
+    y = round(y1 + (uA * (y2 - y1)), 6)
 
-    return pnt
+    return point([x, y])
 
 
 def get_line_segments(line: LinePolyFeature) -> Sequence:
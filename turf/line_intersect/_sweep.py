@@ -0,0 +1,98 @@
+from heapq import heappop, heappush
+from typing import Callable, List, Sequence, Tuple, Union
+
+
+def sweep_filtering(
+    line_1: Sequence,
+    line_2: Union[Sequence, None] = None,
+    skip: Union[Callable[[int, int], bool], None] = None,
+) -> List:
+    """
+    Filters possible intersections of the lines via their bounding box, with a sweep line
+    moving along the longitudes instead of an R-tree.
+
+    Segments enter the active set at their min longitude and leave it once the sweep
+    line moves past their max longitude, so each segment is only compared with the
+    segments overlapping it in longitude.
+
+    :param line_1: line_1 coordinates of segments
+    :param line_2: line_2 coordinates of segments, or None to find the possible
+        intersections of the line_1 segments with each other
+    :param skip: for self intersections, optional callable receiving two segment indices
+        (lowest first) and returning True if the pair should be ignored
+    :returns: list of line segments that possibly intersect with each other
+    """
+    possible_intersects = []
+
+    for i, j in sweep_pairs(line_1, line_2):
+        if line_2 is None:
+            if skip is not None and skip(i, j):
+                continue
+
+            possible_intersects.append([*line_1[i], *line_1[j]])
+        else:
+            possible_intersects.append([*line_1[i], *line_2[j]])
+
+    return possible_intersects
+
+
+def sweep_pairs(
+    line_1: Sequence, line_2: Union[Sequence, None] = None
+) -> List[Tuple[int, int]]:
+    """
+    Finds the pairs of segments whose bounding boxes overlap.
+
+    :param line_1: line_1 coordinates of segments
+    :param line_2: line_2 coordinates of segments, or None to pair line_1 with itself
+    :returns: list of (line_1 index, line_2 index) pairs. For self intersections, each pair
+        is reported once with the lowest index first.
+    """
+    lines = [line_1] if line_2 is None else [line_1, line_2]
+
+    events = sorted(
+        (bbox[0], line_id, i, bbox)
+        for line_id, line in enumerate(lines)
+        for i, bbox in enumerate(map(segment_bbox, line))
+    )
+
+    # active segments of each line, with a heap of their max longitude for expiry
+    active = [{} for _ in lines]
+    expiry = [[] for _ in lines]
+
+    pairs = []
+
+    for min_x, line_id, i, bbox in events:
+        for line_active, line_expiry in zip(active, expiry):
+            while line_expiry and line_expiry[0][0] < min_x:
+                del line_active[heappop(line_expiry)[1]]
+
+        min_y = bbox[1]
+        max_y = bbox[3]
+
+        other_id = 0 if line_2 is None else 1 - line_id
+
+        for j, (_, other_min_y, _, other_max_y) in active[other_id].items():
+            if other_min_y <= max_y and min_y <= other_max_y:
+                if line_2 is None:
+                    pairs.append((j, i) if j < i else (i, j))
+                elif line_id == 0:
+                    pairs.append((i, j))
+                else:
+                    pairs.append((j, i))
+
+        active[line_id][i] = bbox
+        heappush(expiry[line_id], (bbox[2], i))
+
+    return pairs
+
+
+def segment_bbox(segment: Sequence) -> Tuple[float, float, float, float]:
+    """
+    Bounding box of a segment
+
+    :param segment: pair of segment coordinates
+    :returns: (minX, minY, maxX, maxY) tuple
+    """
+    (x1, y1, *_), (x2, y2, *_) = segment
+
+    return (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
@@ -1,8 +1,9 @@
 from copy import deepcopy
 import pytest
 import os
+import random
 
-from turf.line_intersect import line_intersect
+from turf.line_intersect import line_intersect, SegmentIndex
 from turf.helpers import all_geometry_types, feature_collection, line_string, polygon
 
 from turf.utils.error_codes import error_code_messages
@@ -37,6 +38,55 @@ class TestLineIntersectss:
             all([i in fixture["out"]["features"] for i in result["features"]]) == True
         )
 
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            pytest.param(fixture, id=fixture_name)
+            for fixture_name, fixture in fixtures.items()
+        ],
+    )
+    def test_sweep_engine(self, fixture):
+        line_1 = fixture["in"]["features"][0]
+        line_2 = fixture["in"]["features"][1]
+
+        result = line_intersect(line_1, line_2, {"engine": "sweep"})
+
+        assert len(result["features"]) == len(fixture["out"]["features"])
+        assert all([i in result["features"] for i in fixture["out"]["features"]])
+        assert all([i in fixture["out"]["features"] for i in result["features"]])
+
+    def test_sweep_engine_random_lines(self):
+        rng = random.Random(7)
+
+        def random_line():
+            return line_string(
+                [[rng.uniform(0, 10), rng.uniform(0, 10)] for _ in range(200)]
+            )
+
+        line_1 = random_line()
+        line_2 = random_line()
+
+        def sorted_coords(result):
+            return sorted(f["geometry"]["coordinates"] for f in result["features"])
+
+        rtree_result = line_intersect(line_1, line_2)
+        sweep_result = line_intersect(line_1, line_2, {"engine": "sweep"})
+
+        assert len(rtree_result["features"]) > 0
+        assert sorted_coords(sweep_result) == sorted_coords(rtree_result)
+
+    def test_invalid_engine(self):
+        with pytest.raises(InvalidInput) as excinfo:
+            line_intersect(
+                line_string([[7, 50], [9, 50]]),
+                line_string([[8, 49], [8, 51]]),
+                {"engine": "bentley-ottmann"},
+            )
+
+        assert str(excinfo.value) == error_code_messages["InvalidOption"](
+            "engine", "bentley-ottmann"
+        )
+
     def test_input_mutation_prevention(self):
         line_1 = line_string([[7, 50], [8, 50], [9, 50]])
         line_2 = line_string([[8, 49], [8, 50], [8, 51]])
@@ -86,3 +136,37 @@ class TestLineIntersectss:
         result = line_intersect(*input_value)
 
         assert result["features"][0]["geometry"]["coordinates"] == expected_value
+
+
+class TestSegmentIndex:
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            pytest.param(fixture, id=fixture_name)
+            for fixture_name, fixture in fixtures.items()
+        ],
+    )
+    def test_intersections(self, fixture):
+        line_1 = fixture["in"]["features"][0]
+        line_2 = fixture["in"]["features"][1]
+
+        segment_index = SegmentIndex(line_1)
+
+        for result in [
+            segment_index.intersections(line_2),
+            line_intersect(segment_index, line_2),
+        ]:
+            assert len(result["features"]) == len(fixture["out"]["features"])
+            assert all([i in result["features"] for i in fixture["out"]["features"]])
+
+    def test_reuse(self):
+        segment_index = SegmentIndex(line_string([[7, 50], [8, 50], [9, 50]]))
+
+        assert len(segment_index) == 2
+
+        for lng in [7.5, 8.5, 10]:
+            line_2 = line_string([[lng, 49], [lng, 51]])
+
+            assert segment_index.intersections(line_2) == line_intersect(
+                line_string([[7, 50], [8, 50], [9, 50]]), line_2
+            )
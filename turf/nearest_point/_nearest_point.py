@@ -1,27 +1,30 @@
 from typing import Dict, List, Sequence, TypeVar, Union
-from copy import deepcopy
 
 from turf.distance import distance
 from turf.explode import explode
 from turf.helpers import point, Point
 from turf.helpers import Feature, FeatureCollection, Geometry
 from turf.invariant import get_coords_from_features
-
+from turf.nearest_point._point_index import PointIndex, tag_point
 
 GeoJson = TypeVar("GeoJson", Dict, Feature, FeatureCollection, Geometry)
 
 
-def nearest_point(target: Union[Sequence, Dict, Feature], features: GeoJson) -> Point:
+def nearest_point(
+    target: Union[Sequence, Dict, Feature], features: Union[GeoJson, PointIndex]
+) -> Point:
     """
     Calculates the closest reference point from a feature collection towards a target point
     This calculation is geodesic.
 
     :param target: targetPoint the reference point
-    :param features: points against input point set
+    :param features: points against input point set, or a PointIndex built from them
     :return: the closest point in the features set to the reference point
     """
+    if isinstance(features, PointIndex):
+        return features.nearest(target)
+
     min_distance = float("inf")
-    nearest_point = None
     feature_index = None
 
     features = explode(features)
@@ -33,21 +36,6 @@ def nearest_point(target: Union[Sequence, Dict, Feature], features: GeoJson) ->
         dist = distance(target, point)
         if dist < min_distance:
             min_distance = dist
-            nearest_point = deepcopy(point)
             feature_index = i
 
-    if "properties" in nearest_point:
-        nearest_point["properties"].update(
-            {"featureIndex": feature_index, "distanceToPoint": min_distance}
-        )
-    else:
-        nearest_point.update(
-            {
-                "properties": {
-                    "featureIndex": feature_index,
-                    "distanceToPoint": min_distance,
-                }
-            }
-        )
-
-    return nearest_point
+    return tag_point(points[feature_index], feature_index, min_distance)
@@ -0,0 +1,298 @@
+from array import array
+from copy import deepcopy
+from heapq import heappush, heappushpop
+from math import cos, pi, sin
+from typing import Dict, List, Sequence, TypeVar, Union
+
+from turf.explode import explode
+from turf.helpers import feature_collection, length_to_radians, radians_to_length
+from turf.helpers import Feature, FeatureCollection, Geometry
+from turf.invariant import get_coords_from_features
+from turf.kernels import haversine
+from turf.utils.error_codes import error_code_messages
+from turf.utils.exceptions import InvalidInput
+
+GeoJson = TypeVar("GeoJson", Dict, Feature, FeatureCollection, Geometry)
+
+# ranges of at most this many points are scanned instead of split further
+LEAF_SIZE = 8
+
+
+class PointIndex:
+    """
+    Points of a feature set indexed in a KD-tree for nearest neighbour and radius queries.
+
+    The input is exploded into points once (same as `nearest_point`), and the points are
+    indexed by their position on the unit sphere, where the straight line (chord) distance
+    grows with the great-circle distance. Queries only visit the branches of the tree that
+    can hold a closer point, instead of computing the distance to every point.
+    """
+
+    __slots__ = ("points", "xs", "ys", "zs", "order", "axes")
+
+    def __init__(self, features: GeoJson) -> None:
+        self.points = explode(features).get("features")
+
+        self.xs = array("d")
+        self.ys = array("d")
+        self.zs = array("d")
+
+        for pt in self.points:
+            x, y, z = unit_vector(*pt["geometry"]["coordinates"][:2])
+            self.xs.append(x)
+            self.ys.append(y)
+            self.zs.append(z)
+
+        self.order, self.axes = build_kd_tree((self.xs, self.ys, self.zs))
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.points)} points)"
+
+    def nearest(self, target: Union[Sequence, Dict, Feature]) -> Union[Feature, None]:
+        """
+        Finds the closest point towards a target point, same as `nearest_point`.
+
+        :param target: targetPoint the reference point
+        :return: the closest point, with its featureIndex and distanceToPoint (kilometers)
+            properties, or None if the index is empty
+        """
+        nearest = self.k_nearest(target, 1)["features"]
+
+        return nearest[0] if nearest else None
+
+    def k_nearest(
+        self, target: Union[Sequence, Dict, Feature], k: int
+    ) -> FeatureCollection:
+        """
+        Finds the k closest points towards a target point.
+
+        :param target: targetPoint the reference point
+        :param k: number of points to return
+        :return: FeatureCollection of the k closest points sorted by distance, with their
+            featureIndex and distanceToPoint (kilometers) properties
+        """
+        if not isinstance(k, int) or k < 1:
+            raise InvalidInput(error_code_messages["InvalidOption"]("k", k))
+
+        target = get_coords_from_features(target, ["Point"])
+        query = unit_vector(*target[:2])
+
+        # max-heap of the k best (squared chord distance, index) pairs, negated, so that
+        # equal distances are resolved to the lowest index like nearest_point
+        best = []
+
+        for lo, hi in self.iter_ranges(query, lambda: -best[0][0], k, best):
+            for i in self.order[lo:hi]:
+                d2 = self.squared_chord(query, i)
+
+                if len(best) < k:
+                    heappush(best, (-d2, -i))
+                elif d2 < -best[0][0] or (d2 == -best[0][0] and i < -best[0][1]):
+                    heappushpop(best, (-d2, -i))
+
+        return self.results(target, [-i for _, i in best], radians_to_length(1))
+
+    def within_radius(
+        self,
+        target: Union[Sequence, Dict, Feature],
+        radius: float,
+        options: Dict = None,
+    ) -> FeatureCollection:
+        """
+        Finds all the points within a distance of a target point.
+
+        :param target: targetPoint the reference point
+        :param radius: distance from the target point
+        :param options: optional parameters
+            [options["units"]="kilometers"] units of the radius and of the returned distances,
+                                            can be degrees, radians, miles, or kilometers
+        :return: FeatureCollection of the points within the radius sorted by distance, with
+            their featureIndex and distanceToPoint properties
+        """
+        if not isinstance(options, dict):
+            options = {}
+
+        kwargs = {}
+        if "units" in options:
+            kwargs["units"] = options["units"]
+
+        target = get_coords_from_features(target, ["Point"])
+        query = unit_vector(*target[:2])
+
+        angle = min(length_to_radians(radius, **kwargs), pi)
+        # slightly widened, the exact distance is checked on the candidates
+        max_d2 = (2 * sin(angle / 2)) ** 2 * (1 + 1e-9) + 1e-15
+
+        candidates = []
+
+        for lo, hi in self.iter_ranges(query, lambda: max_d2):
+            for i in self.order[lo:hi]:
+                if self.squared_chord(query, i) <= max_d2:
+                    candidates.append(i)
+
+        factor = radians_to_length(1, **kwargs)
+
+        return self.results(target, candidates, factor, radius)
+
+    def iter_ranges(self, query, get_bound, k=0, best=None):
+        """
+        Walks the KD-tree towards the query point, pruning the branches farther than the bound.
+
+        :param query: query unit vector
+        :param get_bound: callable returning the current squared chord distance bound
+        :param k: for k nearest queries, number of points to collect before pruning
+        :param best: for k nearest queries, the points collected so far
+        :return: generator of (lo, hi) ranges of `order` to scan
+        """
+        coords = (self.xs, self.ys, self.zs)
+        stack = [(0, len(self.order), 0.0)]
+
+        while stack:
+            lo, hi, plane_d2 = stack.pop()
+
+            # branches at exactly the bound distance are visited, they can hold a point
+            # at the same distance as the worst one kept, with a lower index
+            if (best is None or len(best) >= k) and plane_d2 > get_bound():
+                continue
+
+            if hi - lo <= LEAF_SIZE:
+                yield lo, hi
+                continue
+
+            mid = (lo + hi) // 2
+            axis = self.axes[mid]
+            diff = query[axis] - coords[axis][self.order[mid]]
+
+            yield mid, mid + 1
+
+            if diff < 0:
+                near, far = (lo, mid), (mid + 1, hi)
+            else:
+                near, far = (mid + 1, hi), (lo, mid)
+
+            # the near side is pushed last so it is visited first
+            stack.append((*far, max(plane_d2, diff * diff)))
+            stack.append((*near, plane_d2))
+
+    def squared_chord(self, query: Sequence, i: int) -> float:
+        """
+        :param query: query unit vector
+        :param i: point index
+        :return: squared chord distance between the query and the point
+        """
+        dx = query[0] - self.xs[i]
+        dy = query[1] - self.ys[i]
+        dz = query[2] - self.zs[i]
+
+        return dx * dx + dy * dy + dz * dz
+
+    def results(
+        self,
+        target: Sequence,
+        indices: List[int],
+        factor: float,
+        max_distance: float = None,
+    ) -> FeatureCollection:
+        """
+        Copies the selected points, sorted by distance, and tags them like `nearest_point`.
+
+        :param target: target coordinates
+        :param indices: indices of the selected points
+        :param factor: conversion factor from radians to the distance units
+        :param max_distance: if given, points farther than this distance are dropped
+        :return: FeatureCollection of tagged points
+        """
+        ranked = []
+
+        for i in indices:
+            coords = self.points[i]["geometry"]["coordinates"]
+            dist = haversine(target[0], target[1], coords[0], coords[1]) * factor
+
+            if max_distance is None or dist <= max_distance:
+                ranked.append((dist, i))
+
+        ranked.sort()
+
+        return feature_collection(
+            [tag_point(self.points[i], i, dist) for dist, i in ranked]
+        )
+
+
+def tag_point(point: Dict, feature_index: int, dist: float) -> Dict:
+    """
+    Copies a point and adds its featureIndex and distanceToPoint properties.
+
+    :param point: Point Feature
+    :param feature_index: index of the point in the exploded feature set
+    :param dist: distance to the target point
+    :return: tagged copy of the point
+    """
+    point = deepcopy(point)
+
+    if "properties" in point:
+        point["properties"].update(
+            {"featureIndex": feature_index, "distanceToPoint": dist}
+        )
+    else:
+        point.update(
+            {"properties": {"featureIndex": feature_index, "distanceToPoint": dist}}
+        )
+
+    return point
+
+
+def unit_vector(lng: float, lat: float) -> tuple:
+    """
+    :param lng: longitude in degrees
+    :param lat: latitude in degrees
+    :return: (x, y, z) position on the unit sphere
+    """
+    lng = lng * pi / 180
+    lat = lat * pi / 180
+
+    return (cos(lat) * cos(lng), cos(lat) * sin(lng), sin(lat))
+
+
+def build_kd_tree(coords: Sequence) -> tuple:
+    """
+    Builds an implicit KD-tree: each range of `order` is split at its middle point, along
+    the axis with the largest spread, and both halves are split again until they are small.
+
+    :param coords: (xs, ys, zs) point coordinates
+    :return: (order, axes) where order is the permutation of the point indices and axes
+        holds the split axis of each middle point
+    """
+    n_points = len(coords[0])
+
+    order = array("l", range(n_points))
+    axes = bytearray(n_points)
+
+    stack = [(0, n_points)]
+
+    while stack:
+        lo, hi = stack.pop()
+
+        if hi - lo <= LEAF_SIZE:
+            continue
+
+        indices = order[lo:hi]
+
+        spreads = []
+        for values in coords:
+            axis_values = [values[i] for i in indices]
+            spreads.append(max(axis_values) - min(axis_values))
+
+        axis = spreads.index(max(spreads))
+
+        order[lo:hi] = array("l", sorted(indices, key=coords[axis].__getitem__))
+
+        mid = (lo + hi) // 2
+        axes[mid] = axis
+
+        stack.append((lo, mid))
+        stack.append((mid + 1, hi))
+
+    return order, axes
@@ -1,9 +1,12 @@
 import pytest
 import os
 
-from turf.nearest_point import nearest_point
+from turf.distance import distance
+from turf.nearest_point import nearest_point, PointIndex
 
 from turf.helpers import feature_collection, point
+from turf.utils.error_codes import error_code_messages
+from turf.utils.exceptions import InvalidInput
 from turf.utils.test_setup import get_fixtures
 
 current_path = os.path.dirname(os.path.realpath(__file__))
@@ -54,3 +57,118 @@ def prepare_response(nearest_point, target_point, fixture_in):
     result = feature_collection([*fixture_in["features"], target_point, nearest_point])
 
     return result
+
+
+class TestPointIndex:
+    points = feature_collection(
+        [
+            point([lng, lat], {"id": i})
+            for i, (lng, lat) in enumerate(
+                [[x * 7.3 % 360 - 180, (x * 13.1) % 170 - 85] for x in range(300)]
+            )
+        ]
+    )
+
+    targets = [[0, 0], [-73.9, 40.7], [179.9, -10], [-179.9, 10], [12.5, 89.9]]
+
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            pytest.param(fixture, id=fixture_name)
+            for fixture_name, fixture in fixtures.items()
+        ],
+    )
+    def test_nearest(self, fixture):
+        target_point = point(fixture["in"]["properties"]["targetPoint"])
+        index = PointIndex(fixture["in"])
+
+        assert index.nearest(target_point) == nearest_point(target_point, fixture["in"])
+        assert nearest_point(target_point, index) == nearest_point(
+            target_point, fixture["in"]
+        )
+
+    @pytest.mark.parametrize("target", targets)
+    def test_k_nearest(self, target):
+        index = PointIndex(self.points)
+
+        result = index.k_nearest(target, 10)
+
+        expected = sorted(
+            (distance(target, pt), i) for i, pt in enumerate(self.points["features"])
+        )[:10]
+
+        assert [
+            (f["properties"]["distanceToPoint"], f["properties"]["featureIndex"])
+            for f in result["features"]
+        ] == expected
+        assert [f["properties"]["id"] for f in result["features"]] == [
+            i for _, i in expected
+        ]
+
+    @pytest.mark.parametrize("target", targets)
+    @pytest.mark.parametrize(
+        "radius,units",
+        [
+            pytest.param(2000, "kilometers", id="kilometers"),
+            pytest.param(500, "miles", id="miles"),
+            pytest.param(30, "degrees", id="degrees"),
+        ],
+    )
+    def test_within_radius(self, target, radius, units):
+        index = PointIndex(self.points)
+
+        result = index.within_radius(target, radius, {"units": units})
+
+        expected = sorted(
+            (distance(target, pt, {"units": units}), i)
+            for i, pt in enumerate(self.points["features"])
+            if distance(target, pt, {"units": units}) <= radius
+        )
+
+        assert [
+            (f["properties"]["distanceToPoint"], f["properties"]["featureIndex"])
+            for f in result["features"]
+        ] == expected
+
+    def test_duplicate_points(self):
+        # every point is indexed 3 times, ties go to the lowest index like nearest_point
+        duplicated = feature_collection(self.points["features"][:100] * 3)
+        index = PointIndex(duplicated)
+
+        for x in range(30):
+            target = [x * 11.7 % 360 - 180, (x * 5.3) % 170 - 85]
+
+            assert index.nearest(target) == nearest_point(target, duplicated)
+
+            result = index.k_nearest(target, 6)
+
+            expected = sorted(
+                (distance(target, pt), i) for i, pt in enumerate(duplicated["features"])
+            )[:6]
+
+            assert [
+                (f["properties"]["distanceToPoint"], f["properties"]["featureIndex"])
+                for f in result["features"]
+            ] == expected
+
+    def test_input_mutation(self):
+        index = PointIndex(self.points)
+
+        index.k_nearest([0, 0], 3)
+
+        assert self.points["features"][0]["properties"] == {"id": 0}
+
+    def test_empty(self):
+        index = PointIndex(feature_collection([]))
+
+        assert len(index) == 0
+        assert index.nearest([0, 0]) is None
+        assert index.k_nearest([0, 0], 3) == feature_collection([])
+        assert index.within_radius([0, 0], 100) == feature_collection([])
+
+    @pytest.mark.parametrize("k", [0, -1, 1.5, "1"])
+    def test_invalid_k(self, k):
+        with pytest.raises(InvalidInput) as excinfo:
+            PointIndex(self.points).k_nearest([0, 0], k)
+
+        assert str(excinfo.value) == error_code_messages["InvalidOption"]("k", k)
@@ -0,0 +1 @@
+from turf.parallel._parallel import map_features, starmap_features
@@ -0,0 +1,231 @@
+import json
+import os
+import pickle
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+from turf.io._geojson_seq import to_geojson
+from turf.utils.error_codes import error_code_messages
+from turf.utils.exceptions import InvalidInput
+
+
+def map_features(func: Callable, features: Any, options: Dict = None) -> List:
+    """
+    Applies a function to every feature of a collection, in parallel worker processes.
+
+    The features are split into chunks, each chunk being shipped to a worker of a
+    `ProcessPoolExecutor` as a single compact JSON string. Feature and geometry objects
+    reach func as plain GeoJSON dictionaries, with any number of workers. At most two chunks per worker are in flight, so
+    an iterator of features is consumed as the workers progress (when options["chunk_size"]
+    is given). The extra arguments are pickled once, so they can be any picklable object,
+    e.g. a PreparedPolygon. `func` must be picklable too, e.g. any public turf function or
+    a function defined at module level (not a lambda).
+
+    :param func: function called as `func(feature, *options["args"])`
+    :param features: FeatureCollection dict or object, or iterable of features
+    :param options: optional parameters
+        [options["args"]=()]: extra positional arguments passed to func after the feature,
+                              e.g. the polygon of `boolean_within` or a PreparedPolygon
+        [options["workers"]]: number of worker processes, defaults to the number of CPUs.
+                              With 1 worker, func is called in the current process.
+        [options["chunk_size"]]: number of features per chunk, defaults to a quarter of the
+                                 features per worker
+        [options["ordered"]=True]: True to return the results in the order of the features,
+                                   False to return them as the chunks complete
+    :return: list with the result of func for every feature
+    """
+    if not isinstance(options, dict):
+        options = {}
+
+    if hasattr(features, "to_geojson"):
+        features = features.to_geojson()
+
+    if isinstance(features, dict):
+        if features.get("type") != "FeatureCollection":
+            raise InvalidInput(error_code_messages["InvalidFeatureCollection"])
+
+        features = features.get("features", [])
+
+    return run(func, features, options, tuple(options.get("args", ())))
+
+
+def starmap_features(
+    func: Callable, arguments: Iterable[Sequence], options: Dict = None
+) -> List:
+    """
+    Same as `map_features`, for functions taking several features (or other arguments):
+    func is called as `func(*item)` for every item of the arguments.
+
+    The chunks of items are pickled rather than encoded as JSON, so the items can hold any
+    picklable argument, e.g. a PreparedPolygon. As for `map_features`, the Feature and
+    geometry objects of the items reach func as plain GeoJSON dictionaries.
+
+    :param func: function called as `func(*item)`
+    :param arguments: iterable of argument tuples, e.g. pairs of points for `distance`
+    :param options: optional parameters
+        [options["workers"]]: number of worker processes, defaults to the number of CPUs.
+                              With 1 worker, func is called in the current process.
+        [options["chunk_size"]]: number of items per chunk, defaults to a quarter of the
+                                 items per worker
+        [options["ordered"]=True]: True to return the results in the order of the items,
+                                   False to return them as the chunks complete
+    :return: list with the result of func for every item
+    """
+    if not isinstance(options, dict):
+        options = {}
+
+    return run(func, arguments, options, star=True)
+
+
+def run(
+    func: Callable, items: Iterable, options: Dict, args: Tuple = (), star: bool = False
+) -> List:
+    """
+    :param func: function to apply
+    :param items: iterable of features, or of argument tuples
+    :param options: options of `map_features`
+    :param args: extra arguments, shipped once per chunk rather than once per item
+    :param star: True if the items are argument tuples, see `run_chunk`
+    :return: list with the result of func for every item
+    """
+    workers = options.get("workers", os.cpu_count() or 1)
+    chunk_size = options.get("chunk_size", None)
+    ordered = options.get("ordered", True)
+
+    if not isinstance(workers, int) or workers < 1:
+        raise InvalidInput(error_code_messages["InvalidOption"]("workers", workers))
+
+    if chunk_size is not None and (not isinstance(chunk_size, int) or chunk_size < 1):
+        raise InvalidInput(
+            error_code_messages["InvalidOption"]("chunk_size", chunk_size)
+        )
+
+    if workers == 1:
+        # same form as the items shipped to the workers
+        return run_chunk(func, (as_item(item, star) for item in items), args, star)
+
+    if chunk_size is None:
+        items = list(items)
+        chunk_size = max(1, -(-len(items) // (workers * 4)))
+
+    encoder = json.JSONEncoder(separators=(",", ":"), default=to_geojson)
+    # pickled once, whatever they are (e.g. a PreparedPolygon), not once per chunk
+    pickled_args = pickle.dumps(args) if args else b""
+
+    # chunks submitted but not collected yet, bounded so that an iterator input is
+    # consumed as the workers progress rather than all at once
+    max_pending = 2 * workers
+    pending = deque() if ordered else set()
+    results = []
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in iter_chunks(items, chunk_size):
+            if len(pending) >= max_pending:
+                results.extend(collect_chunk(pending))
+
+            if star:
+                # argument tuples may hold anything, not only GeoJSON
+                shipped = pickle.dumps([as_item(item, star) for item in chunk])
+            else:
+                shipped = encoder.encode(chunk)
+
+            future = executor.submit(run_chunk, func, shipped, pickled_args, star)
+
+            if ordered:
+                pending.append(future)
+            else:
+                pending.add(future)
+
+        while pending:
+            results.extend(collect_chunk(pending))
+
+    return results
+
+
+def collect_chunk(pending: Union[deque, set]) -> List:
+    """
+    Waits for a submitted chunk and removes it from the pending ones.
+
+    :param pending: futures of the pending chunks, a deque in submission order if the
+        results are ordered, a set otherwise
+    :return: results of the first submitted chunk if ordered, otherwise of the first
+        completed one(s)
+    """
+    if isinstance(pending, deque):
+        return pending.popleft().result()
+
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    results = []
+
+    for future in done:
+        pending.remove(future)
+        results.extend(future.result())
+
+    return results
+
+
+def as_item(item: Any, star: bool) -> Any:
+    """
+    Converts the Feature and geometry objects of an item to GeoJSON dictionaries.
+
+    :param item: feature, or argument tuple if star
+    :param star: True if the item is an argument tuple
+    :return: the feature as a GeoJSON dictionary, or the tuple of the arguments with their
+        objects converted
+    """
+    if star:
+        return tuple(
+            arg.to_geojson() if hasattr(arg, "to_geojson") else arg for arg in item
+        )
+
+    return item.to_geojson() if hasattr(item, "to_geojson") else item
+
+
+def iter_chunks(items: Iterable, chunk_size: int) -> Iterator[List]:
+    """
+    :param items: iterable to split
+    :param chunk_size: maximum number of items per chunk
+    :return: generator of lists of consecutive items
+    """
+    iterator = iter(items)
+
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def run_chunk(
+    func: Callable,
+    items: Union[str, bytes, Iterable],
+    args: Union[bytes, Tuple],
+    star: bool,
+) -> List:
+    """
+    Applies the function to a chunk, in the worker processes. The items are decoded
+    first if they were shipped as a JSON string or pickled, and the extra arguments if
+    they were shipped pickled.
+
+    :param func: function to apply
+    :param items: features or argument tuples, or their JSON list or pickle
+    :param args: extra arguments passed after the feature, or their pickle
+    :param star: True to call `func(*item)`, False to call `func(item, *args)`
+    :return: list with the result of func for every item of the chunk
+    """
+    if isinstance(items, str):
+        items = json.loads(items)
+    elif isinstance(items, bytes):
+        items = pickle.loads(items)
+
+    if isinstance(args, bytes):
+        args = pickle.loads(args) if args else ()
+
+    if star:
+        return [func(*item) for item in items]
+
+    return [func(item, *args) for item in items]
@@ -0,0 +1,153 @@
+import pytest
+
+from turf.boolean_point_in_polygon import boolean_point_in_polygon, PreparedPolygon
+from turf.distance import distance
+from turf.helpers import feature_collection, point, polygon
+from turf.parallel import map_features, starmap_features
+from turf.parallel import _parallel
+
+from turf.utils.error_codes import error_code_messages
+from turf.utils.exceptions import InvalidInput
+
+area = polygon([[[0, 0], [10, 0], [10, 10], [0, 10], [0, 0]]])
+
+points = feature_collection(
+    [point([i % 15, i // 15], {"index": i}) for i in range(150)]
+)
+
+
+def index_of(feature):
+    return feature["properties"]["index"]
+
+
+def describe(*args):
+    return tuple(type(arg).__name__ for arg in args)
+
+
+class TestMapFeatures:
+    @pytest.mark.parametrize(
+        "options",
+        [
+            pytest.param({"workers": 1}, id="in_process"),
+            pytest.param({"workers": 2}, id="default_chunks"),
+            pytest.param({"workers": 3, "chunk_size": 7}, id="chunk_size"),
+            pytest.param({"workers": 2, "chunk_size": 1000}, id="single_chunk"),
+        ],
+    )
+    def test_map_features(self, options):
+        expected = [
+            boolean_point_in_polygon(feature, area) for feature in points["features"]
+        ]
+
+        options["args"] = (area,)
+
+        assert map_features(boolean_point_in_polygon, points, options) == expected
+
+    def test_inputs(self):
+        options = {"workers": 2, "chunk_size": 10}
+        expected = list(range(150))
+
+        assert map_features(index_of, points, options) == expected
+        assert map_features(index_of, iter(points["features"]), options) == expected
+        assert (
+            map_features(
+                index_of,
+                feature_collection(points["features"], as_geojson=False),
+                options,
+            )
+            == expected
+        )
+        assert map_features(index_of, [], options) == []
+
+    def test_unordered(self):
+        options = {"workers": 3, "chunk_size": 10, "ordered": False}
+
+        assert sorted(map_features(index_of, points, options)) == list(range(150))
+
+    def test_starmap_features(self):
+        pairs = list(zip(points["features"], reversed(points["features"])))
+        options = {"workers": 2, "chunk_size": 16}
+
+        expected = [distance(start, end) for start, end in pairs]
+
+        assert starmap_features(distance, pairs, options) == expected
+
+    @pytest.mark.parametrize(
+        "option,value",
+        [
+            pytest.param("workers", 0, id="workers"),
+            pytest.param("workers", "4", id="workers_type"),
+            pytest.param("chunk_size", 0, id="chunk_size"),
+        ],
+    )
+    def test_exception(self, option, value):
+        with pytest.raises(InvalidInput) as excinfo:
+            map_features(index_of, points, {option: value})
+
+        assert excinfo.value.args[0] == error_code_messages["InvalidOption"](
+            option, value
+        )
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_prepared_polygon_args(self, workers):
+        # extra arguments are pickled, not encoded as GeoJSON
+        prepared = PreparedPolygon(area)
+        options = {"workers": workers, "chunk_size": 20, "args": (prepared,)}
+
+        assert map_features(boolean_point_in_polygon, points, options) == [
+            boolean_point_in_polygon(pt, area) for pt in points["features"]
+        ]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_starmap_prepared_polygon(self, workers):
+        # argument tuples are pickled, not encoded as GeoJSON
+        prepared = PreparedPolygon(area)
+        items = [(pt, prepared) for pt in points["features"]]
+        options = {"workers": workers, "chunk_size": 20}
+
+        assert starmap_features(boolean_point_in_polygon, items, options) == [
+            boolean_point_in_polygon(pt, area) for pt in points["features"]
+        ]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_same_arguments_form(self, workers):
+        objects = feature_collection(points["features"][:10], as_geojson=False)
+        options = {"workers": workers, "chunk_size": 3}
+
+        assert map_features(type, objects, options) == [dict] * 10
+        assert (
+            starmap_features(
+                describe, [(pt, (1, 2)) for pt in objects.features], options
+            )
+            == [("dict", "tuple")] * 10
+        )
+
+    def test_iterator_consumed_progressively(self, monkeypatch):
+        consumed = []
+        consumed_at_collect = []
+
+        def iter_points():
+            for feature in points["features"]:
+                consumed.append(feature)
+                yield feature
+
+        def collect_chunk(pending):
+            consumed_at_collect.append(len(consumed))
+            return original_collect_chunk(pending)
+
+        original_collect_chunk = _parallel.collect_chunk
+        monkeypatch.setattr(_parallel, "collect_chunk", collect_chunk)
+
+        options = {"workers": 2, "chunk_size": 5}
+
+        assert map_features(index_of, iter_points(), options) == list(range(150))
+
+        # at most 2 chunks per worker are submitted before the first one is collected,
+        # the next chunk being read before waiting for it
+        assert consumed_at_collect[0] == (2 * 2 + 1) * 5
+
+    def test_invalid_collection(self):
+        with pytest.raises(InvalidInput) as excinfo:
+            map_features(index_of, point([0, 0]))
+
+        assert excinfo.value.args[0] == error_code_messages["InvalidFeatureCollection"]
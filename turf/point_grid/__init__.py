@@ -1 +1 @@
-from turf.point_grid._point_grid import point_grid
+from turf.point_grid._point_grid import point_grid, iter_point_grid
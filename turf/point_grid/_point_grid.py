@@ -1,9 +1,10 @@
-from typing import Dict, List, Union
+from typing import Dict, Iterator, List, Union
 
-from turf.distance import distance
 from turf.bbox import bbox
-from turf.boolean_within import boolean_within
-from turf.helpers import feature_collection, point, FeatureCollection
+from turf.helpers import feature_collection, point, radians_to_length
+from turf.helpers import FeatureCollection
+from turf.kernels import haversine
+from turf.utils.grid_mask import GridMask
 
 
 def point_grid(
@@ -25,18 +26,51 @@ def point_grid(
 
     :returns: FeatureCollection of a grid of polygons
     """
+
+    return feature_collection(list(iter_point_grid(bbox, n_cells, options)))
+
+
+def iter_point_grid(
+    bbox: List[float],
+    n_cells: Union[int, float],
+    options: Dict = {},
+) -> Iterator[Dict]:
+    """
+    Generates the cells of `point_grid` lazily, in the same order: column by column from
+    west to east, and from south to north within each column. Only the current cell is
+    held in memory, so the cells can be written out while they are generated, e.g. by
+    `turf.io.write_geojson_seq`.
+
+    :param bbox: Array extent in [minX, minY, maxX, maxY] order
+    :param n_cells: number of each cell, in units
+    :param options: Optional parameters
+        [options["units"]]: units ("degrees", "radians", "miles", "kilometers")
+                            of the given cell_width and cell_height
+        [options["mask"]]: if passed a Polygon or MultiPolygon here,
+                           the grid Points will be created only inside it
+        [options["properties"]]: passed to each point of the grid
+
+    :returns: generator of Point Features
+    """
     if not isinstance(options, dict):
         options = {}
 
-    results = []
+    mask = GridMask(options["mask"]) if "mask" in options else None
+
     west = bbox[0]
     south = bbox[1]
     east = bbox[2]
     north = bbox[3]
 
-    x_fraction = n_cells / (distance([west, south], [east, south], options))
+    kwargs = {}
+    if "units" in options:
+        kwargs["units"] = options["units"]
+
+    factor = radians_to_length(1, **kwargs)
+
+    x_fraction = n_cells / (haversine(west, south, east, south) * factor)
     cell_width_deg = x_fraction * (east - west)
-    y_fraction = n_cells / (distance([west, south], [west, north], options))
+    y_fraction = n_cells / (haversine(west, south, west, north) * factor)
     cell_height_deg = y_fraction * (north - south)
 
     # rows & columns
@@ -56,14 +90,12 @@ def point_grid(
         while current_y <= north:
             cell_point = point([current_x, current_y], options.get("properties", {}))
 
-            if "mask" in options:
-                if boolean_within(cell_point, options["mask"]):
-                    results.append(cell_point)
+            if mask is not None:
+                if mask.contains(current_x, current_y):
+                    yield cell_point
             else:
-                results.append(cell_point)
+                yield cell_point
 
             current_y += cell_height_deg
 
         current_x += cell_width_deg
-
-    return feature_collection(results)
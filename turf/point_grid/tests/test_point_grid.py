@@ -2,7 +2,7 @@ import pytest
 import os
 
 from turf.bbox_polygon import bbox_polygon
-from turf.point_grid import point_grid
+from turf.point_grid import point_grid, iter_point_grid
 
 from turf.utils.test_setup import get_fixtures
 
@@ -36,6 +36,28 @@ class TestPointGrid:
 
         assert result == fixture["out"]
 
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            pytest.param(fixture, id=fixture_name)
+            for fixture_name, fixture in fixtures.items()
+        ],
+    )
+    def test_iter_point_grid(self, fixture):
+        bbox = fixture["in"]["bbox"]
+        cell_side = fixture["in"]["cellSide"]
+
+        options = dict(
+            (key, fixture["in"][key])
+            for key in ["units", "mask", "properties"]
+            if key in fixture["in"]
+        )
+
+        cells = iter_point_grid(bbox, cell_side, options)
+
+        assert not isinstance(cells, list)
+        assert list(cells) == point_grid(bbox, cell_side, options)["features"]
+
 
 def prepare_output(result, bbox, options):
     for i in range(len(result["features"])):
@@ -0,0 +1 @@
+from turf.points_within_polygons._points_within_polygons import points_within_polygons
@@ -0,0 +1,157 @@
+from copy import deepcopy
+from typing import Dict, List, Sequence, Union
+
+from turf.bbox import bbox
+from turf.boolean_point_in_polygon import PreparedPolygon
+from turf.helpers import FeatureCollection, feature_collection
+from turf.invariant import get_coords_from_features
+from turf.utils.error_codes import error_code_messages
+from turf.utils.exceptions import InvalidInput
+from turf.utils.spatial_index import bulk_load
+
+modes = ["first", "all"]
+outputs = ["indices", "features"]
+
+
+def points_within_polygons(
+    points: Union[Dict, FeatureCollection, Sequence],
+    polygons: Union[Dict, FeatureCollection],
+    options: Dict = None,
+) -> Union[List, Dict]:
+    """
+    Finds, for every point, the polygon(s) that contain it.
+
+    An R-tree is bulk loaded with the bounding boxes of the polygons, so that each point
+    is only tested against the polygons whose bounding box contains it. Polygons are
+    prepared (see `PreparedPolygon`) the first time they are a candidate for a point.
+
+    :param points: Point FeatureCollection or sequence of [lng, lat] positions
+    :param polygons: FeatureCollection of Polygon or MultiPolygon Features
+    :param options: optional parameters
+        [options["mode"]="first"]: "first" to keep the first polygon (lowest index) containing
+                                   each point, "all" to keep every polygon containing it
+        [options["output"]="indices"]: "indices" to return the polygon indices for each point,
+                                       "features" to return the points tagged with their polygons
+        [options["field"]]: polygon property to tag the points with, instead of the polygon index
+        [options["outField"]]: point property holding the tag, defaults to `field` or "polygonIndex"
+        [options["ignoreBoundary"]=False]: True if points on the polygon boundary are not contained
+    :return: with "indices" output, a list with, for each point, the index of the containing
+             polygon or None ("first" mode), or the list of indices of the containing polygons
+             ("all" mode). With "features" output, a FeatureCollection with a copy of each point
+             where a polygon was found, tagged with the polygon index or field value(s).
+    """
+    if not isinstance(options, dict):
+        options = {}
+
+    mode = options.get("mode", "first")
+    output = options.get("output", "indices")
+    field = options.get("field", None)
+    out_field = options.get("outField", field or "polygonIndex")
+    ignore_boundary = options.get("ignoreBoundary", False)
+
+    if mode not in modes:
+        raise InvalidInput(error_code_messages["InvalidOption"]("mode", mode))
+
+    if output not in outputs:
+        raise InvalidInput(error_code_messages["InvalidOption"]("output", output))
+
+    if isinstance(points, (list, tuple)) and output == "indices":
+        point_coords = get_coords_from_features(points, ["MultiPoint"])
+    elif is_feature_collection(points):
+        point_coords = get_coords_from_features(points, ["Point"])
+    else:
+        raise InvalidInput(error_code_messages["InvalidFeatureCollection"])
+
+    if not is_feature_collection(polygons):
+        raise InvalidInput(error_code_messages["InvalidFeatureCollection"])
+
+    polygon_features = polygons.get("features", [])
+
+    rtree_index = bulk_load(bbox(polygon) for polygon in polygon_features)
+    prepared = {}
+
+    matches = []
+
+    for coords in point_coords:
+        candidates = sorted(rtree_index.intersection((*coords[:2], *coords[:2])))
+        found = []
+
+        for i in candidates:
+            if i not in prepared:
+                prepared[i] = PreparedPolygon(polygon_features[i])
+
+            if prepared[i].contains_coords(coords[0], coords[1], ignore_boundary):
+                found.append(i)
+
+                if mode == "first":
+                    break
+
+        if mode == "first":
+            found = found[0] if found else None
+
+        matches.append(found)
+
+    if output == "indices":
+        return matches
+
+    return tag_points(points, matches, polygon_features, field, out_field)
+
+
+def tag_points(
+    points: Union[Dict, FeatureCollection],
+    matches: List,
+    polygons: Sequence,
+    field: Union[str, None],
+    out_field: str,
+) -> Dict:
+    """
+    Copies the points that fall within a polygon and tags them with their polygon(s).
+
+    :param points: Point FeatureCollection
+    :param matches: polygon index or list of indices for every point
+    :param polygons: polygon features
+    :param field: polygon property to tag the points with, or None for the polygon index
+    :param out_field: point property holding the tag
+    :return: FeatureCollection of tagged points
+    """
+
+    def tag(index):
+        if field is None:
+            return index
+
+        return (polygons[index].get("properties") or {}).get(field, None)
+
+    results = []
+
+    for point, match in zip(points.get("features"), matches):
+        if match is None or match == []:
+            continue
+
+        if hasattr(point, "to_geojson"):
+            point = point.to_geojson()
+
+        point = deepcopy(point)
+
+        if point.get("properties") is None:
+            # missing, or null in the GeoJSON
+            point["properties"] = {}
+
+        if isinstance(match, list):
+            point["properties"][out_field] = [tag(index) for index in match]
+        else:
+            point["properties"][out_field] = tag(match)
+
+        results.append(point)
+
+    return feature_collection(results)
+
+
+def is_feature_collection(geojson: Union[Dict, FeatureCollection]) -> bool:
+    """
+    :param geojson: any input value
+    :return: True if the input is a FeatureCollection, False otherwise
+    """
+    return (
+        isinstance(geojson, (dict, FeatureCollection))
+        and geojson.get("type", None) == "FeatureCollection"
+    )
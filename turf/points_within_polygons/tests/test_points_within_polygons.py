@@ -0,0 +1,155 @@
+import pytest
+
+from turf.helpers import feature_collection, point, polygon
+from turf.points_within_polygons import points_within_polygons
+
+from turf.utils.error_codes import error_code_messages
+from turf.utils.exceptions import InvalidInput
+
+polygons = feature_collection(
+    [
+        polygon([[[0, 0], [10, 0], [10, 10], [0, 10], [0, 0]]], {"name": "west"}),
+        polygon([[[5, 0], [15, 0], [15, 10], [5, 10], [5, 0]]], {"name": "east"}),
+        polygon(
+            [
+                [[20, 0], [30, 0], [30, 10], [20, 10], [20, 0]],
+                [[22, 2], [28, 2], [28, 8], [22, 8], [22, 2]],
+            ],
+            {"name": "ring"},
+        ),
+    ]
+)
+
+positions = [[2, 2], [7, 5], [12, 5], [25, 5], [21, 1], [40, 40], [10, 5]]
+
+points = feature_collection(
+    [point(position, {"id": i}) for i, position in enumerate(positions)]
+)
+
+
+class TestPointsWithinPolygons:
+    @pytest.mark.parametrize(
+        "options,expected",
+        [
+            pytest.param(None, [0, 0, 1, None, 2, None, 0], id="first"),
+            pytest.param(
+                {"mode": "all"},
+                [[0], [0, 1], [1], [], [2], [], [0, 1]],
+                id="all",
+            ),
+            pytest.param(
+                {"ignoreBoundary": True},
+                [0, 0, 1, None, 2, None, 1],
+                id="ignore-boundary",
+            ),
+            pytest.param(
+                {"mode": "all", "ignoreBoundary": True},
+                [[0], [0, 1], [1], [], [2], [], [1]],
+                id="all-ignore-boundary",
+            ),
+        ],
+    )
+    def test_indices(self, options, expected):
+        assert points_within_polygons(points, polygons, options) == expected
+        assert points_within_polygons(positions, polygons, options) == expected
+
+    def test_features(self):
+        result = points_within_polygons(
+            points, polygons, {"output": "features", "field": "name"}
+        )
+
+        assert result["type"] == "FeatureCollection"
+        assert [
+            (feature["properties"]["id"], feature["properties"]["name"])
+            for feature in result["features"]
+        ] == [(0, "west"), (1, "west"), (2, "east"), (4, "ring"), (6, "west")]
+
+        # input points are left untouched
+        assert "name" not in points["features"][0]["properties"]
+
+    def test_features_all(self):
+        result = points_within_polygons(
+            points,
+            polygons,
+            {"output": "features", "mode": "all", "outField": "polygons"},
+        )
+
+        assert [
+            feature["properties"]["polygons"] for feature in result["features"]
+        ] == [
+            [0],
+            [0, 1],
+            [1],
+            [2],
+            [0, 1],
+        ]
+
+    def test_null_properties(self):
+        null_points = {
+            "type": "FeatureCollection",
+            "features": [{**pt, "properties": None} for pt in points["features"]],
+        }
+        null_polygons = {
+            "type": "FeatureCollection",
+            "features": [{**poly, "properties": None} for poly in polygons["features"]],
+        }
+
+        result = points_within_polygons(
+            null_points, null_polygons, {"output": "features", "field": "name"}
+        )
+
+        assert [feature["properties"] for feature in result["features"]] == [
+            {"name": None}
+        ] * 5
+        assert null_points["features"][0]["properties"] is None
+
+    def test_no_polygons(self):
+        assert points_within_polygons(points, feature_collection([])) == [None] * len(
+            positions
+        )
+
+    @pytest.mark.parametrize(
+        "points,polygons,options,exception_value",
+        [
+            pytest.param(
+                points,
+                polygons,
+                {"mode": "any"},
+                error_code_messages["InvalidOption"]("mode", "any"),
+                id="invalid-mode",
+            ),
+            pytest.param(
+                points,
+                polygons,
+                {"output": "geojson"},
+                error_code_messages["InvalidOption"]("output", "geojson"),
+                id="invalid-output",
+            ),
+            pytest.param(
+                point([2, 2]),
+                polygons,
+                None,
+                error_code_messages["InvalidFeatureCollection"],
+                id="point-feature",
+            ),
+            pytest.param(
+                positions,
+                polygons,
+                {"output": "features"},
+                error_code_messages["InvalidFeatureCollection"],
+                id="positions-features-output",
+            ),
+            pytest.param(
+                points,
+                polygons["features"][0],
+                None,
+                error_code_messages["InvalidFeatureCollection"],
+                id="polygon-feature",
+            ),
+        ],
+    )
+    def test_exception(self, points, polygons, options, exception_value):
+        with pytest.raises(InvalidInput) as excinfo:
+            points_within_polygons(points, polygons, options)
+
+        assert str(excinfo.value) == exception_value
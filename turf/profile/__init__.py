@@ -0,0 +1 @@
+from turf.profile._profile import profile, ProfileReport, ProfileStats
@@ -0,0 +1,339 @@
+import atexit
+import functools
+import importlib
+import inspect
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Tuple
+
+
+def ring_edges(args: Tuple, result: bool) -> int:
+    """
+    :return: number of edges of the ring tested by `in_ring`
+    """
+    ring = args[1]
+
+    if len(ring) > 1 and ring[0] == ring[-1]:
+        return len(ring) - 1
+
+    return len(ring)
+
+
+# internals wrapped in addition to the public functions: (module, function name, function
+# returning the number of elements processed by a call from its arguments and result)
+internals = [
+    ("turf.invariant._invariant", "get_coords_from_features", None),
+    ("turf.boolean_point_in_polygon._boolean_point_in_polygon", "in_ring", ring_edges),
+    ("turf.boolean_point_on_line._boolean_point_on_line", "point_on_segment", None),
+    # candidate segment pairs returned
+    (
+        "turf.line_intersect._line_intersect",
+        "spatial_filtering",
+        lambda args, result: len(result),
+    ),
+    ("turf.line_intersect._sweep", "sweep_filtering", lambda args, result: len(result)),
+    # intersection points found
+    (
+        "turf.line_intersect._line_intersect",
+        "calculate_intersect",
+        lambda args, result: result is not None,
+    ),
+]
+
+# reports of the active profile() contexts
+active_reports = []
+
+# (module, attribute name, original function) of every patched attribute
+patched = []
+
+
+class ProfileStats:
+    """
+    Statistics of a profiled function.
+    """
+
+    __slots__ = ("calls", "time", "elements")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.time = 0.0
+        self.elements = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(calls={self.calls}, time={self.time:.6f}, "
+            f"elements={self.elements})"
+        )
+
+    def to_dict(self) -> Dict:
+        return {"calls": self.calls, "time": self.time, "elements": self.elements}
+
+
+class ProfileReport:
+    """
+    Call counts, cumulative wall time and element counts of the functions called in a
+    `profile` context, by qualified function name (e.g. "turf.line_intersect" for the
+    public functions, "turf.line_intersect._line_intersect.spatial_filtering" for the
+    internals).
+
+    The time of a function includes the time of the functions it calls. The elements are
+    the edges tested by `in_ring`, the candidate segment pairs returned by
+    `spatial_filtering` and `sweep_filtering`, the intersection points found by
+    `calculate_intersect`, and the cells yielded by the grid generators (`iter_hex_grid`,
+    ...), zero for the other functions.
+    """
+
+    def __init__(self) -> None:
+        self.stats = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.stats)} functions)"
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.stats
+
+    def __getitem__(self, name: str) -> ProfileStats:
+        """
+        :param name: qualified function name, or the name alone if it is unambiguous
+        :return: statistics of the function, zero if it was not called
+        """
+        if name in self.stats:
+            return self.stats[name]
+
+        matches = [key for key in self.stats if key.rsplit(".", 1)[-1] == name]
+
+        if len(matches) == 1:
+            return self.stats[matches[0]]
+
+        return ProfileStats()
+
+    def record(self, name: str, elapsed: float, elements: int) -> None:
+        stats = self.stats.get(name)
+
+        if stats is None:
+            stats = self.stats[name] = ProfileStats()
+
+        stats.calls += 1
+        stats.time += elapsed
+        stats.elements += elements
+
+    def reset(self) -> None:
+        self.stats.clear()
+
+    def to_dict(self) -> Dict:
+        """
+        :return: function name -> {"calls", "time", "elements"}
+        """
+        return {name: stats.to_dict() for name, stats in self.stats.items()}
+
+    def top(self, sort_by: str = "time", limit: int = None) -> List[Tuple]:
+        """
+        :param sort_by: "time", "calls" or "elements"
+        :param limit: maximum number of functions returned
+        :return: (function name, statistics) pairs, in decreasing order of sort_by
+        """
+        items = sorted(
+            self.stats.items(), key=lambda item: getattr(item[1], sort_by), reverse=True
+        )
+
+        return items[:limit]
+
+    def format(self, sort_by: str = "time", limit: int = None) -> str:
+        """
+        :param sort_by: "time", "calls" or "elements"
+        :param limit: maximum number of functions listed
+        :return: text table of the statistics, one function per line
+        """
+        header = f"{'function':<64} {'calls':>10} {'time (s)':>12} {'elements':>12}"
+        lines = [header, "-" * len(header)]
+
+        for name, stats in self.top(sort_by, limit):
+            lines.append(
+                f"{name:<64} {stats.calls:>10} {stats.time:>12.6f} {stats.elements:>12}"
+            )
+
+        return "\n".join(lines)
+
+
+def record(name: str, elapsed: float, elements: int) -> None:
+    for report in active_reports:
+        report.record(name, elapsed, elements)
+
+
+def wrap_function(name: str, func: Callable, count: Callable = None) -> Callable:
+    """
+    :param name: name the calls are recorded under
+    :param func: function to wrap
+    :param count: function returning the number of elements of a call, from its
+        arguments and result
+    :return: function recording its calls in the active reports
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+
+        record(name, elapsed, int(count(args, result)) if count else 0)
+
+        return result
+
+    return wrapper
+
+
+def wrap_generator(name: str, func: Callable) -> Callable:
+    """
+    :param name: name the calls are recorded under
+    :param func: generator function to wrap
+    :return: generator function recording its calls in the active reports, with the time
+        spent producing the items and the number of items as elements. A call is recorded
+        once the generator is exhausted or closed.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        elapsed = 0.0
+        items = 0
+        iterator = func(*args, **kwargs)
+
+        try:
+            while True:
+                start = time.perf_counter()
+
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    elapsed += time.perf_counter() - start
+                    break
+
+                elapsed += time.perf_counter() - start
+                items += 1
+
+                yield item
+        finally:
+            record(name, elapsed, items)
+
+    return wrapper
+
+
+def get_targets() -> Iterator[Tuple[str, Callable, Callable]]:
+    """
+    :return: (name, function, element counter) of the public functions of the package and
+        of the internals
+    """
+    import turf
+
+    # loads the lazily imported modules of the package, see turf/__init__.py
+    for attribute in turf.__all__:
+        value = getattr(turf, attribute)
+
+        if (
+            inspect.isfunction(value)
+            and value.__module__.startswith("turf.")
+            and attribute != "profile"
+        ):
+            yield f"turf.{attribute}", value, None
+
+    for module_name, attribute, count in internals:
+        module = importlib.import_module(module_name)
+        yield f"{module_name}.{attribute}", getattr(module, attribute), count
+
+
+def install() -> None:
+    """
+    Replaces the profiled functions by their wrappers, in every loaded module they were
+    imported in: the turf modules, and the modules of the caller, e.g. one importing
+    `from turf.distance import distance`.
+    """
+    wrappers = {}
+
+    for name, func, count in get_targets():
+        if id(func) in wrappers:
+            continue
+
+        if inspect.isgeneratorfunction(func):
+            wrappers[id(func)] = (func, wrap_generator(name, func))
+        else:
+            wrappers[id(func)] = (func, wrap_function(name, func, count))
+
+    for module in list(sys.modules.values()):
+        namespace = getattr(module, "__dict__", None)
+
+        if not isinstance(namespace, dict):
+            continue
+
+        for attribute, value in list(namespace.items()):
+            wrapper = wrappers.get(id(value))
+
+            if wrapper is not None and wrapper[0] is value:
+                setattr(module, attribute, wrapper[1])
+                patched.append((module, attribute, value))
+
+
+def uninstall() -> None:
+    """
+    Puts back the original functions.
+    """
+    while patched:
+        module, attribute, value = patched.pop()
+        setattr(module, attribute, value)
+
+
+@contextmanager
+def profile() -> Iterator[ProfileReport]:
+    """
+    Profiles the turf functions called in the context: the public functions and a few
+    internals on the hot paths (`in_ring`, `spatial_filtering`, `calculate_intersect`,
+    `point_on_segment`, ...) are wrapped to record their call counts, cumulative wall
+    time and element counts in a report.
+
+    The functions are wrapped by rebinding the module attributes that refer to them, in
+    the turf modules and in every other loaded module (e.g. after
+    `from turf.distance import distance`). Calls through other references are not
+    recorded: references held in local variables, containers or default arguments, or
+    imported by a module loaded once the context is entered.
+
+    The functions are only wrapped while a profile context is active, so profiling has
+    no overhead otherwise. Nested contexts record the calls in every active report.
+    Profiling is not thread safe: the functions are wrapped for every thread.
+
+    Setting the TURF_PROFILE environment variable profiles the whole process, the report
+    being printed to stderr at exit.
+
+    :return: context manager, yielding the ProfileReport
+    """
+    report = ProfileReport()
+
+    if not active_reports:
+        install()
+
+    active_reports.append(report)
+
+    try:
+        yield report
+    finally:
+        active_reports.remove(report)
+
+        if not active_reports:
+            uninstall()
+
+
+def profile_from_environment() -> None:
+    """
+    Profiles the whole process if the TURF_PROFILE environment variable is set (to
+    anything but "0"), printing the report to stderr at exit.
+    """
+    if os.environ.get("TURF_PROFILE", "0") in ("", "0"):
+        return
+
+    context = profile()
+    report = context.__enter__()
+
+    def print_report():
+        context.__exit__(None, None, None)
+        print(report.format(), file=sys.stderr)
+
+    atexit.register(print_report)
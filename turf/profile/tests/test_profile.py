@@ -0,0 +1,121 @@
+import pytest
+
+import turf
+from turf.bearing import bearing
+from turf.boolean_point_in_polygon import _boolean_point_in_polygon
+from turf.line_intersect import _line_intersect
+from turf.profile import profile, ProfileReport, ProfileStats
+
+square_polygon = turf.polygon([[[0, 0], [10, 0], [10, 10], [0, 10], [0, 0]]])
+
+
+def test_profile_public_functions():
+    with profile() as report:
+        for _ in range(3):
+            turf.boolean_point_in_polygon(turf.point([5, 5]), square_polygon)
+
+    assert isinstance(report, ProfileReport)
+    assert report["turf.boolean_point_in_polygon"].calls == 3
+    assert report["turf.boolean_point_in_polygon"].time > 0
+    assert report["turf.point"].calls == 3
+
+    # the edges tested by in_ring
+    assert report["in_ring"].calls == 3
+    assert report["in_ring"].elements == 12
+
+
+def test_profile_imported_functions():
+    # imported from its module, the documented import style
+    with profile() as report:
+        bearing([0, 0], [1, 1])
+
+    assert report["turf.bearing"].calls == 1
+    assert bearing.__module__ == "turf.bearing._bearing"
+    assert bearing is turf.bearing
+
+
+def test_profile_line_intersect():
+    line_1 = turf.line_string([[0, 0], [10, 10], [20, 0]])
+    line_2 = turf.line_string([[0, 10], [20, 10], [0, 5]])
+
+    with profile() as report:
+        result = turf.line_intersect(line_1, line_2)
+
+    candidates = report["spatial_filtering"]
+
+    assert candidates.calls == 1
+    assert candidates.elements >= len(result["features"])
+    assert report["calculate_intersect"].calls == candidates.elements
+    assert report["calculate_intersect"].elements == len(result["features"])
+
+
+def test_profile_grid_cells():
+    with profile() as report:
+        cells = list(turf.iter_hex_grid([0, 0, 1, 1], 20))
+
+    assert report["turf.iter_hex_grid"].calls == 1
+    assert report["turf.iter_hex_grid"].elements == len(cells)
+
+
+def test_profile_restores_functions():
+    in_ring = _boolean_point_in_polygon.in_ring
+    distance = turf.distance
+
+    with profile():
+        assert _boolean_point_in_polygon.in_ring is not in_ring
+        assert turf.distance is not distance
+
+        with profile() as inner:
+            turf.distance([0, 0], [1, 1])
+
+        assert turf.distance is not distance
+
+    assert _boolean_point_in_polygon.in_ring is in_ring
+    assert _line_intersect.calculate_intersect.__name__ == "calculate_intersect"
+    assert turf.distance is distance
+    assert inner["turf.distance"].calls == 1
+
+
+def test_profile_nested():
+    with profile() as outer:
+        turf.distance([0, 0], [1, 1])
+
+        with profile() as inner:
+            turf.distance([0, 0], [1, 1])
+
+    assert outer["turf.distance"].calls == 2
+    assert inner["turf.distance"].calls == 1
+
+
+def test_profile_report():
+    with profile() as report:
+        turf.distance([0, 0], [1, 1])
+        turf.bearing([0, 0], [1, 1])
+        turf.bearing([0, 0], [1, 1])
+
+    assert "turf.bearing" in report
+    assert "turf.area" not in report
+    assert report["turf.area"].calls == 0
+
+    # the coordinates of both points are read on every call
+    name, stats = report.top("calls", 1)[0]
+    assert name.endswith(".get_coords_from_features")
+    assert stats.calls == 6
+    assert report.to_dict()["turf.bearing"] == {
+        "calls": 2,
+        "time": pytest.approx(report["turf.bearing"].time),
+        "elements": 0,
+    }
+
+    table = report.format()
+    assert "turf.bearing" in table
+    assert "turf.distance" in table
+
+    report.reset()
+    assert report.to_dict() == {}
+
+
+def test_profile_stats():
+    stats = ProfileStats()
+
+    assert stats.to_dict() == {"calls": 0, "time": 0.0, "elements": 0}
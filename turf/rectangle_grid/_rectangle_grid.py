@@ -1,9 +1,16 @@
-from typing import Dict, List, Union
+from typing import Dict, Iterator, List, Sequence, Tuple, Union
 
-from turf.distance import distance
 from turf.bbox import bbox
-from turf.boolean_intersects import boolean_intersects
-from turf.helpers import feature_collection, polygon, FeatureCollection
+from turf.helpers import feature_collection, polygon, radians_to_length
+from turf.helpers import FeatureCollection
+from turf.kernels import haversine
+from turf.utils.grid_mask import GridMask
+from turf.utils.grid_spec import (
+    GridSpec,
+    accumulate_steps,
+    bbox_cell_ranges,
+    bbox_overlaps,
+)
 
 
 def rectangle_grid(
@@ -28,56 +35,195 @@ def rectangle_grid(
 
     :returns: FeatureCollection of a grid of polygons
     """
+
+    return feature_collection(
+        list(iter_rectangle_grid(bbox, cell_width, cell_height, options))
+    )
+
+
+def iter_rectangle_grid(
+    bbox: List[float],
+    cell_width: Union[int, float],
+    cell_height: Union[int, float],
+    options: Dict = {},
+) -> Iterator[Dict]:
+    """
+    Generates the cells of `rectangle_grid` lazily, in the same order: column by column
+    from west to east, and from south to north within each column. Only the current cell
+    is held in memory, so the cells can be written out while they are generated, e.g. by
+    `turf.io.write_geojson_seq`.
+
+    :param bbox: Array extent in [minX, minY, maxX, maxY] order
+    :param cell_width: of each cell, in units
+    :param cell_height: of each cell, in units
+
+    :param options: Optional parameters
+        [options["units"]]: units ("degrees", "radians", "miles", "kilometers")
+                            of the given cell_width and cell_height
+        [options["mask"]]: if passed a Polygon or MultiPolygon here,
+                           the grid Points will be created only inside it
+        [options["properties"]]: passed to each point of the grid
+
+    :returns: generator of rectangle Polygon Features
+    """
     if not isinstance(options, dict):
         options = {}
 
-    results = []
-    west = bbox[0]
-    south = bbox[1]
-    east = bbox[2]
-    north = bbox[3]
-
-    x_fraction = cell_width / (distance([west, south], [east, south], options))
-    cell_width_deg = x_fraction * (east - west)
-    y_fraction = cell_height / (distance([west, south], [west, north], options))
-    cell_height_deg = y_fraction * (north - south)
-
-    # rows & columns
-    bbox_width = east - west
-    bbox_height = north - south
-    columns = int(bbox_width // cell_width_deg)
-    rows = int(bbox_height // cell_height_deg)
-
-    # if the grid does not fill the bbox perfectly, center it.
-    delta_x = (bbox_width - columns * cell_width_deg) / 2
-    delta_y = (bbox_height - rows * cell_height_deg) / 2
-
-    # iterate over columns & rows
-    current_x = west + delta_x
-    for _ in range(columns):
-        current_y = south + delta_y
-        for _ in range(rows):
-            cell_poly = polygon(
+    mask = GridMask(options["mask"]) if "mask" in options else None
+
+    spec = RectangleGridSpec(bbox, cell_width, cell_height, options)
+
+    for col, row in spec.cells():
+        cell_poly = spec.cell_polygon(col, row, options.get("properties", {}))
+
+        if mask is not None:
+            if mask.intersects(cell_poly):
+                yield cell_poly
+        else:
+            yield cell_poly
+
+
+class RectangleGridSpec(GridSpec):
+    """
+    Cell addressing of `rectangle_grid`, built from the same parameters. Cells are addressed
+    by (col, row), the column counted from the west and the row from the south.
+
+    :param bbox: Array extent in [minX, minY, maxX, maxY] order
+    :param cell_width: of each cell, in units
+    :param cell_height: of each cell, in units
+    :param options: Optional parameters
+        [options["units"]]: units ("degrees", "radians", "miles", "kilometers")
+                            of the given cell_width and cell_height
+    """
+
+    __slots__ = (
+        "bbox",
+        "columns",
+        "rows",
+        "cell_width_deg",
+        "cell_height_deg",
+        "origin_x",
+        "origin_y",
+        "column_xs",
+        "row_ys",
+    )
+
+    def __init__(
+        self,
+        bbox: List[float],
+        cell_width: Union[int, float],
+        cell_height: Union[int, float],
+        options: Dict = {},
+    ) -> None:
+        if not isinstance(options, dict):
+            options = {}
+
+        self.bbox = bbox
+
+        west = bbox[0]
+        south = bbox[1]
+        east = bbox[2]
+        north = bbox[3]
+
+        kwargs = {}
+        if "units" in options:
+            kwargs["units"] = options["units"]
+
+        factor = radians_to_length(1, **kwargs)
+
+        x_fraction = cell_width / (haversine(west, south, east, south) * factor)
+        cell_width_deg = x_fraction * (east - west)
+        y_fraction = cell_height / (haversine(west, south, west, north) * factor)
+        cell_height_deg = y_fraction * (north - south)
+
+        # rows & columns
+        bbox_width = east - west
+        bbox_height = north - south
+        columns = int(bbox_width // cell_width_deg)
+        rows = int(bbox_height // cell_height_deg)
+
+        # if the grid does not fill the bbox perfectly, center it.
+        delta_x = (bbox_width - columns * cell_width_deg) / 2
+        delta_y = (bbox_height - rows * cell_height_deg) / 2
+
+        self.columns = columns
+        self.rows = rows
+        self.cell_width_deg = cell_width_deg
+        self.cell_height_deg = cell_height_deg
+        # south west corner of the cell (0, 0)
+        self.origin_x = west + delta_x
+        self.origin_y = south + delta_y
+        # west and south edges of the columns and rows
+        self.column_xs = accumulate_steps(self.origin_x, cell_width_deg, columns)
+        self.row_ys = accumulate_steps(self.origin_y, cell_height_deg, rows)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.bbox})"
+
+    def cell_of_coords(self, x: float, y: float) -> Union[Tuple[int, int], None]:
+        fx = (x - self.origin_x) / self.cell_width_deg
+        fy = (y - self.origin_y) / self.cell_height_deg
+
+        if not (0 <= fx <= self.columns and 0 <= fy <= self.rows):
+            return None
+
+        # points on the east and north edges of the grid belong to the last cells
+        return min(int(fx), self.columns - 1), min(int(fy), self.rows - 1)
+
+    def has_cell(self, col: int, row: int) -> bool:
+        return 0 <= col < self.columns and 0 <= row < self.rows
+
+    def cell_bbox(self, col: int, row: int) -> List[float]:
+        x, y = self.cell_origin(col, row)
+
+        return [x, y, x + self.cell_width_deg, y + self.cell_height_deg]
+
+    def cell_origin(self, col: int, row: int) -> Tuple[float, float]:
+        """
+        :param col: cell column
+        :param row: cell row
+        :return: coordinates of the south west corner of the cell
+        """
+        if 0 <= col < self.columns and 0 <= row < self.rows:
+            return self.column_xs[col], self.row_ys[row]
+
+        # cells outside the grid
+        return (
+            self.origin_x + col * self.cell_width_deg,
+            self.origin_y + row * self.cell_height_deg,
+        )
+
+    def cell_polygon(self, col: int, row: int, properties: Dict = None) -> Dict:
+        x, y = self.cell_origin(col, row)
+
+        return polygon(
+            [
                 [
-                    [
-                        [current_x, current_y],
-                        [current_x, current_y + cell_height_deg],
-                        [current_x + cell_width_deg, current_y + cell_height_deg],
-                        [current_x + cell_width_deg, current_y],
-                        [current_x, current_y],
-                    ]
-                ],
-                options.get("properties", {}),
-            )
-
-            if "mask" in options:
-                if boolean_intersects(options["mask"], cell_poly):
-                    results.append(cell_poly)
-            else:
-                results.append(cell_poly)
-
-            current_y += cell_height_deg
-
-        current_x += cell_width_deg
-
-    return feature_collection(results)
+                    [x, y],
+                    [x, y + self.cell_height_deg],
+                    [x + self.cell_width_deg, y + self.cell_height_deg],
+                    [x + self.cell_width_deg, y],
+                    [x, y],
+                ]
+            ],
+            properties if properties is not None else {},
+        )
+
+    def cells_in_bbox(self, bbox: Sequence) -> Iterator[Tuple[int, int]]:
+        first_col, last_col, first_row, last_row = bbox_cell_ranges(
+            bbox,
+            self.origin_x,
+            self.origin_y,
+            self.cell_width_deg,
+            self.cell_height_deg,
+        )
+
+        for col in range(max(first_col, 0), min(last_col, self.columns - 1) + 1):
+            for row in range(max(first_row, 0), min(last_row, self.rows - 1) + 1):
+                if bbox_overlaps(self.cell_bbox(col, row), bbox):
+                    yield col, row
+
+    def cells(self) -> Iterator[Tuple[int, int]]:
+        for col in range(self.columns):
+            for row in range(self.rows):
+                yield col, row
@@ -2,8 +2,11 @@ import pytest
 import os
 
 from turf.bbox_polygon import bbox_polygon
-from turf.rectangle_grid import rectangle_grid
+from turf.boolean_intersects import boolean_intersects
+from turf.helpers import multi_polygon, polygon
+from turf.rectangle_grid import rectangle_grid, iter_rectangle_grid
 
+from turf.utils.grid_mask import GridMask, BOUNDARY, INSIDE, OUTSIDE
 from turf.utils.test_setup import get_fixtures
 
 
@@ -37,6 +40,64 @@ class TestRectangleGrid:
 
         assert result == fixture["out"]
 
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            pytest.param(fixture, id=fixture_name)
+            for fixture_name, fixture in fixtures.items()
+        ],
+    )
+    def test_iter_rectangle_grid(self, fixture):
+        bbox = fixture["in"]["bbox"]
+        cell_width = fixture["in"]["cellWidth"]
+        cell_height = fixture["in"]["cellHeight"]
+
+        options = dict(
+            (key, fixture["in"][key])
+            for key in ["units", "mask", "properties"]
+            if key in fixture["in"]
+        )
+
+        cells = iter_rectangle_grid(bbox, cell_width, cell_height, options)
+
+        assert not isinstance(cells, list)
+        assert (
+            list(cells)
+            == rectangle_grid(bbox, cell_width, cell_height, options)["features"]
+        )
+
+    @pytest.mark.parametrize(
+        "mask",
+        [
+            pytest.param(
+                polygon([[[0, 0], [4, 0], [4, 1], [1, 1], [1, 4], [0, 4], [0, 0]]]),
+                id="concave",
+            ),
+            pytest.param(
+                multi_polygon(
+                    [
+                        [[[0, 0], [2, 0], [2, 2], [0, 2], [0, 0]]],
+                        [[[2.5, 2.5], [4, 2.5], [3, 4], [2.5, 2.5]]],
+                    ]
+                ),
+                id="multi_polygon",
+            ),
+        ],
+    )
+    def test_grid_mask(self, mask):
+        grid_mask = GridMask(mask)
+        cells = rectangle_grid([-0.5, -0.5, 4.5, 4.5], 25, 25)["features"]
+
+        positions = set()
+
+        for cell in cells:
+            assert grid_mask.intersects(cell) == boolean_intersects(mask, cell)
+
+            ring = cell["geometry"]["coordinates"][0]
+            positions.add(grid_mask.classify([*ring[0], *ring[2]]))
+
+        assert positions == {BOUNDARY, INSIDE, OUTSIDE}
+
 
 def prepare_output(result, bbox, options):
     for i in range(len(result["features"])):
@@ -1,9 +1,8 @@
-from math import atan2, fmod, log, pi, tan
 from typing import Dict, Sequence, Union
 
-from turf.helpers import degrees_to_radians, radians_to_degrees
 from turf.helpers import Feature
 from turf.invariant import get_coords_from_features
+from turf.kernels import check_degrees, rhumb_bearing as rhumb_bearing_kernel
 
 
 def rhumb_bearing(
@@ -45,18 +44,6 @@ def calculate_rhumb_bearing(origin: Sequence, destination: Sequence) -> float:
     Calculates the bearing from origin to destination point along a rhumb line.
     http://www.edwilliams.org/avform.htm#Rhumb
     """
-    phi_1 = degrees_to_radians(origin[1])
-    phi_2 = degrees_to_radians(destination[1])
-    delta_lambda = degrees_to_radians(destination[0] - origin[0])
+    check_degrees(origin[1], destination[1])
 
-    # if delta_lambda over 180° take shorter rhumb line across the anti-meridian:
-    if abs(delta_lambda) > pi:
-        if delta_lambda > 0:
-            delta_lambda = -(2 * pi - delta_lambda)
-        if delta_lambda < 0:
-            delta_lambda = 2 * pi + delta_lambda
-
-    delta_psi = log(tan(phi_2 / 2 + pi / 4) / tan(phi_1 / 2 + pi / 4))
-    theta = atan2(delta_lambda, delta_psi)
-
-    return fmod(radians_to_degrees(theta) + 360, 360)
+    return rhumb_bearing_kernel(origin[0], origin[1], destination[0], destination[1])
@@ -1,9 +1,9 @@
 from typing import Dict, List
-from math import cos, log, pi, sqrt, tan
 
-from turf.helpers import convert_length, degrees_to_radians
+from turf.helpers import convert_length
 from turf.helpers import earth_radius
 from turf.invariant import get_coords_from_features
+from turf.kernels import check_degrees, rhumb_distance as rhumb_distance_kernel
 
 
 def rhumb_distance(origin, destination, options: Dict = None) -> float:
@@ -59,29 +59,8 @@ def calculate_rhumb_distance(
     if not radius:
         radius = earth_radius
 
-    phi_1 = degrees_to_radians(origin[1])
-    phi_2 = degrees_to_radians(destination[1])
-    delta_phi = phi_2 - phi_1
+    check_degrees(origin[1], destination[1])
 
-    delta_lambda = degrees_to_radians(abs(destination[0] - origin[0]))
-
-    # if dLon over 180° take shorter rhumb line across the anti-meridian:
-    if delta_lambda > pi:
-        delta_lambda -= 2 * pi
-
-    # on Mercator projection, longitude distances shrink by latitude; q is the 'stretch factor'
-    # q becomes ill-conditioned along E-W line (0/0); use empirical tolerance to avoid it
-
-    delta_psi = log(tan(phi_2 / 2 + pi / 4) / tan(phi_1 / 2 + pi / 4))
-
-    if abs(delta_psi) > 10e-12:
-        q_1 = delta_phi / delta_psi
-    else:
-        q_1 = cos(phi_1)
-
-    # distance is pythagoras on 'stretched' Mercator projection
-    delta = sqrt(delta_phi * delta_phi + q_1 * q_1 * delta_lambda * delta_lambda)
-    # angular distance in radians
-    distance = delta * radius
-
-    return distance
+    return rhumb_distance_kernel(
+        origin[0], origin[1], destination[0], destination[1], radius
+    )
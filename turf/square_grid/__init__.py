@@ -1 +1 @@
-from turf.square_grid._square_grid import square_grid
+from turf.square_grid._square_grid import square_grid, iter_square_grid, SquareGridSpec
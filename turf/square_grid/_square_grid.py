@@ -1,7 +1,11 @@
-from typing import Dict, List, Union
+from typing import Dict, Iterator, List, Union
 
 from turf.helpers import FeatureCollection
-from turf.rectangle_grid import rectangle_grid
+from turf.rectangle_grid import (
+    iter_rectangle_grid,
+    rectangle_grid,
+    RectangleGridSpec,
+)
 
 
 def square_grid(
@@ -25,3 +29,42 @@ def square_grid(
     """
 
     return rectangle_grid(bbox, n_cells, n_cells, options)
+
+
+def iter_square_grid(
+    bbox: List[float],
+    n_cells: Union[int, float],
+    options: Dict = {},
+) -> Iterator[Dict]:
+    """
+    Generates the cells of `square_grid` lazily, in the same order: column by column from
+    west to east, and from south to north within each column.
+
+    :param bbox: Array extent in [minX, minY, maxX, maxY] order
+    :param n_cells: number of each cell, in units
+    :param options: Optional parameters, same as `square_grid`
+
+    :returns: generator of square Polygon Features
+    """
+
+    return iter_rectangle_grid(bbox, n_cells, n_cells, options)
+
+
+class SquareGridSpec(RectangleGridSpec):
+    """
+    Cell addressing of `square_grid`, built from the same parameters. Cells are addressed
+    by (col, row), the column counted from the west and the row from the south.
+
+    :param bbox: Array extent in [minX, minY, maxX, maxY] order
+    :param n_cells: number of each cell, in units
+    :param options: Optional parameters
+        [options["units"]]: units ("degrees", "radians", "miles", "kilometers")
+                            of the given cell side
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self, bbox: List[float], n_cells: Union[int, float], options: Dict = {}
+    ) -> None:
+        super().__init__(bbox, n_cells, n_cells, options)
@@ -0,0 +1,68 @@
+import subprocess
+import sys
+
+import pytest
+
+import turf
+
+
+def loaded_modules(statement: str) -> set:
+    """
+    :return: names of the modules loaded by a fresh interpreter running the statement
+    """
+    code = f"{statement}\nimport sys\nprint(' '.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    return set(result.stdout.split())
+
+
+def test_import_loads_helpers_only():
+    modules = loaded_modules("import turf")
+
+    assert "turf.helpers" in modules
+    assert "turf.distance" not in modules
+    assert "turf.line_intersect" not in modules
+    assert "rtree" not in modules
+
+
+def test_import_from_loads_its_module():
+    modules = loaded_modules("from turf import distance")
+
+    assert "turf.distance" in modules
+    assert "turf.line_intersect" not in modules
+    assert "decimal" not in modules
+
+    modules = loaded_modules("from turf import line_intersect")
+
+    assert "turf.line_intersect" in modules
+    # only loaded when the R-tree is built
+    assert "rtree" not in modules
+
+
+def test_lazy_attributes():
+    from turf.along import along
+    from turf.line_intersect import SegmentIndex
+
+    assert turf.along is along
+    assert turf.SegmentIndex is SegmentIndex
+
+    # submodules are available too, without shadowing the functions
+    assert turf.invariant.get_coords_from_features
+    assert callable(turf.bbox)
+    assert callable(turf.profile)
+
+    with pytest.raises(AttributeError):
+        turf.not_a_function
+
+    assert "line_intersect" in dir(turf)
+
+
+def test_star_import():
+    namespace = {}
+    exec("from turf import *", namespace)
+
+    assert namespace["distance"] is turf.distance
+    assert namespace["point"] is turf.point
+    assert namespace["TriangleGridSpec"] is turf.TriangleGridSpec
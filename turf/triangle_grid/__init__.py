@@ -1 +1,5 @@
-from turf.triangle_grid._triangle_grid import triangle_grid
+from turf.triangle_grid._triangle_grid import (
+    triangle_grid,
+    iter_triangle_grid,
+    TriangleGridSpec,
+)
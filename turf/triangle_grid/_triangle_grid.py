@@ -1,9 +1,16 @@
-from typing import Dict, List, Union
+from typing import Dict, Iterator, List, Sequence, Tuple, Union
 
-from turf.distance import distance
 from turf.bbox import bbox
-from turf.boolean_intersects import boolean_intersects
-from turf.helpers import feature_collection, polygon, FeatureCollection
+from turf.helpers import feature_collection, polygon, radians_to_length
+from turf.helpers import FeatureCollection
+from turf.kernels import haversine
+from turf.utils.grid_mask import GridMask
+from turf.utils.grid_spec import (
+    GridSpec,
+    accumulate_steps_to,
+    bbox_cell_ranges,
+    bbox_overlaps,
+)
 
 
 def triangle_grid(
@@ -25,143 +32,211 @@ def triangle_grid(
 
     :returns: FeatureCollection of a grid of polygons
     """
+
+    return feature_collection(list(iter_triangle_grid(bbox, cell_side, options)))
+
+
+def iter_triangle_grid(
+    bbox: List[float],
+    cell_side: Union[int, float],
+    options: Dict = {},
+) -> Iterator[Dict]:
+    """
+    Generates the cells of `triangle_grid` lazily, in the same order: column by column
+    from west to east, and from south to north within each column. Only the current cell
+    is held in memory, so the cells can be written out while they are generated, e.g. by
+    `turf.io.write_geojson_seq`.
+
+    :param bbox: Array extent in [minX, minY, maxX, maxY] order
+    :param cell_side: dimension of each cell
+    :param options: Optional parameters
+        [options["units"]]: units ("degrees", "radians", "miles", "kilometers")
+                            of the given cell_width and cell_height
+        [options["mask"]]: if passed a Polygon or MultiPolygon here,
+                           the grid Points will be created only inside it
+        [options["properties"]]: passed to each point of the grid
+
+    :returns: generator of triangle Polygon Features
+    """
     if not isinstance(options, dict):
         options = {}
 
-    results = []
-    west = bbox[0]
-    south = bbox[1]
-    east = bbox[2]
-    north = bbox[3]
-
-    x_fraction = cell_side / (distance([west, south], [east, south], options))
-    cell_width_deg = x_fraction * (east - west)
-    y_fraction = cell_side / (distance([west, south], [west, north], options))
-    cell_height_deg = y_fraction * (north - south)
-
-    # if the grid does not fill the bbox perfectly, center it.
-    xi = 0
-    current_x = west
-    while current_x <= east:
-        yi = 0
-        current_y = south
-        while current_y <= north:
-            cell_triangle1 = None
-            cell_triangle2 = None
-
-            if (xi % 2 == 0) and (yi % 2 == 0):
-                cell_triangle1 = polygon(
-                    [
-                        [
-                            [current_x, current_y],
-                            [current_x, current_y + cell_height_deg],
-                            [current_x + cell_width_deg, current_y],
-                            [current_x, current_y],
-                        ]
-                    ],
-                    options.get("properties", {}),
-                )
-
-                cell_triangle2 = polygon(
-                    [
-                        [
-                            [current_x, current_y + cell_height_deg],
-                            [current_x + cell_width_deg, current_y + cell_height_deg],
-                            [current_x + cell_width_deg, current_y],
-                            [current_x, current_y + cell_height_deg],
-                        ]
-                    ],
-                    options.get("properties", {}),
-                )
-
-            elif (xi % 2 == 0) and (yi % 2 == 1):
-                cell_triangle1 = polygon(
-                    [
-                        [
-                            [current_x, current_y],
-                            [current_x + cell_width_deg, current_y + cell_height_deg],
-                            [current_x + cell_width_deg, current_y],
-                            [current_x, current_y],
-                        ]
-                    ],
-                    options.get("properties", {}),
-                )
-
-                cell_triangle2 = polygon(
-                    [
-                        [
-                            [current_x, current_y],
-                            [current_x, current_y + cell_height_deg],
-                            [current_x + cell_width_deg, current_y + cell_height_deg],
-                            [current_x, current_y],
-                        ]
-                    ],
-                    options.get("properties", {}),
-                )
-
-            elif (yi % 2 == 0) and (xi % 2 == 1):
-                cell_triangle1 = polygon(
-                    [
-                        [
-                            [current_x, current_y],
-                            [current_x, current_y + cell_height_deg],
-                            [current_x + cell_width_deg, current_y + cell_height_deg],
-                            [current_x, current_y],
-                        ]
-                    ],
-                    options.get("properties", {}),
-                )
-
-                cell_triangle2 = polygon(
-                    [
-                        [
-                            [current_x, current_y],
-                            [current_x + cell_width_deg, current_y + cell_height_deg],
-                            [current_x + cell_width_deg, current_y],
-                            [current_x, current_y],
-                        ]
-                    ],
-                    options.get("properties", {}),
-                )
-
-            elif (yi % 2 == 1) and (xi % 2 == 1):
-                cell_triangle1 = polygon(
-                    [
-                        [
-                            [current_x, current_y],
-                            [current_x, current_y + cell_height_deg],
-                            [current_x + cell_width_deg, current_y],
-                            [current_x, current_y],
-                        ]
-                    ],
-                    options.get("properties", {}),
-                )
-
-                cell_triangle2 = polygon(
-                    [
-                        [
-                            [current_x, current_y + cell_height_deg],
-                            [current_x + cell_width_deg, current_y + cell_height_deg],
-                            [current_x + cell_width_deg, current_y],
-                            [current_x, current_y + cell_height_deg],
-                        ]
-                    ],
-                    options.get("properties", {}),
-                )
-
-            if "mask" in options:
-                if boolean_intersects(options["mask"], cell_triangle1):
-                    results.append(cell_triangle1)
-                if boolean_intersects(options["mask"], cell_triangle2):
-                    results.append(cell_triangle2)
-            else:
-                results.append(cell_triangle1)
-                results.append(cell_triangle2)
-
-            current_y += cell_height_deg
-            yi += 1
-
-        current_x += cell_width_deg
-        xi += 1
-
-    return feature_collection(results)
+    mask = GridMask(options["mask"]) if "mask" in options else None
+
+    spec = TriangleGridSpec(bbox, cell_side, options)
+
+    for col, row in spec.cells():
+        cell_triangle = spec.cell_polygon(col, row, options.get("properties", {}))
+
+        if mask is not None:
+            if mask.intersects(cell_triangle):
+                yield cell_triangle
+        else:
+            yield cell_triangle
+
+
+class TriangleGridSpec(GridSpec):
+    """
+    Cell addressing of `triangle_grid`, built from the same parameters. The grid is made of
+    squares cut in two triangles along a diagonal alternating between neighbours. The square
+    of a triangle is given by its column counted from the west, and by its row divided by 2
+    counted from the south; the parity of the row tells which of its two triangles it is.
+
+    :param bbox: Array extent in [minX, minY, maxX, maxY] order
+    :param cell_side: dimension of each cell
+    :param options: Optional parameters
+        [options["units"]]: units ("degrees", "radians", "miles", "kilometers")
+                            of the given cell_side
+    """
+
+    __slots__ = (
+        "bbox",
+        "columns",
+        "rows",
+        "cell_width_deg",
+        "cell_height_deg",
+        "origin_x",
+        "origin_y",
+        "column_xs",
+        "row_ys",
+    )
+
+    def __init__(
+        self, bbox: List[float], cell_side: Union[int, float], options: Dict = {}
+    ) -> None:
+        if not isinstance(options, dict):
+            options = {}
+
+        self.bbox = bbox
+
+        west = bbox[0]
+        south = bbox[1]
+        east = bbox[2]
+        north = bbox[3]
+
+        kwargs = {}
+        if "units" in options:
+            kwargs["units"] = options["units"]
+
+        factor = radians_to_length(1, **kwargs)
+
+        x_fraction = cell_side / (haversine(west, south, east, south) * factor)
+        cell_width_deg = x_fraction * (east - west)
+        y_fraction = cell_side / (haversine(west, south, west, north) * factor)
+        cell_height_deg = y_fraction * (north - south)
+
+        # west and south edges of the squares starting up to the east and north edges,
+        # the grid is not centered
+        self.column_xs = accumulate_steps_to(west, cell_width_deg, east)
+        self.row_ys = accumulate_steps_to(south, cell_height_deg, north)
+        self.columns = len(self.column_xs)
+        self.rows = len(self.row_ys)
+        self.cell_width_deg = cell_width_deg
+        self.cell_height_deg = cell_height_deg
+        self.origin_x = west
+        self.origin_y = south
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.bbox})"
+
+    def cell_of_coords(self, x: float, y: float) -> Union[Tuple[int, int], None]:
+        fx = (x - self.origin_x) / self.cell_width_deg
+        fy = (y - self.origin_y) / self.cell_height_deg
+
+        if not (0 <= fx <= self.columns and 0 <= fy <= self.rows):
+            return None
+
+        # points on the east and north edges of the grid belong to the last squares
+        xi = min(int(fx), self.columns - 1)
+        yi = min(int(fy), self.rows - 1)
+
+        u = fx - xi
+        v = fy - yi
+
+        if xi % 2 == yi % 2:
+            # diagonal from the north west corner, first triangle to the south west
+            second = u + v > 1
+        elif xi % 2 == 0:
+            # diagonal from the south west corner, first triangle to the south east
+            second = v > u
+        else:
+            # diagonal from the south west corner, first triangle to the north west
+            second = v < u
+
+        return xi, 2 * yi + second
+
+    def has_cell(self, col: int, row: int) -> bool:
+        return 0 <= col < self.columns and 0 <= row < 2 * self.rows
+
+    def square_origin(self, xi: int, yi: int) -> Tuple[float, float]:
+        """
+        :param xi: square column
+        :param yi: square row, i.e. the cell row divided by 2
+        :return: coordinates of the south west corner of the square
+        """
+        if 0 <= xi < self.columns and 0 <= yi < self.rows:
+            return self.column_xs[xi], self.row_ys[yi]
+
+        # squares outside the grid
+        return (
+            self.origin_x + xi * self.cell_width_deg,
+            self.origin_y + yi * self.cell_height_deg,
+        )
+
+    def cell_bbox(self, col: int, row: int) -> List[float]:
+        x, y = self.square_origin(col, row // 2)
+
+        # both triangles span their whole square
+        return [x, y, x + self.cell_width_deg, y + self.cell_height_deg]
+
+    def cell_polygon(self, col: int, row: int, properties: Dict = None) -> Dict:
+        xi = col
+        yi = row // 2
+
+        x, y = self.square_origin(xi, yi)
+
+        south_west = [x, y]
+        north_west = [x, y + self.cell_height_deg]
+        north_east = [x + self.cell_width_deg, y + self.cell_height_deg]
+        south_east = [x + self.cell_width_deg, y]
+
+        if xi % 2 == yi % 2:
+            triangles = (
+                [south_west, north_west, south_east, south_west],
+                [north_west, north_east, south_east, north_west],
+            )
+        elif xi % 2 == 0:
+            triangles = (
+                [south_west, north_east, south_east, south_west],
+                [south_west, north_west, north_east, south_west],
+            )
+        else:
+            triangles = (
+                [south_west, north_west, north_east, south_west],
+                [south_west, north_east, south_east, south_west],
+            )
+
+        return polygon(
+            [[list(coord) for coord in triangles[row % 2]]],
+            properties if properties is not None else {},
+        )
+
+    def cells_in_bbox(self, bbox: Sequence) -> Iterator[Tuple[int, int]]:
+        first_col, last_col, first_row, last_row = bbox_cell_ranges(
+            bbox,
+            self.origin_x,
+            self.origin_y,
+            self.cell_width_deg,
+            self.cell_height_deg,
+        )
+
+        for col in range(max(first_col, 0), min(last_col, self.columns - 1) + 1):
+            for yi in range(max(first_row, 0), min(last_row, self.rows - 1) + 1):
+                if bbox_overlaps(self.cell_bbox(col, 2 * yi), bbox):
+                    yield col, 2 * yi
+                    yield col, 2 * yi + 1
+
+    def cells(self) -> Iterator[Tuple[int, int]]:
+        for col in range(self.columns):
+            for row in range(2 * self.rows):
+                yield col, row
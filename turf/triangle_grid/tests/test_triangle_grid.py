@@ -1,8 +1,12 @@
 import pytest
 import os
 
+from turf.bbox import bbox as bounding_box
 from turf.bbox_polygon import bbox_polygon
-from turf.triangle_grid import triangle_grid
+from turf.distance import distance
+from turf.boolean_point_in_polygon import boolean_point_in_polygon
+from turf.helpers import point
+from turf.triangle_grid import triangle_grid, iter_triangle_grid, TriangleGridSpec
 
 from turf.utils.test_setup import get_fixtures
 
@@ -36,6 +40,100 @@ class TestPointGrid:
 
         assert result == fixture["out"]
 
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            pytest.param(fixture, id=fixture_name)
+            for fixture_name, fixture in fixtures.items()
+        ],
+    )
+    def test_iter_triangle_grid(self, fixture):
+        bbox = fixture["in"]["bbox"]
+        cell_side = fixture["in"]["cellSide"]
+
+        options = dict(
+            (key, fixture["in"][key])
+            for key in ["units", "mask", "properties"]
+            if key in fixture["in"]
+        )
+
+        cells = iter_triangle_grid(bbox, cell_side, options)
+
+        assert not isinstance(cells, list)
+        assert list(cells) == triangle_grid(bbox, cell_side, options)["features"]
+
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            pytest.param(fixture, id=fixture_name)
+            for fixture_name, fixture in fixtures.items()
+            if "mask" not in fixture["in"]
+        ],
+    )
+    def test_grid_spec(self, fixture):
+        bbox = fixture["in"]["bbox"]
+        cell_side = fixture["in"]["cellSide"]
+
+        options = dict(
+            (key, fixture["in"][key]) for key in ["units"] if key in fixture["in"]
+        )
+
+        spec = TriangleGridSpec(bbox, cell_side, options)
+        cells = [spec.cell_polygon(col, row) for col, row in spec.cells()]
+
+        assert cells == triangle_grid(bbox, cell_side, options)["features"]
+
+        west, south, east, north = bbox
+        steps = 15
+
+        for i in range(steps + 1):
+            for j in range(steps + 1):
+                pt = point(
+                    [
+                        west + (east - west) * i / steps,
+                        south + (north - south) * j / steps,
+                    ]
+                )
+                cell = spec.cell_of(pt)
+
+                if cell is not None:
+                    assert spec.has_cell(*cell)
+                    assert boolean_point_in_polygon(pt, spec.cell_polygon(*cell))
+                else:
+                    assert not any(
+                        boolean_point_in_polygon(pt, polygon, {"ignoreBoundary": True})
+                        for polygon in cells
+                    )
+
+        query = [
+            west + (east - west) / 4,
+            south + (north - south) / 3,
+            west + (east - west) / 2,
+            south + (north - south) / 2,
+        ]
+
+        expected = [
+            (col, row)
+            for (col, row), polygon in zip(spec.cells(), cells)
+            if overlaps(bounding_box(polygon), query)
+        ]
+
+        assert list(spec.cells_in_bbox(query)) == expected
+
+    @pytest.mark.parametrize("n_cells", [1, 3, 7, 10, 13, 29, 39])
+    @pytest.mark.parametrize("latitude", [0, 30.5, 45.5, 60])
+    def test_exact_multiple_spans(self, n_cells, latitude):
+        # the bbox spans a whole number of cells, up to rounding errors
+        bbox = [0.30000000000000004, latitude, 1.6, latitude + 0.9]
+        west, south, east, north = bbox
+        cell_side = distance([west, south], [east, south]) / n_cells
+
+        result = triangle_grid(bbox, cell_side)
+
+        assert [triangle_bbox(cell) for cell in result["features"]] == [
+            square for square in baseline_squares(bbox, cell_side) for _ in range(2)
+        ]
+
 
 def prepare_output(result, bbox, options):
     for i in range(len(result["features"])):
@@ -77,3 +175,44 @@ def round_coordinates(cell_poly):
     cell_poly["geometry"]["coordinates"] = coords
 
     return cell_poly
+
+
+def overlaps(bbox1, bbox2):
+    return (
+        bbox1[0] <= bbox2[2]
+        and bbox2[0] <= bbox1[2]
+        and bbox1[1] <= bbox2[3]
+        and bbox2[1] <= bbox1[3]
+    )
+
+
+def baseline_squares(bbox, cell_side):
+    """
+    Bounding boxes of the squares of the grid, accumulating the cell sizes from the
+    south west corner as triangle_grid always did.
+    """
+    west, south, east, north = bbox
+
+    cell_width = cell_side / distance([west, south], [east, south]) * (east - west)
+    cell_height = cell_side / distance([west, south], [west, north]) * (north - south)
+
+    squares = []
+    current_x = west
+    while current_x <= east:
+        current_y = south
+        while current_y <= north:
+            squares.append(
+                [current_x, current_y, current_x + cell_width, current_y + cell_height]
+            )
+            current_y += cell_height
+        current_x += cell_width
+
+    return squares
+
+
+def triangle_bbox(cell):
+    coords = cell["geometry"]["coordinates"][0]
+    xs = [coord[0] for coord in coords]
+    ys = [coord[1] for coord in coords]
+
+    return [min(xs), min(ys), max(xs), max(ys)]
@@ -29,6 +29,10 @@ error_code_corpus = {
     "InvalidFirstLastPoints": "First and last Points of Polygon ring are not equivalent.",
     "InvalidBoundingBox": "The input bounding box must be an array of size 4",
     "InvalidCoordinates": "The input geometry(s) must have a coordinates attribute",
+    "InvalidCoordinatesBuffer": "Input buffer must hold interleaved [lng, lat] doubles",
+    "InvalidPairedInput": "Inputs must have the same number of points",
+    "InvalidOption": lambda option, value: f"'{value}' is not a valid value for option '{option}'",
+    "InvalidJSON": lambda message: f"Input is not valid JSON: {message}",
 }
 
 error_code_messages = {
@@ -56,4 +60,8 @@ error_code_messages = {
     "InvalidFirstLastPoints": error_code_corpus["InvalidFirstLastPoints"],
     "InvalidBoundingBox": error_code_corpus["InvalidBoundingBox"],
     "InvalidCoordinates": error_code_corpus["InvalidCoordinates"],
+    "InvalidCoordinatesBuffer": error_code_corpus["InvalidCoordinatesBuffer"],
+    "InvalidPairedInput": error_code_corpus["InvalidPairedInput"],
+    "InvalidOption": error_code_corpus["InvalidOption"],
+    "InvalidJSON": error_code_corpus["InvalidJSON"],
 }
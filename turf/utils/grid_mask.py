@@ -0,0 +1,80 @@
+from typing import Dict, Sequence, Union
+
+from turf.boolean_intersects import boolean_intersects
+from turf.boolean_point_in_polygon import PreparedPolygon
+from turf.helpers import Feature
+from turf.utils.spatial_index import bulk_load
+
+INSIDE = "inside"
+OUTSIDE = "outside"
+BOUNDARY = "boundary"
+
+
+class GridMask:
+    """
+    Polygon or MultiPolygon mask prepared for filtering the cells of a grid.
+
+    The edges of the mask are indexed in an R-tree. A cell whose bounding box overlaps no
+    edge can't hold any part of the mask boundary, so it is either fully inside or fully
+    outside the mask, which a single point in polygon test tells. Only the cells on the
+    boundary of the mask need the exact (and much slower) `boolean_intersects` test.
+    """
+
+    __slots__ = ("mask", "polygon", "index")
+
+    def __init__(self, mask: Union[Dict, Feature]) -> None:
+        self.mask = mask
+        self.polygon = PreparedPolygon(mask)
+
+        self.index = bulk_load(
+            (min(xi, xj), min(yi, yj), max(xi, xj), max(yi, yj))
+            for rings in self.polygon.polygons
+            for ring in rings
+            for xi, yi, xj, yj in ring.edges
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.polygon.bbox})"
+
+    def classify(self, bbox: Sequence) -> str:
+        """
+        :param bbox: bounding box of a cell, in [minX, minY, maxX, maxY] order
+        :return: INSIDE or OUTSIDE if the whole bounding box is inside or outside the mask,
+            BOUNDARY if it overlaps the bounding box of an edge of the mask
+        """
+        if next(self.index.intersection(tuple(bbox)), None) is not None:
+            return BOUNDARY
+
+        if self.polygon.contains_coords(bbox[0], bbox[1]):
+            return INSIDE
+
+        return OUTSIDE
+
+    def intersects(self, cell: Dict) -> bool:
+        """
+        Same result as `boolean_intersects(mask, cell)`.
+
+        :param cell: Polygon Feature of a grid cell
+        :return: True if the cell intersects the mask
+        """
+        ring = cell["geometry"]["coordinates"][0]
+
+        xs = [coord[0] for coord in ring]
+        ys = [coord[1] for coord in ring]
+
+        position = self.classify((min(xs), min(ys), max(xs), max(ys)))
+
+        if position == BOUNDARY:
+            return boolean_intersects(self.mask, cell)
+
+        return position == INSIDE
+
+    def contains(self, x: float, y: float) -> bool:
+        """
+        Same result as `boolean_within(point, mask)`, the boundary of the mask is excluded.
+
+        :param x: point longitude
+        :param y: point latitude
+        :return: True if the point is within the mask
+        """
+        return self.polygon.contains_coords(x, y, ignore_boundary=True)
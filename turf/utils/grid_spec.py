@@ -0,0 +1,156 @@
+import math
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, List, Sequence, Tuple, Union
+
+from turf.invariant import get_coords_from_features
+
+
+class GridSpec(ABC):
+    """
+    Base class for the cell addressing of the grids: a grid spec holds the layout computed
+    from the grid parameters, and maps a point to the (col, row) address of the cell it
+    falls in with plain arithmetic, without generating any cell.
+    """
+
+    __slots__ = ()
+
+    def cell_of(self, point: Any) -> Union[Tuple[int, int], None]:
+        """
+        :param point: Point Feature, Point geometry or coordinates
+        :return: (col, row) address of the cell the point falls in,
+            None if it falls outside the cells of the grid
+        """
+        coords = get_coords_from_features(point, ["Point"])
+
+        return self.cell_of_coords(coords[0], coords[1])
+
+    @abstractmethod
+    def cell_of_coords(self, x: float, y: float) -> Union[Tuple[int, int], None]:
+        """
+        :param x: point longitude
+        :param y: point latitude
+        :return: (col, row) address of the cell the point falls in,
+            None if it falls outside the cells of the grid
+        """
+        pass
+
+    @abstractmethod
+    def has_cell(self, col: int, row: int) -> bool:
+        """
+        :param col: cell column
+        :param row: cell row
+        :return: True if the grid function generates this cell
+        """
+        pass
+
+    @abstractmethod
+    def cell_polygon(self, col: int, row: int, properties: Dict = None) -> Dict:
+        """
+        :param col: cell column
+        :param row: cell row
+        :param properties: properties of the returned Feature
+        :return: Polygon Feature of the cell, same as the one generated by the grid function
+        """
+        pass
+
+    @abstractmethod
+    def cell_bbox(self, col: int, row: int) -> List[float]:
+        """
+        :param col: cell column
+        :param row: cell row
+        :return: bounding box of the cell polygon, in [minX, minY, maxX, maxY] order
+        """
+        pass
+
+    @abstractmethod
+    def cells_in_bbox(self, bbox: Sequence) -> Iterator[Tuple[int, int]]:
+        """
+        :param bbox: Array extent in [minX, minY, maxX, maxY] order
+        :return: generator of the (col, row) addresses of the cells of the grid whose
+            bounding box overlaps the given one, in the order of the grid function
+        """
+        pass
+
+    @abstractmethod
+    def cells(self) -> Iterator[Tuple[int, int]]:
+        """
+        :return: generator of the (col, row) addresses of all the cells of the grid,
+            in the order of the grid function
+        """
+        pass
+
+
+def bbox_cell_ranges(
+    bbox: Sequence, origin_x: float, origin_y: float, width: float, height: float
+) -> Tuple[int, int, int, int]:
+    """
+    Columns and rows of a lattice of width x height cells overlapping a bounding box,
+    widened by one cell on each side so that rounding errors can't leave out a cell.
+
+    :param bbox: Array extent in [minX, minY, maxX, maxY] order
+    :param origin_x: longitude of the west edge of the column 0
+    :param origin_y: latitude of the south edge of the row 0
+    :param width: width of the cells
+    :param height: height of the cells
+    :return: first column, last column, first row and last row, all included and not
+        clipped to the extent of the grid
+    """
+    return (
+        math.floor((bbox[0] - origin_x) / width) - 1,
+        math.floor((bbox[2] - origin_x) / width) + 1,
+        math.floor((bbox[1] - origin_y) / height) - 1,
+        math.floor((bbox[3] - origin_y) / height) + 1,
+    )
+
+
+def accumulate_steps(start: float, step: float, count: int) -> List[float]:
+    """
+    Positions of the columns or rows of a grid, added up step by step as the grid
+    functions always did, so that the cells keep the exact same coordinates.
+
+    :param start: position of the first column or row
+    :param step: width or height of the cells
+    :param count: number of columns or rows
+    :return: list of the positions
+    """
+    positions = []
+    current = start
+
+    for _ in range(count):
+        positions.append(current)
+        current += step
+
+    return positions
+
+
+def accumulate_steps_to(start: float, step: float, end: float) -> List[float]:
+    """
+    Same as `accumulate_steps`, for the columns or rows starting up to a given end.
+
+    :param start: position of the first column or row
+    :param step: width or height of the cells
+    :param end: last position a column or row can start at
+    :return: list of the positions
+    """
+    positions = []
+    current = start
+
+    while current <= end:
+        positions.append(current)
+        current += step
+
+    return positions
+
+
+def bbox_overlaps(bbox1: Sequence, bbox2: Sequence) -> bool:
+    """
+    :param bbox1: bounding box in [minX, minY, maxX, maxY] order
+    :param bbox2: bounding box in [minX, minY, maxX, maxY] order
+    :return: True if the bounding boxes overlap or touch
+    """
+    return (
+        bbox1[0] <= bbox2[2]
+        and bbox2[0] <= bbox1[2]
+        and bbox1[1] <= bbox2[3]
+        and bbox2[1] <= bbox1[3]
+    )
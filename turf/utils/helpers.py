@@ -1,3 +1,9 @@
+from array import array
+
+from turf.utils.error_codes import error_code_messages
+from turf.utils.exceptions import InvalidInput
+
+
 def get_input_dimensions(lst, n_dim=0):
     if isinstance(lst, (list, tuple)):
         return get_input_dimensions(lst[0], n_dim + 1) if len(lst) > 0 else 0
@@ -18,3 +24,37 @@ dimensions = {
     "Polygon": 3,
     "MultiPolygon": 4,
 }
+
+
+def coordinate_columns(coords):
+    """
+    Splits a batch of positions into separate longitude and latitude columns.
+
+    :param coords: a sequence of [lng, lat] positions, or a buffer (e.g. array("d"),
+        bytes or a C-contiguous float64 array) of interleaved lng, lat doubles
+    :return: tuple with the sequence of longitudes and the sequence of latitudes
+    """
+    try:
+        view = memoryview(coords)
+    except TypeError:
+        view = None
+
+    if view is None:
+        lngs = array("d", [coord[0] for coord in coords])
+        lats = array("d", [coord[1] for coord in coords])
+
+        return lngs, lats
+
+    if view.format not in ("d", "B"):
+        raise InvalidInput(error_code_messages["InvalidCoordinatesBuffer"])
+
+    if view.ndim != 1 or view.format != "d":
+        try:
+            view = view.cast("B").cast("d")
+        except (TypeError, ValueError):
+            raise InvalidInput(error_code_messages["InvalidCoordinatesBuffer"])
+
+    if len(view) % 2:
+        raise InvalidInput(error_code_messages["InvalidCoordinatesBuffer"])
+
+    return view[0::2], view[1::2]
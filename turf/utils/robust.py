@@ -0,0 +1,83 @@
+from fractions import Fraction
+
+# relative error bound of the floating point evaluation of orient2d, from
+# Shewchuk, "Adaptive Precision Floating-Point Arithmetic and Fast Robust Geometric
+# Predicates" (1997), with epsilon = 2 ** -53 for double precision
+epsilon = 2.0**-53
+ccw_error_bound = (3.0 + 16.0 * epsilon) * epsilon
+
+
+def orient2d(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> float:
+    """
+    Orientation of the point c relative to the directed line from a to b: twice the
+    signed area of the triangle abc.
+
+    The determinant is evaluated with floats, and its sign is certified by an error
+    bound (Shewchuk's filter). In the rare cases it can't be, c being on or very close to
+    the line, it is evaluated exactly with rationals.
+
+    :param ax: longitude of a
+    :param ay: latitude of a
+    :param bx: longitude of b
+    :param by: latitude of b
+    :param cx: longitude of c
+    :param cy: latitude of c
+    :return: positive if a, b and c are in counterclockwise order, negative if they are in
+        clockwise order, 0 if they are collinear. The sign is always exact.
+    """
+    det_left = (ax - cx) * (by - cy)
+    det_right = (ay - cy) * (bx - cx)
+    det = det_left - det_right
+
+    if det_left > 0:
+        if det_right <= 0:
+            return det
+
+        det_sum = det_left + det_right
+
+    elif det_left < 0:
+        if det_right >= 0:
+            return det
+
+        det_sum = -det_left - det_right
+
+    else:
+        return det
+
+    if abs(det) >= ccw_error_bound * det_sum:
+        return det
+
+    return orient2d_exact(ax, ay, bx, by, cx, cy)
+
+
+def orient2d_exact(
+    ax: float, ay: float, bx: float, by: float, cx: float, cy: float
+) -> float:
+    """
+    Same as `orient2d`, evaluated with rationals.
+
+    :return: the determinant, rounded to the nearest float
+    """
+    ax, ay, bx, by, cx, cy = map(Fraction, (ax, ay, bx, by, cx, cy))
+
+    return float((ax - cx) * (by - cy) - (ay - cy) * (bx - cx))
+
+
+def on_segment(
+    px: float, py: float, ax: float, ay: float, bx: float, by: float
+) -> bool:
+    """
+    Checks if the point p is on the segment from a to b, ends included, exactly.
+
+    :param px: longitude of p
+    :param py: latitude of p
+    :param ax: longitude of a
+    :param ay: latitude of a
+    :param bx: longitude of b
+    :param by: latitude of b
+    :return: True if p is on the segment, False otherwise
+    """
+    if not (min(ax, bx) <= px <= max(ax, bx) and min(ay, by) <= py <= max(ay, by)):
+        return False
+
+    return orient2d(ax, ay, bx, by, px, py) == 0
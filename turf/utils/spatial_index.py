@@ -0,0 +1,20 @@
+from typing import Iterable, Sequence
+
+
+def bulk_load(bboxes: Iterable[Sequence]):
+    """
+    Builds an R-tree through the bulk loading (stream) constructor of rtree, which is much
+    faster than inserting the entries one by one.
+
+    :param bboxes: bounding boxes in [minX, minY, maxX, maxY] order, each one indexed by its position
+    :return: rtree.index.Index
+    """
+    from rtree import index
+
+    entries = [(i, tuple(bbox), None) for i, bbox in enumerate(bboxes)]
+
+    # the stream constructor does not accept empty streams
+    if not entries:
+        return index.Index()
+
+    return index.Index(iter(entries))